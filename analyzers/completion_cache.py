@@ -0,0 +1,114 @@
+# analyzers/completion_cache.py
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+
+class CompletionCache:
+    """LLM tamamlamaları için kalıcı, içerik adresli önbellek.
+
+    Anahtar; model, sistem istemi ve kullanıcı içeriğinin SHA-256 özetidir.
+    Kayıtlar `ttl` saniye sonra geçersiz olur; kayıt sayısı veya toplam boyut
+    sınırı aşıldığında en uzun süredir kullanılmayanlar silinir.
+    """
+
+    def __init__(self, path: str = '.cache/llm/completions.sqlite', ttl: float = 7 * 24 * 3600,
+                 max_entries: int = 5000, max_bytes: int = 50 * 1024 * 1024):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS completions (
+                    key TEXT PRIMARY KEY,
+                    model TEXT NOT NULL,
+                    response TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )""")
+            self._conn.execute(
+                'CREATE INDEX IF NOT EXISTS idx_completions_accessed ON completions(accessed_at)'
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(model: str, system_prompt: str, user_content: str) -> str:
+        digest = hashlib.sha256()
+        for part in (model, system_prompt, user_content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """Geçerli kayıt varsa yanıt metnini döndür"""
+        with self._lock:
+            db = self._db()
+            row = db.execute('SELECT response, created_at FROM completions WHERE key = ?', (key,)).fetchone()
+            if row is None:
+                return None
+
+            response, created_at = row
+            now = time.time()
+            if now - created_at >= self.ttl:
+                db.execute('DELETE FROM completions WHERE key = ?', (key,))
+                db.commit()
+                return None
+
+            db.execute('UPDATE completions SET accessed_at = ? WHERE key = ?', (now, key))
+            db.commit()
+            return response
+
+    def put(self, key: str, model: str, response: str):
+        with self._lock:
+            db = self._db()
+            now = time.time()
+            db.execute(
+                'INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?, ?)',
+                (key, model, response, len(response.encode('utf-8')), now, now)
+            )
+            self._evict(db)
+            db.commit()
+
+    def _evict(self, db: sqlite3.Connection):
+        # Süresi dolanlar, ardından LRU sırasıyla sınır aşımları
+        db.execute('DELETE FROM completions WHERE created_at <= ?', (time.time() - self.ttl,))
+
+        count, total = db.execute('SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions').fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+
+        for key, size in db.execute('SELECT key, size FROM completions ORDER BY accessed_at').fetchall():
+            db.execute('DELETE FROM completions WHERE key = ?', (key,))
+            count -= 1
+            total -= size
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+        logger.debug(f"LLM önbelleği küçültüldü: {count} kayıt, {total} bayt")
+
+    def clear(self):
+        with self._lock:
+            db = self._db()
+            db.execute('DELETE FROM completions')
+            db.commit()
+
+
+completion_cache = CompletionCache(
+    path=os.getenv('OSINT_LLM_CACHE', '.cache/llm/completions.sqlite')
+)
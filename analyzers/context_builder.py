@@ -0,0 +1,158 @@
+# analyzers/context_builder.py
+import math
+import re
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+_TOKEN_RE = re.compile(r'\w+')
+_TURKISH_ASCII = str.maketrans("çğıöşüÇĞİÖŞÜâîûÂÎÛ", "cgiosuCGIOSUaiuAIU")
+
+# Bölüm başlıkları ve sırası
+SECTIONS = [
+    ('search', 'ARAMA BULGULARI:'),
+    ('social', 'SOSYAL MEDYA AKTİVİTESİ:'),
+    ('news', 'HABER ANALİZİ:')
+]
+
+
+def normalize_tokens(text: str) -> List[str]:
+    """Türkçe karakterleri sadeleştirip küçük harfli kelime listesi üret"""
+    return _TOKEN_RE.findall(text.translate(_TURKISH_ASCII).lower())
+
+
+def estimate_tokens(text: str) -> int:
+    """Yaklaşık token sayısı (Türkçe metinde ~3 karakter/token)"""
+    return len(text) // 3 + 1
+
+
+class ContextBuilder:
+    """Toplanan parçaları hedefe göre BM25 ile sıralayıp token bütçesine sığdırır.
+
+    Birbirinin tekrarı olan parçalar (kelime 3-gram Jaccard benzerliği
+    `overlap_threshold` üzerinde) elenir, kalanlar skor sırasıyla bütçe dolana
+    kadar eklenir ve bölüm bölüm biçimlendirilir.
+    """
+
+    def __init__(self, token_budget: int = 1500, overlap_threshold: float = 0.5,
+                 k1: float = 1.5, b: float = 0.75,
+                 token_counter: Callable[[str], int] = estimate_tokens):
+        self.token_budget = token_budget
+        self.overlap_threshold = overlap_threshold
+        self.k1 = k1
+        self.b = b
+        self.token_counter = token_counter
+
+    def build(self, search_data: Dict, social_data: Dict, news_data: Dict,
+              target: Optional[str] = None) -> str:
+        snippets = self._collect_snippets(search_data, social_data, news_data)
+        if not snippets:
+            return ""
+
+        documents = [normalize_tokens(snippet['text']) for snippet in snippets]
+        query = normalize_tokens(target) if target else self._pseudo_query(documents)
+        scores = self._bm25(query, documents)
+
+        ranked = sorted(range(len(snippets)), key=lambda i: scores[i], reverse=True)
+        selected = self._select(ranked, snippets, documents)
+        return self._format(selected, snippets)
+
+    def _collect_snippets(self, search_data: Dict, social_data: Dict, news_data: Dict) -> List[Dict]:
+        snippets = []
+        for article in search_data.get('articles', []):
+            if article.get('content'):
+                snippets.append({'section': 'search', 'group': None, 'text': article['content']})
+
+        for platform, posts in social_data.get('platform_data', {}).items():
+            for post in posts or []:
+                if post.get('description'):
+                    snippets.append({'section': 'social', 'group': platform, 'text': post['description']})
+
+        for article in news_data.get('articles', []):
+            if article.get('content'):
+                snippets.append({'section': 'news', 'group': None, 'text': article['content']})
+
+        for position, snippet in enumerate(snippets):
+            snippet['position'] = position
+        return snippets
+
+    def _pseudo_query(self, documents: List[List[str]], size: int = 5) -> List[str]:
+        # Hedef verilmezse en çok parçada geçen terimler konu olarak kabul edilir
+        document_frequency = Counter(term for doc in documents for term in set(doc) if len(term) > 3)
+        return [term for term, _ in document_frequency.most_common(size)]
+
+    def _bm25(self, query: List[str], documents: List[List[str]]) -> List[float]:
+        count = len(documents)
+        average_length = sum(len(doc) for doc in documents) / count or 1
+        document_frequency = Counter(term for doc in documents for term in set(doc))
+        query_terms = set(query)
+
+        scores = []
+        for doc in documents:
+            frequencies = Counter(doc)
+            length_norm = self.k1 * (1 - self.b + self.b * len(doc) / average_length)
+            score = 0.0
+            for term in query_terms:
+                tf = frequencies.get(term, 0)
+                if not tf:
+                    continue
+                df = document_frequency[term]
+                idf = math.log(1 + (count - df + 0.5) / (df + 0.5))
+                score += idf * tf * (self.k1 + 1) / (tf + length_norm)
+            # Eşit skorlarda daha bilgilendirici (farklı terimi çok) parçayı öne al
+            scores.append(score + 0.01 * math.log1p(len(frequencies)))
+        return scores
+
+    def _select(self, ranked: List[int], snippets: List[Dict], documents: List[List[str]]) -> List[int]:
+        header_cost = sum(self.token_counter(header) for _, header in SECTIONS)
+        remaining = self.token_budget - header_cost
+        selected = []
+        selected_shingles = []
+
+        for index in ranked:
+            shingles = self._shingles(documents[index])
+            if any(self._jaccard(shingles, other) >= self.overlap_threshold for other in selected_shingles):
+                continue
+
+            cost = self.token_counter(snippets[index]['text']) + 1
+            if cost > remaining:
+                continue
+
+            selected.append(index)
+            selected_shingles.append(shingles)
+            remaining -= cost
+
+        return selected
+
+    @staticmethod
+    def _shingles(tokens: List[str], size: int = 3) -> set:
+        if len(tokens) < size:
+            return {tuple(tokens)}
+        return {tuple(tokens[i:i + size]) for i in range(len(tokens) - size + 1)}
+
+    @staticmethod
+    def _jaccard(a: set, b: set) -> float:
+        if not a or not b:
+            return 0.0
+        return len(a & b) / len(a | b)
+
+    def _format(self, selected: List[int], snippets: List[Dict]) -> str:
+        content_parts = []
+        chosen = [snippets[i] for i in selected]
+
+        for section, header in SECTIONS:
+            items = [snippet for snippet in chosen if snippet['section'] == section]
+            if not items:
+                continue
+
+            content_parts.append(("\n" if content_parts else "") + header)
+            if section == 'social':
+                groups = {}
+                for snippet in items:
+                    groups.setdefault(snippet['group'], []).append(snippet)
+                for platform, posts in groups.items():
+                    content_parts.append(f"\n{platform.upper()}")
+                    content_parts.extend(f"• {post['text']}" for post in posts)
+            else:
+                content_parts.extend(f"• {snippet['text']}" for snippet in items)
+
+        return "\n".join(content_parts)
@@ -0,0 +1,177 @@
+# analyzers/dedup.py
+import hashlib
+import logging
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+import numpy as np
+
+from .context_builder import normalize_tokens
+
+logger = logging.getLogger(__name__)
+
+# MinHash permütasyonları için Mersenne asalı (2^31 - 1); a*x çarpımı uint64'e sığar
+_PRIME = (1 << 31) - 1
+
+
+def shingles(text: str, size: int = 5) -> FrozenSet[str]:
+    """Normalize metnin karakter shingle kümesi.
+
+    normalize_tokens noktalama ve tırnakları (düz/kıvrık fark etmeksizin)
+    atar, Türkçe karakterleri sadeleştirir; kelimeler boşluksuz birleştirildiği
+    için "kidnap- ped" ile "kidnapped" aynı shingle'ları üretir. Kısa
+    metinlerde kelime shingle'larına göre tek kelimelik değişikliklere çok
+    daha dayanıklıdır.
+    """
+    joined = ''.join(normalize_tokens(text))
+    if len(joined) <= size:
+        return frozenset([joined])
+    return frozenset(joined[i:i + size] for i in range(len(joined) - size + 1))
+
+
+def jaccard(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class NearDuplicateIndex:
+    """Karakter shingle kümeleri için MinHash + LSH indeksi.
+
+    Her küme `num_perm` MinHash değerine indirgenir ve `bands` banda bölünür;
+    aynı bandı paylaşan adaylar gerçek Jaccard benzerliğiyle doğrulanır.
+    Varsayılan 32 bant x 2 satırda Jaccard 0,45 olan bir çiftin aday olmama
+    olasılığı ~1e-4'tür.
+    """
+
+    def __init__(self, threshold: float = 0.45, num_perm: int = 64, bands: int = 32, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm, bands'e tam bölünmeli")
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+        self._buckets: Dict[Tuple[int, bytes], List[int]] = {}
+        self._sets: List[FrozenSet[str]] = []
+
+    def signature(self, shingle_set: FrozenSet[str]) -> np.ndarray:
+        values = np.fromiter(
+            (int.from_bytes(hashlib.blake2b(s.encode('utf-8'), digest_size=4).digest(), 'big') % _PRIME
+             for s in shingle_set),
+            dtype=np.uint64, count=len(shingle_set)
+        )
+        return ((np.outer(values, self._a) + self._b) % _PRIME).min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows].tobytes()
+
+    def find(self, shingle_set: FrozenSet[str], signature: Optional[np.ndarray] = None) -> Optional[int]:
+        """Eşik üstü benzer küme varsa ilk eklenenin sırasını döndür"""
+        if signature is None:
+            signature = self.signature(shingle_set)
+        candidates = set()
+        for key in self._band_keys(signature):
+            candidates.update(self._buckets.get(key, ()))
+        for index in sorted(candidates):
+            if jaccard(self._sets[index], shingle_set) >= self.threshold:
+                return index
+        return None
+
+    def add(self, shingle_set: FrozenSet[str], signature: Optional[np.ndarray] = None) -> int:
+        if signature is None:
+            signature = self.signature(shingle_set)
+        index = len(self._sets)
+        self._sets.append(shingle_set)
+        for key in self._band_keys(signature):
+            self._buckets.setdefault(key, []).append(index)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._sets)
+
+
+class Deduplicator:
+    """Kopya gruplarının temsilcilerini tutan tekilleştirici.
+
+    Birden fazla deduplicate_results çağrısı arasında paylaşılabilir; böylece
+    ayrı ayrı gelen collector sonuçları (ör. arayüzde) birbirine göre de
+    tekilleştirilir. `min_tokens` kelimeden kısa metinler yalnızca birebir
+    (normalize edilmiş) eşleşmeyle birleştirilir.
+    """
+
+    def __init__(self, threshold: float = 0.45, min_tokens: int = 8):
+        self.min_tokens = min_tokens
+        self.index = NearDuplicateIndex(threshold=threshold)
+        self._exact: Dict[str, Dict] = {}
+        self._representatives: List[Dict] = []
+
+    def keep(self, item: Dict, text_field: str) -> bool:
+        """Öğe yeni bir grubun temsilcisiyse True; kopyaysa URL'sini temsilciye ekle ve False"""
+        text = item.get(text_field)
+        if not text:
+            return True
+
+        tokens = normalize_tokens(text)
+        key = ' '.join(tokens)
+        original = self._exact.get(key)
+        shingle_set = signature = None
+        if original is None and len(tokens) >= self.min_tokens:
+            shingle_set = shingles(text)
+            signature = self.index.signature(shingle_set)
+            found = self.index.find(shingle_set, signature)
+            if found is not None:
+                original = self._representatives[found]
+
+        if original is not None:
+            if item.get('url') and item['url'] not in original['sources']:
+                original['sources'].append(item['url'])
+            return False
+
+        item['sources'] = [item['url']] if item.get('url') else []
+        self._exact[key] = item
+        if shingle_set is not None:
+            self.index.add(shingle_set, signature)
+            self._representatives.append(item)
+        return True
+
+
+def deduplicate_results(results: Dict, threshold: float = 0.45, min_tokens: int = 8,
+                        deduplicator: Optional[Deduplicator] = None) -> Dict:
+    """Arama, haber ve sosyal medya sonuçlarındaki yakın kopya metinleri birleştir.
+
+    Her kopya grubundan ilk görülen kayıt kalır ve grubun tüm URL'leri
+    'sources' alanında listelenir; diğerleri sonuçlardan çıkarılır. Karakter
+    shingle Jaccard benzerliği `threshold` ve üzerindeki metinler kopya sayılır.
+    deduplicator verilirse önceki çağrılarda görülen kayıtlar da dikkate alınır.
+    Girdi değiştirilmez.
+    """
+    deduplicator = deduplicator or Deduplicator(threshold=threshold, min_tokens=min_tokens)
+    removed = 0
+
+    def keep(item: Dict, text_field: str) -> bool:
+        nonlocal removed
+        kept = deduplicator.keep(item, text_field)
+        removed += not kept
+        return kept
+
+    deduped = dict(results)
+    for section in ('search', 'news'):
+        if 'articles' in (results.get(section) or {}):
+            deduped[section] = dict(results[section])
+            deduped[section]['articles'] = [
+                article for article in (dict(a) for a in results[section]['articles'])
+                if keep(article, 'content')
+            ]
+
+    if 'platform_data' in (results.get('social') or {}):
+        deduped['social'] = dict(results['social'])
+        deduped['social']['platform_data'] = {
+            platform: [post for post in (dict(p) for p in posts or []) if keep(post, 'description')]
+            for platform, posts in results['social']['platform_data'].items()
+        }
+
+    if removed:
+        logger.info(f"{removed} yakın kopya metin birleştirildi")
+    return deduped
@@ -0,0 +1,152 @@
+# analyzers/domain_index.py
+import json
+import logging
+import os
+from typing import Dict, Iterable, Optional, Set
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+# Dahili küçük public suffix kümesi; tam liste load_public_suffixes ile yüklenebilir
+# (https://publicsuffix.org/list/public_suffix_list.dat biçimi)
+BUILTIN_SUFFIXES = {
+    'com', 'net', 'org', 'info', 'biz', 'io', 'co', 'me', 'tv', 'news', 'edu', 'gov', 'mil', 'int',
+    'tr', 'com.tr', 'net.tr', 'org.tr', 'gov.tr', 'edu.tr', 'bel.tr', 'pol.tr', 'tsk.tr', 'k12.tr',
+    'av.tr', 'gen.tr', 'web.tr', 'tv.tr', 'info.tr', 'biz.tr', 'name.tr', 'bbs.tr', 'tel.tr',
+    'uk', 'co.uk', 'org.uk', 'gov.uk', 'ac.uk', 'de', 'fr', 'nl', 'ru', 'eu', 'it', 'es', 'ch',
+    'us', 'ca', 'au', 'com.au', 'jp', 'co.jp', 'cn', 'com.cn', 'in', 'co.in', 'br', 'com.br',
+    'az', 'com.az', 'ir', 'iq', 'sy', 'qa', 'ae', 'sa', 'com.sa', 'gr', 'com.gr', 'cy', 'com.cy'
+}
+
+# Dahili katalog; büyük kataloglar load_catalog ile eklenir
+BUILTIN_CATALOG = {
+    'news': [
+        'reuters.com', 'bbc.com', 'bbc.co.uk', 'cnn.com', 'dw.com', 'aa.com.tr', 'hurriyet.com.tr',
+        'milliyet.com.tr', 'sozcu.com.tr', 'sabah.com.tr', 'haberturk.com', 'ntv.com.tr',
+        'cnnturk.com', 'trthaber.com', 'bianet.org', 'aljazeera.com', 'apnews.com', 'theguardian.com',
+        'nytimes.com', 'washingtonpost.com', 'france24.com', 'euronews.com'
+    ],
+    'social': [
+        'twitter.com', 'x.com', 'instagram.com', 'linkedin.com', 'facebook.com', 'youtube.com',
+        'tiktok.com', 'reddit.com', 't.me', 'telegram.org', 'threads.net'
+    ],
+    'government': ['gov', 'gov.tr', 'gov.uk', 'mil', 'tsk.tr', 'pol.tr', 'tbmm.gov.tr'],
+    'reference': ['wikipedia.org', 'britannica.com']
+}
+
+
+def host_of(url_or_host: str) -> str:
+    """URL'den (şemasız olsa da) küçük harfli host adını çıkar"""
+    value = url_or_host.strip()
+    if '://' not in value:
+        value = '//' + value.lstrip('/')
+    return (urlsplit(value).hostname or '').rstrip('.').lower()
+
+
+class DomainIndex:
+    """Public suffix kurallarıyla kayıt edilebilir alan adına göre sınıflandırma.
+
+    Kayıtlı alan adı (ör. spor.milliyet.com.tr -> milliyet.com.tr) host'un
+    etiket sayısı kadar hash aramasıyla bulunur; katalog büyüklüğünden bağımsız
+    olarak URL başına O(1) sürer. Katalogda alt alan adları (ör. news.google.com)
+    ve public suffix'ler (ör. gov.tr) de sınıflandırılabilir; en özel eşleşme kazanır.
+    """
+
+    def __init__(self, suffixes: Optional[Iterable[str]] = None,
+                 catalog: Optional[Dict[str, Iterable[str]]] = None):
+        self.suffixes: Set[str] = set(BUILTIN_SUFFIXES if suffixes is None else suffixes)
+        self.wildcards: Set[str] = set()
+        self.exceptions: Set[str] = set()
+        self.categories: Dict[str, str] = {}
+        for category, domains in (BUILTIN_CATALOG if catalog is None else catalog).items():
+            for domain in domains:
+                self.add(domain, category)
+
+    def add(self, domain: str, category: str):
+        self.categories[host_of(domain)] = category
+
+    def load_public_suffixes(self, path: str):
+        """publicsuffix.org biçimindeki listeyi (joker ve istisna kurallarıyla) yükle"""
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                rule = line.split()[0].lower() if line.strip() else ''
+                if not rule or rule.startswith('//'):
+                    continue
+                if rule.startswith('!'):
+                    self.exceptions.add(rule[1:])
+                elif rule.startswith('*.'):
+                    self.wildcards.add(rule[2:])
+                else:
+                    self.suffixes.add(rule)
+        logger.info(f"{len(self.suffixes)} public suffix kuralı yüklendi")
+
+    def load_catalog(self, path: str):
+        """Alan adı kataloğunu yükle.
+
+        JSON ise {kategori: [alan adları]}, değilse her satırda 'alan_adı,kategori'
+        (veya boşlukla ayrılmış) beklenir; '#' ile başlayan satırlar yorumdur.
+        """
+        before = len(self.categories)
+        with open(path, encoding='utf-8') as f:
+            if path.endswith('.json'):
+                for category, domains in json.load(f).items():
+                    for domain in domains:
+                        self.add(domain, category)
+            else:
+                for line in f:
+                    line = line.strip()
+                    if not line or line.startswith('#'):
+                        continue
+                    domain, _, category = line.replace(',', ' ').partition(' ')
+                    if category.strip():
+                        self.add(domain, category.strip())
+        logger.info(f"Alan adı kataloğuna {len(self.categories) - before} kayıt eklendi")
+
+    def public_suffix(self, host: str) -> str:
+        """Host'un en uzun eşleşen public suffix'i (kural yoksa son etiket)"""
+        labels = host.split('.')
+        for i in range(len(labels)):
+            candidate = '.'.join(labels[i:])
+            if candidate in self.exceptions:
+                return '.'.join(labels[i + 1:])
+            if candidate in self.suffixes:
+                return candidate
+            if i + 1 < len(labels) and '.'.join(labels[i + 1:]) in self.wildcards:
+                return candidate
+        return labels[-1]
+
+    def registrable_domain(self, url_or_host: str) -> str:
+        """Kayıt edilebilir alan adı (public suffix + bir etiket); IP ve tek etiketli host'lar aynen döner"""
+        host = host_of(url_or_host)
+        if not host or host.replace('.', '').isdigit() or ':' in host:
+            return host
+        suffix = self.public_suffix(host)
+        if host == suffix:
+            return host
+        label = host[:-len(suffix) - 1].rsplit('.', 1)[-1]
+        return f"{label}.{suffix}"
+
+    def classify(self, url_or_host: str) -> Optional[str]:
+        """URL'nin kategorisi: önce tam host ve üst alan adları, sonra public suffix"""
+        host = host_of(url_or_host)
+        if not host:
+            return None
+        registrable = self.registrable_domain(host)
+
+        domain = host
+        while True:
+            category = self.categories.get(domain)
+            if category:
+                return category
+            if domain == registrable or '.' not in domain:
+                break
+            domain = domain.split('.', 1)[1]
+
+        return self.categories.get(self.public_suffix(host))
+
+
+domain_index = DomainIndex()
+if os.getenv('OSINT_PSL_FILE'):
+    domain_index.load_public_suffixes(os.environ['OSINT_PSL_FILE'])
+if os.getenv('OSINT_DOMAIN_CATALOG'):
+    domain_index.load_catalog(os.environ['OSINT_DOMAIN_CATALOG'])
@@ -0,0 +1,87 @@
+# analyzers/entity_extractor.py
+import re
+from bisect import bisect_right
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence
+
+_UPPER = 'A-ZÇĞİÖŞÜ'
+_LOWER = 'a-zıiğüşöçâîû'
+
+# Her varlık türü tek bir desen; tümü aynı taramada birleşik olarak çalışır.
+# Grup/organizasyon desenleri en fazla 5 kelimeyle sınırlıdır: eski
+# `[\w\s]+(Party|...)` deseni uzun metinlerde karesel geri izleme yapıyordu.
+# Baştaki (?<!\w) kelime ortasından başlamayı engeller ("iPhone Group" -> "Phone Group").
+ENTITY_PATTERNS = {
+    'handle': r'@\w{1,64}',
+    'social_group': rf"(?<!\w)(?:[{_UPPER}0-9][\w'’&.-]*\s+){{1,5}}(?:Group|Page|Community)\b",
+    'organization': rf"(?<!\w)(?:[{_UPPER}0-9][\w'’&.-]*\s+){{1,5}}(?:Party|Group|Organization|Movement)\b",
+    'person': rf'[{_UPPER}][{_LOWER}]+(?:\s+[{_UPPER}][{_LOWER}]+){{1,2}}'
+}
+
+# Birleşik desende aynı konumda ilk eşleşen alternatif kazanır
+PATTERN_ORDER = ['handle', 'social_group', 'organization', 'person']
+
+# Taranan metinler arasına konan ayraç; hiçbir desen bu karakteri aşamaz
+_SEPARATOR = '\x00'
+
+
+class EntityExtractor:
+    """Önceden derlenmiş desenlerle tek geçişte varlık çıkarımı.
+
+    İstenen türler tek bir birleşik düzenli ifadede (isimli gruplar) toplanır
+    ve her tür kümesi için bir kez derlenir. extract_many tüm metinleri
+    ayraçla birleştirip tek finditer taramasıyla işler.
+    """
+
+    def __init__(self, patterns: Optional[Dict[str, str]] = None):
+        self.patterns = dict(patterns or ENTITY_PATTERNS)
+        self._compiled: Dict[tuple, Pattern] = {}
+
+    def _pattern_for(self, kinds: Optional[Sequence[str]]) -> Pattern:
+        order = [kind for kind in PATTERN_ORDER if kind in self.patterns]
+        order += [kind for kind in self.patterns if kind not in PATTERN_ORDER]
+        key = tuple(order if kinds is None else (kind for kind in order if kind in kinds))
+        pattern = self._compiled.get(key)
+        if pattern is None:
+            unknown = [kind for kind in (kinds or ()) if kind not in self.patterns]
+            if unknown:
+                raise ValueError(f"Bilinmeyen varlık türü: {', '.join(unknown)}")
+            pattern = self._compiled[key] = re.compile(
+                '|'.join(f'(?P<{kind}>{self.patterns[kind]})' for kind in key)
+            )
+        return pattern
+
+    def extract(self, text: str, kinds: Optional[Sequence[str]] = None) -> Dict[str, List[str]]:
+        """Tek metindeki varlıkları türlerine göre (tekrarsız, sırasıyla) döndür"""
+        return self.extract_many([text], kinds)[0]
+
+    def extract_many(self, texts: Iterable[str], kinds: Optional[Sequence[str]] = None) -> List[Dict[str, List[str]]]:
+        """Metin listesini tek taramada işle; her metin için ayrı sonuç döndür"""
+        texts = [(text or '').replace(_SEPARATOR, ' ') for text in texts]
+        pattern = self._pattern_for(kinds)
+        kind_names = list(pattern.groupindex)
+
+        starts = []
+        offset = 0
+        for text in texts:
+            starts.append(offset)
+            offset += len(text) + 1
+
+        results = [{kind: [] for kind in kind_names} for _ in texts]
+        seen = [set() for _ in texts]
+        for match in pattern.finditer(_SEPARATOR.join(texts)):
+            index = bisect_right(starts, match.start()) - 1
+            kind = match.lastgroup
+            value = self._normalize(kind, match.group(kind))
+            if value and (kind, value) not in seen[index]:
+                seen[index].add((kind, value))
+                results[index][kind].append(value)
+        return results
+
+    @staticmethod
+    def _normalize(kind: str, value: str) -> str:
+        if kind == 'handle':
+            return value
+        return ' '.join(value.split())
+
+
+entity_extractor = EntityExtractor()
@@ -1,24 +1,18 @@
 import os
 import json
-from openai import AsyncOpenAI
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, Callable, Optional
 from datetime import datetime
 
-class LLMAnalyzer:
-    def __init__(self, api_key: str = None):
-        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
-        if not self.api_key:
-            raise ValueError("OpenAI API anahtarı gerekli!")
-        self.client = AsyncOpenAI(api_key=self.api_key)
+from .completion_cache import CompletionCache, completion_cache
+from .context_builder import ContextBuilder
+from .llm_scheduler import LLMScheduler, llm_scheduler
+from .run_diff import TEXT_FIELDS
 
-    async def analyze(self, search_data: Dict, social_data: Dict, news_data: Dict) -> Dict[str, Any]:
-        content = self._prepare_content(search_data, social_data, news_data)
-        
-        system_prompt = """Veri analiz uzmanı rolünde, aşağıdaki verilen bilgileri analiz edip, net ve özlü bir rapor hazırlayın. 
+SYSTEM_PROMPT = """Veri analiz uzmanı rolünde, aşağıdaki verilen bilgileri analiz edip, net ve özlü bir rapor hazırlayın. 
 Analiz sonucunda, öznenin eylem ve söylemlerine dayanarak, Türkiye için tehdit analizi yapın ve sadece tek bir cümleyle 
 TEHLİKELİ veya FAYDALI olarak değerlendirin."""
 
-        user_prompt = """Lütfen şu veriler ışığında öznenin:
+USER_PROMPT = """Lütfen şu veriler ışığında öznenin:
 1. Kimliği ve pozisyonu
 2. Önemli faaliyetleri ve eylemleri
 3. İlişki ağı ve bağlantıları
@@ -26,48 +20,195 @@ TEHLİKELİ veya FAYDALI olarak değerlendirin."""
 
 hakkında kısa bir analiz yapın. Tekrara düşmeden, veriye dayalı net bir profil çıkarın."""
 
+CHANGES_PROMPT = """Yukarıda öznenin önceki analizi, sonraki güncellemeler ve son çalıştırmadan bu yana verilerde olan değişiklikler var.
+Lütfen sadece değişenler için:
+1. Yeni bilgilerin önceki profile kattıkları
+2. İlişki ağında yeni ortaya çıkan ve kaybolan bağlantılar
+3. Önceki değerlendirmenin (TEHLİKELİ/FAYDALI) değişmesi gerekip gerekmediği
+
+hakkında kısa bir güncelleme yazın. Değişmeyen konuları tekrar etmeyin."""
+
+# Değişiklik isteminde listelenecek en fazla kaldırılan kaynak / varlık sayısı
+MAX_CHANGE_ITEMS = 20
+
+# Değişiklik istemine eklenen önceki analiz metninin üst sınırı (karakter)
+MAX_PREVIOUS_CHARS = 2000
+
+# Değişiklik istemine eklenen önceki güncellemelerin toplam üst sınırı (karakter);
+# sığmayan en eski güncellemeler atlanır
+MAX_UPDATES_CHARS = 2000
+
+# Kaldırılan kaynak satırlarında gösterilen metin özetinin üst sınırı (karakter)
+MAX_REMOVED_CHARS = 150
+
+
+class LLMAnalyzer:
+    def __init__(self, api_key: str = None, model: str = "gpt-4",
+                 cache: Optional[CompletionCache] = None, use_cache: bool = True,
+                 token_budget: int = 1500, scheduler: Optional[LLMScheduler] = None):
+        self.api_key = api_key or os.getenv('OPENAI_API_KEY')
+        if not self.api_key:
+            raise ValueError("OpenAI API anahtarı gerekli!")
+        self.scheduler = scheduler or llm_scheduler
+        self.model = model
+        self.cache = cache or completion_cache
+        self.use_cache = use_cache
+        self.context_builder = ContextBuilder(token_budget=token_budget)
+
+    async def analyze(self, search_data: Dict, social_data: Dict, news_data: Dict,
+                      target: Optional[str] = None, use_cache: Optional[bool] = None,
+                      on_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Verileri LLM ile analiz et; use_cache=False önbelleği atlar (yanıt yine kaydedilir).
+
+        on_chunk verilirse yanıt parçaları geldikçe bu fonksiyona iletilir.
+        """
+        result = {}
+        async for chunk in self.analyze_stream(search_data, social_data, news_data,
+                                               target=target, use_cache=use_cache, result=result):
+            if on_chunk:
+                on_chunk(chunk)
+        return result
+
+    async def analyze_stream(self, search_data: Dict, social_data: Dict, news_data: Dict,
+                             target: Optional[str] = None, use_cache: Optional[bool] = None,
+                             result: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Analiz metnini geldikçe parça parça üret.
+
+        result sözlüğü verilirse akış bittiğinde analyze() ile aynı alanlarla
+        doldurulur. Önbellekten gelen yanıt tek parça olarak üretilir; hata
+        durumunda o ana kadar gelen metin 'partial' alanında saklanır.
+        """
+        content = self._prepare_content(search_data, social_data, news_data, target=target)
+        user_content = f"VERİLER:\n\n{content}\n\n{USER_PROMPT}"
+        async for chunk in self._stream(user_content, use_cache=use_cache, result=result):
+            yield chunk
+
+    async def analyze_changes(self, diff: Dict, previous_analysis: Optional[Dict] = None,
+                              entity_changes: Optional[Dict] = None, target: Optional[str] = None,
+                              use_cache: Optional[bool] = None,
+                              on_chunk: Optional[Callable[[str], None]] = None) -> Dict[str, Any]:
+        """Önceki çalıştırmaya göre "ne değişti" analizi.
+
+        diff, run_diff.diff_results çıktısıdır; sadece eklenen/değişen öğeler
+        bağlam olarak gönderilir, kaldırılan kaynaklar ve ilişki ağı farkı
+        (run_diff.diff_entities) liste olarak eklenir. previous_analysis'in
+        'updates' listesindeki önceki değişiklik analizleri de (en yenileri)
+        bağlama katılır. Dönen sözlük analyze() ile aynı alanlara sahiptir.
+        """
+        added = diff.get('added', {})
+        content = self._prepare_content(added.get('search', {}), added.get('social', {}),
+                                        added.get('news', {}), target=target)
+        previous = (previous_analysis or {}).get('analiz', '')[:MAX_PREVIOUS_CHARS]
+        updates = self._recent_updates((previous_analysis or {}).get('updates') or [])
+
+        removed = []
+        for section in ('search', 'news'):
+            for article in diff.get('removed', {}).get(section, {}).get('articles', []):
+                removed.append(self._removed_line(article, TEXT_FIELDS[section]))
+        for posts in diff.get('removed', {}).get('social', {}).get('platform_data', {}).values():
+            for post in posts:
+                removed.append(self._removed_line(post, TEXT_FIELDS['social']))
+
+        entity_changes = entity_changes or {}
+        entities = [f"+ {node['label']} ({node['type']})" for node in entity_changes.get('added_nodes', [])]
+        entities += [f"- {node['label']} ({node['type']})" for node in entity_changes.get('removed_nodes', [])]
+
+        removed_text = '\n'.join(removed[:MAX_CHANGE_ITEMS]) or '(yok)'
+        entities_text = '\n'.join(entities[:MAX_CHANGE_ITEMS]) or '(yok)'
+        user_content = (
+            f"ÖNCEKİ ANALİZ:\n\n{previous or '(yok)'}\n\n"
+            f"SONRAKİ GÜNCELLEMELER:\n\n{updates or '(yok)'}\n\n"
+            f"YENİ VEYA DEĞİŞEN VERİLER:\n\n{content or '(yok)'}\n\n"
+            f"KALDIRILAN KAYNAKLAR:\n{removed_text}\n\n"
+            f"İLİŞKİ AĞI DEĞİŞİKLİKLERİ:\n{entities_text}\n\n"
+            f"{CHANGES_PROMPT}"
+        )
+
+        result = {}
+        async for chunk in self._stream(user_content, use_cache=use_cache, result=result):
+            if on_chunk:
+                on_chunk(chunk)
+        return result
+
+    @staticmethod
+    def _recent_updates(updates: list) -> str:
+        """Önceki güncellemelerden MAX_UPDATES_CHARS'a sığan en yenileri, eskiden yeniye"""
+        texts, total = [], 0
+        for update in reversed(updates):
+            text = (update or {}).get('analiz', '')
+            if not text:
+                continue
+            if total + len(text) > MAX_UPDATES_CHARS:
+                break
+            texts.append(text)
+            total += len(text)
+        return '\n\n'.join(f"- {text}" for text in reversed(texts))
+
+    @staticmethod
+    def _removed_line(item: Dict, text_field: str) -> str:
+        """Kaldırılan öğe için kısaltılmış metin ve URL satırı"""
+        text = ' '.join((item.get(text_field) or '').split())
+        if len(text) > MAX_REMOVED_CHARS:
+            text = text[:MAX_REMOVED_CHARS].rstrip() + '…'
+        return f"- {text or '(metin yok)'} ({item.get('url', '')})"
+
+    async def _stream(self, user_content: str, use_cache: Optional[bool] = None,
+                      result: Optional[Dict[str, Any]] = None) -> AsyncIterator[str]:
+        """Önbellek kontrolü, akışlı tamamlama ve result doldurma"""
+        if result is None:
+            result = {}
+
+        use_cache = self.use_cache if use_cache is None else use_cache
+        cache_key = self.cache.make_key(self.model, SYSTEM_PROMPT, user_content)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                result.update({
+                    'analiz': cached,
+                    'timestamp': datetime.now().isoformat(),
+                    'cached': True
+                })
+                yield cached
+                return
+
+        parts = []
         try:
-            response = await self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"VERİLER:\n\n{content}\n\n{user_prompt}"}
+            stream = self.scheduler.stream(
+                self.api_key,
+                self.model,
+                [
+                    {"role": "system", "content": SYSTEM_PROMPT},
+                    {"role": "user", "content": user_content}
                 ]
             )
-            
-            return {
-                'analiz': response.choices[0].message.content,
-                'timestamp': datetime.now().isoformat()
-            }
+
+            async for chunk in stream:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    parts.append(delta)
+                    yield delta
 
         except Exception as e:
-            return {
+            result.update({
                 'error': str(e),
                 'timestamp': datetime.now().isoformat()
-            }
-
-    def _prepare_content(self, search_data: Dict, social_data: Dict, news_data: Dict) -> str:
-        content_parts = []
-
-        # Arama sonuçlarından önemli içerikleri seç
-        if 'articles' in search_data:
-            content_parts.append("ARAMA BULGULARI:")
-            for article in search_data['articles'][:3]:  # Sadece en alakalı 3 sonuç
-                content_parts.append(f"• {article['content']}")
-
-        # Sosyal medyadan önemli paylaşımları topla
-        if 'platform_data' in social_data:
-            content_parts.append("\nSOSYAL MEDYA AKTİVİTESİ:")
-            for platform, posts in social_data['platform_data'].items():
-                if posts:
-                    content_parts.append(f"\n{platform.upper()}")
-                    for post in posts[:2]:  # Her platformdan 2 önemli paylaşım
-                        content_parts.append(f"• {post.get('description', '')}")
-
-        # Haber kaynaklarından kritik bilgileri al
-        if 'articles' in news_data:
-            content_parts.append("\nHABER ANALİZİ:")
-            for article in news_data['articles'][:3]:  # En güncel 3 haber
-                content_parts.append(f"• {article['content']}")
-
-        return "\n".join(content_parts)
\ No newline at end of file
+            })
+            if parts:
+                result['partial'] = ''.join(parts)
+            return
+
+        analysis = ''.join(parts)
+        if analysis:
+            self.cache.put(cache_key, self.model, analysis)
+
+        result.update({
+            'analiz': analysis,
+            'timestamp': datetime.now().isoformat()
+        })
+
+    def _prepare_content(self, search_data: Dict, social_data: Dict, news_data: Dict,
+                         target: Optional[str] = None) -> str:
+        """Hedefe en alakalı, tekrarsız parçaları token bütçesi içinde seç"""
+        return self.context_builder.build(search_data, social_data, news_data, target=target)
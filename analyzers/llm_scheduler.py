@@ -0,0 +1,190 @@
+# analyzers/llm_scheduler.py
+import asyncio
+import logging
+import os
+import random
+import time
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+import openai
+from openai import AsyncOpenAI
+
+from collectors.rate_limiter import TokenBucket
+from .context_builder import estimate_tokens
+
+logger = logging.getLogger(__name__)
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+
+
+class LLMScheduler:
+    """Tüm LLMAnalyzer'ların paylaştığı istek zamanlayıcısı.
+
+    API anahtarı başına tek AsyncOpenAI istemcisi kullanılır. İstekler dakikalık
+    istek (rpm) ve token (tpm) bütçelerine göre sıraya alınır, aynı anda en
+    fazla `max_concurrency` istek açık tutulur. 429/5xx ve bağlantı hataları
+    retry-after başlığına uyularak, jitter'lı üstel bekleme ile yeniden denenir;
+    429 alındığında bekleme süresince yeni istek gönderilmez.
+    """
+
+    def __init__(self, rpm: float = 500, tpm: float = 40000, max_concurrency: int = 8,
+                 max_retries: int = 5, base_delay: float = 1.0, max_delay: float = 60.0,
+                 completion_tokens: int = 800):
+        self.rpm = rpm
+        self.tpm = tpm
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.completion_tokens = completion_tokens
+        self._reset_budgets()
+        self._loop = None
+        self._clients: Dict[str, AsyncOpenAI] = {}
+        self._semaphore = None
+        self._paused_until = 0.0
+
+    def configure(self, **settings):
+        """Bütçe ve yeniden deneme ayarlarını güncelle"""
+        for name, value in settings.items():
+            if not hasattr(self, name) or name.startswith('_'):
+                raise ValueError(f"Bilinmeyen zamanlayıcı ayarı: {name}")
+            setattr(self, name, value)
+        self._reset_budgets()
+        self._semaphore = None
+
+    def _reset_budgets(self):
+        # Dakikalık kotanın onda biri kadar patlamaya izin verilir
+        self.request_bucket = TokenBucket(self.rpm / 60, max(1, self.rpm / 10))
+        self.token_bucket = TokenBucket(self.tpm / 60, max(1, self.tpm / 10))
+
+    def _bind_loop(self):
+        # İstemci ve semafor oluşturuldukları loop'a bağlıdır
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._clients = {}
+            self._semaphore = None
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+    def client_for(self, api_key: str) -> AsyncOpenAI:
+        self._bind_loop()
+        client = self._clients.get(api_key)
+        if client is None:
+            # Yeniden denemeler istemcide değil, zamanlayıcıda yapılır
+            client = self._clients[api_key] = AsyncOpenAI(api_key=api_key, max_retries=0)
+        return client
+
+    def estimate_request_tokens(self, messages: List[Dict[str, str]]) -> int:
+        prompt = sum(estimate_tokens(message['content']) for message in messages)
+        return prompt + self.completion_tokens
+
+    async def complete(self, api_key: str, model: str, messages: List[Dict[str, str]],
+                       **kwargs) -> Any:
+        """Tek parça tamamlama isteği gönder"""
+        client = self.client_for(api_key)
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._wait_for_budget(messages)
+                try:
+                    response = await client.chat.completions.create(model=model, messages=messages, **kwargs)
+                except Exception as e:
+                    await self._backoff(e, attempt)
+                    continue
+                self._settle_usage(messages, getattr(response, 'usage', None))
+                return response
+
+    async def stream(self, api_key: str, model: str, messages: List[Dict[str, str]],
+                     **kwargs) -> AsyncIterator[Any]:
+        """Akışlı tamamlama; ilk parça gelmeden oluşan hatalar yeniden denenir"""
+        client = self.client_for(api_key)
+        async with self._semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self._wait_for_budget(messages)
+                started = False
+                usage = None
+                try:
+                    stream = await client.chat.completions.create(
+                        model=model, messages=messages, stream=True,
+                        stream_options={'include_usage': True}, **kwargs
+                    )
+                    async for chunk in stream:
+                        started = True
+                        if getattr(chunk, 'usage', None):
+                            usage = chunk.usage
+                        yield chunk
+                except Exception as e:
+                    # Metin gönderilmeye başlandıysa tekrar denemek yanıtı çoğaltır
+                    if started:
+                        raise
+                    await self._backoff(e, attempt)
+                    continue
+                self._settle_usage(messages, usage)
+                return
+
+    async def _wait_for_budget(self, messages: List[Dict[str, str]]):
+        pause = self._paused_until - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        await self.request_bucket.acquire()
+        await self.token_bucket.acquire(self.estimate_request_tokens(messages))
+
+    def _settle_usage(self, messages: List[Dict[str, str]], usage):
+        # Tahmin ile gerçek kullanım arasındaki fark bütçeye yansıtılır
+        if usage is not None and getattr(usage, 'total_tokens', None):
+            self.token_bucket.reserve(usage.total_tokens - self.estimate_request_tokens(messages))
+
+    async def _backoff(self, error: Exception, attempt: int):
+        """Hata yeniden denenebilirse bekle, değilse yeniden fırlat"""
+        if not self._is_retryable(error) or attempt >= self.max_retries:
+            raise error
+
+        delay = min(self.max_delay, self.base_delay * 2 ** attempt) * random.uniform(0.5, 1.0)
+        retry_after = self._retry_after(error)
+        if retry_after is not None:
+            delay = min(self.max_delay, retry_after) + random.uniform(0, self.base_delay)
+
+        if getattr(error, 'status_code', None) == 429:
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+
+        logger.warning(f"LLM isteği başarısız ({error.__class__.__name__}), "
+                       f"{delay:.1f} sn sonra tekrar denenecek ({attempt + 1}/{self.max_retries})")
+        await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_retryable(error: Exception) -> bool:
+        if isinstance(error, (openai.APIConnectionError, openai.APITimeoutError)):
+            return True
+        if isinstance(error, openai.APIStatusError):
+            return error.status_code in RETRYABLE_STATUS
+        return False
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        response = getattr(error, 'response', None)
+        if response is None:
+            return None
+        headers = response.headers
+        try:
+            if headers.get('retry-after-ms'):
+                return float(headers['retry-after-ms']) / 1000
+            if headers.get('retry-after'):
+                return float(headers['retry-after'])
+        except ValueError:
+            return None
+        return None
+
+    async def close(self):
+        """Çalışan loop'a ait istemcileri kapat"""
+        if self._loop is not asyncio.get_running_loop():
+            return
+        for client in self._clients.values():
+            await client.close()
+        self._clients = {}
+
+
+llm_scheduler = LLMScheduler(
+    rpm=float(os.getenv('OSINT_LLM_RPM', 500)),
+    tpm=float(os.getenv('OSINT_LLM_TPM', 40000)),
+    max_concurrency=int(os.getenv('OSINT_LLM_CONCURRENCY', 8))
+)
@@ -1,16 +1,28 @@
 # analyzers/network_analyzer.py
 
 import networkx as nx
-from typing import Dict, Any
-import re
+from typing import Dict, Any, Iterable, Optional
 import logging
 
+from collectors.url_utils import canonicalize_url
+from .domain_index import DomainIndex, domain_index as default_domain_index
+from .entity_extractor import EntityExtractor, entity_extractor
+from .graph_analytics import analyze_graph
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 class NetworkAnalyzer:
-    def __init__(self):
+    def __init__(self, extractor: EntityExtractor = None, domain_index: DomainIndex = None,
+                 store=None):
         self.G = nx.Graph()
+        self.target = None
+        self.store = store
+        self.investigation_id = None
+        self._metrics = {'total_nodes': 0, 'total_edges': 0, 'node_types': {}}
+        self._delta = None
+        self.extractor = extractor or entity_extractor
+        self.domain_index = domain_index or default_domain_index
         
         # Node tipleri ve renkleri
         self.node_types = {
@@ -21,150 +33,300 @@ class NetworkAnalyzer:
             'account': {'color': '#95a5a6'},     # Gri - Sosyal medya hesapları
             'group': {'color': '#95a5a6'}        # Gri - Gruplar/Sayfalar
         }
-        
-        # Platform domain listesi
-        self.news_domains = [
-            'reuters.com', 'bbc.com', 'hurriyet.com.tr', 'milliyet.com.tr',
-            'sozcu.com.tr', 'cnn.com', 'dw.com', 'aa.com.tr'
-        ]
+
+    def reset(self, target: Optional[str] = None):
+        """Grafı ve metrikleri sıfırla; hedef verilirse hedef düğümünü ekle"""
+        self.G.clear()
+        self.target = None
+        self._metrics = {'total_nodes': 0, 'total_edges': 0, 'node_types': {}}
+        self._delta = None
+        self.investigation_id = None
+        if target is not None:
+            self.target = target
+            self._add_node(target, node_type='target', size=30)
+            if self.store is not None:
+                self.investigation_id = self.store.start_investigation(target)
+                self._persist([self._node_dict(target)], [])
 
     def analyze(self, target: str, search_data: Dict, social_data: Dict, news_data: Dict) -> Dict[str, Any]:
         """Ana analiz fonksiyonu"""
         try:
-            # Grafiği temizle
-            self.G.clear()
-            
-            # Hedef düğümü ekle
-            self.G.add_node(target, node_type='target', size=30)
+            # Grafiği temizle ve hedef düğümü ekle
+            self.reset(target)
             
-            # Sosyal medya verilerini analiz et
-            if 'platform_data' in social_data:
-                self._analyze_social_connections(target, social_data['platform_data'])
+            # Sosyal medya, haber ve arama verilerini analiz et
+            self._merge(target, 'social', social_data)
+            self._merge(target, 'news', news_data)
+            self._merge(target, 'search', search_data)
             
-            # Haber verilerini analiz et
-            if 'articles' in news_data:
-                self._analyze_news_connections(target, news_data['articles'])
-            
-            # Arama verilerini analiz et
-            if 'articles' in search_data:
-                self._analyze_search_connections(target, search_data['articles'])
+            network_data = self.snapshot()
+            self._persist(network_data['nodes'], network_data['edges'])
+            return network_data
             
+        except Exception as e:
+            logger.error(f"Analiz hatası: {str(e)}")
+            return {'error': str(e)}
+
+    def add_results(self, target: str, source: str, data: Dict) -> Dict[str, Any]:
+        """Tek bir collector'ın sonuçlarını mevcut grafa ekle ve sadece farkı döndür.
+
+        Dönen sözlükte yeni (veya tipi değişen) düğümler, yeni kenarlar, mevcut
+        kenarlara eklenen kanıtlar ('evidence', kenar başına yeni URL) ve değişen
+        metrikler bulunur. Hedef değişmişse graf yeniden başlatılır.
+        """
+        try:
+            if self.target != target:
+                self.reset(target)
+
+            self._delta = {'nodes': {}, 'edges': [], 'evidence': []}
+            before = self._calculate_metrics()
+            self._merge(target, source, data)
+
+            delta = self._delta
+            self._delta = None
+            after = self._calculate_metrics()
+            nodes = [self._node_dict(node) for node in delta['nodes']]
+            self._persist(nodes, delta['edges'] + delta['evidence'])
             return {
-                'nodes': self._get_nodes(),
-                'edges': self._get_edges(),
-                'metrics': self._calculate_metrics()
+                'nodes': nodes,
+                'edges': delta['edges'],
+                'evidence': delta['evidence'],
+                'metrics': {key: value for key, value in after.items() if before.get(key) != value}
             }
-            
+
         except Exception as e:
-            logger.error(f"Analiz hatası: {str(e)}")
+            self._delta = None
+            logger.error(f"Analiz hatası ({source}): {str(e)}")
+            return {'error': str(e)}
+
+    def load_snapshot(self, target: str, network_data: Dict,
+                      exclude_evidence: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """Önceki bir analizin network_data'sından grafı yeniden kur.
+
+        Kenarların kanıt URL'lerinden exclude_evidence'takiler (kanonik URL
+        karşılaştırmasıyla) çıkarılır; kanıtı kalmayan kenarlar alınmaz. Kanıtı
+        hiç olmayan kenarlar korunur. Ardından hedefe bağlı kalmayan düğümler
+        (ör. tüm gönderileri silinen platformlar ve hesapları) atılır; böylece
+        sonuç, kalan kaynaklarla yapılan tam bir analyze() ile örtüşür.
+        Yeni bir inceleme başlatılır ve taşınan düğüm/kenarlar bu incelemeye
+        yazılır; ardından add_results ile sadece yeni veriler eklenebilir.
+        """
+        try:
+            self.reset(target)
+            excluded = {canonicalize_url(url) for url in exclude_evidence or ()}
+            edges = []
+            for edge in network_data.get('edges', []):
+                urls = edge.get('evidence_urls') or ([edge['evidence']] if edge.get('evidence') else [])
+                kept = [url for url in urls if canonicalize_url(url) not in excluded]
+                if urls and not kept:
+                    continue
+                edges.append((edge['source'], edge['target'], kept))
+
+            graph = nx.Graph()
+            graph.add_node(target)
+            graph.add_edges_from((u, v) for u, v, _ in edges)
+            reachable = nx.node_connected_component(graph, target)
+
+            for node in network_data.get('nodes', []):
+                if node['id'] in reachable:
+                    self._add_node(node['id'], node_type=node['type'], size=node.get('size', 15))
+            for u, v, urls in edges:
+                if u in reachable:
+                    for url in urls or [None]:
+                        self._add_edge(u, v, url)
+
+            network_data = self.snapshot()
+            self._persist(network_data['nodes'], network_data['edges'])
+            return network_data
+
+        except Exception as e:
+            logger.error(f"Graf yükleme hatası: {str(e)}")
             return {'error': str(e)}
 
+    def snapshot(self) -> Dict[str, Any]:
+        """Grafın tamamını analyze() çıktı biçiminde döndür"""
+        return {
+            'nodes': self._get_nodes(),
+            'edges': self._get_edges(),
+            'metrics': self._calculate_metrics()
+        }
+
+    def analytics(self, **kwargs) -> Dict[str, Any]:
+        """Graf üzerinde PageRank, yaklaşık betweenness, bileşen ve topluluk metrikleri"""
+        return analyze_graph(self.G, **kwargs)
+
+    def _persist(self, nodes: list, edges: list):
+        """Farkı varlık deposuna yaz; depo hatası analizi durdurmaz"""
+        if self.store is None or self.investigation_id is None or not (nodes or edges):
+            return
+        try:
+            self.store.add_delta(self.investigation_id, nodes, edges)
+        except Exception as e:
+            logger.error(f"Varlık deposuna yazma hatası: {str(e)}")
+
+    def _merge(self, target: str, source: str, data: Dict):
+        if source == 'social' and 'platform_data' in data:
+            self._analyze_social_connections(target, data['platform_data'])
+        elif source == 'news' and 'articles' in data:
+            self._analyze_news_connections(target, data['articles'])
+        elif source == 'search' and 'articles' in data:
+            self._analyze_search_connections(target, data['articles'])
+
+    def _add_node(self, node: str, **attrs) -> bool:
+        """Düğümü ekle/güncelle, tip sayaçlarını koru; yeni düğümse True"""
+        node_type = attrs.get('node_type')
+        if node in self.G:
+            old_type = self.G.nodes[node].get('node_type')
+            self.G.nodes[node].update(attrs)
+            if node_type and node_type != old_type:
+                counts = self._metrics['node_types']
+                counts[old_type] -= 1
+                if not counts[old_type]:
+                    del counts[old_type]
+                counts[node_type] = counts.get(node_type, 0) + 1
+                if self._delta is not None:
+                    self._delta['nodes'][node] = True
+            return False
+
+        self.G.add_node(node, **attrs)
+        self._metrics['total_nodes'] += 1
+        node_type = node_type or 'unknown'
+        self._metrics['node_types'][node_type] = self._metrics['node_types'].get(node_type, 0) + 1
+        if self._delta is not None:
+            self._delta['nodes'][node] = True
+        return True
+
+    def _add_edge(self, u: str, v: str, evidence: Optional[str] = None) -> bool:
+        """Kenarı ekle; yeni kenarsa True.
+
+        evidence, ilişkiyi gösteren kaynak URL'dir; aynı ilişkiyi gösteren tüm
+        URL'ler kenarda görülme sırasıyla tutulur.
+        """
+        if self.G.has_edge(u, v):
+            urls = self.G.edges[u, v].setdefault('evidence', [])
+            if evidence and evidence not in urls:
+                urls.append(evidence)
+                if self._delta is not None:
+                    self._delta['evidence'].append({'source': u, 'target': v, 'evidence': evidence})
+            return False
+
+        self.G.add_edge(u, v, evidence=[evidence] if evidence else [])
+        self._metrics['total_edges'] += 1
+        if self._delta is not None:
+            self._delta['edges'].append(self._edge_dict(u, v))
+        return True
+
     def _analyze_social_connections(self, target: str, platform_data: Dict):
         """Sosyal medya bağlantılarını analiz et"""
         for platform, data in platform_data.items():
             if data:
                 # Platform düğümünü ekle
                 platform_name = platform.capitalize()
-                self.G.add_node(platform_name, node_type='platform', size=25)
-                self.G.add_edge(target, platform_name)
-                
-                # Platformdaki hesapları ve grupları analiz et
+                self._add_node(platform_name, node_type='platform', size=25)
+                self._add_edge(target, platform_name)
+                # Platform kenarının kanıtı gönderilerdir; hepsi silinince platform da düşer
                 for item in data:
-                    if 'description' in item:
-                        # Kullanıcı adlarını bul (@user gibi)
-                        usernames = re.findall(r'@(\w+)', item['description'])
-                        for username in usernames:
-                            account_name = f"@{username}"
-                            self.G.add_node(account_name, 
-                                          node_type='account',
-                                          size=15,
-                                          platform=platform_name)
-                            self.G.add_edge(platform_name, account_name)
-                        
-                        # Grup/sayfa isimlerini bul
-                        groups = re.findall(r'([\w\s]+Group|[\w\s]+Page|[\w\s]+Community)', 
-                                          item['description'])
-                        for group in groups:
-                            self.G.add_node(group.strip(), 
-                                          node_type='group',
-                                          size=15,
-                                          platform=platform_name)
-                            self.G.add_edge(platform_name, group.strip())
+                    self._add_edge(target, platform_name, item.get('url'))
+                
+                # Platformdaki hesapları ve grupları tek taramada bul
+                items = [item for item in data if 'description' in item]
+                extracted = self.extractor.extract_many([item['description'] for item in items],
+                                                        kinds=('handle', 'social_group'))
+                for item, entities in zip(items, extracted):
+                    evidence = item.get('url')
+                    # Kullanıcı adları (@user gibi)
+                    for account_name in entities['handle']:
+                        self._add_node(account_name, 
+                                       node_type='account',
+                                       size=15,
+                                       platform=platform_name)
+                        self._add_edge(platform_name, account_name, evidence)
+                    
+                    # Grup/sayfa isimleri
+                    for group in entities['social_group']:
+                        self._add_node(group, 
+                                       node_type='group',
+                                       size=15,
+                                       platform=platform_name)
+                        self._add_edge(platform_name, group, evidence)
 
     def _analyze_news_connections(self, target: str, articles: list):
         """Haber bağlantılarını analiz et"""
+        domains = []
         for article in articles:
             try:
-                # Haber kaynağını ekle
-                domain = article['url'].split('/')[2].replace('www.', '')
-                if any(news_domain in domain for news_domain in self.news_domains):
-                    self.G.add_node(domain, node_type='news', size=20)
-                    self.G.add_edge(target, domain)
-                
-                # İçerikte geçen kişi isimlerini bul
-                if 'content' in article:
-                    # Büyük harfle başlayan 2-3 kelimelik isimler
-                    names = re.findall(r'[A-Z][a-zıİğĞüÜşŞöÖçÇ]+(?:\s+[A-Z][a-zıİğĞüÜşŞöÖçÇ]+){1,2}',
-                                     article['content'])
-                    for name in names:
-                        if name != target and len(name) > 5:  # Kısa isimleri filtrele
-                            self.G.add_node(name.strip(), 
-                                          node_type='person',
-                                          size=20,
-                                          source=domain)
-                            self.G.add_edge(target, name.strip())
+                # Haber kaynağını kayıtlı alan adına göre ekle (ör. spor.milliyet.com.tr -> milliyet.com.tr)
+                domain = self.domain_index.registrable_domain(article['url'])
+                if self.domain_index.classify(article['url']) == 'news':
+                    self._add_node(domain, node_type='news', size=20)
+                    self._add_edge(target, domain, article['url'])
             except:
-                continue
+                domain = None
+            domains.append(domain)
+
+        # İçerikte geçen kişi isimleri (büyük harfle başlayan 2-3 kelime), tüm haberler tek taramada
+        contents = [article.get('content', '') for article in articles]
+        extracted = self.extractor.extract_many(contents, kinds=('person',))
+        for article, domain, entities in zip(articles, domains, extracted):
+            for name in entities['person']:
+                if name != target and len(name) > 5:  # Kısa isimleri filtrele
+                    self._add_node(name, 
+                                   node_type='person',
+                                   size=20,
+                                   source=domain)
+                    self._add_edge(target, name, article.get('url'))
 
     def _analyze_search_connections(self, target: str, articles: list):
         """Arama sonuçlarından bağlantıları analiz et"""
-        for article in articles:
-            if 'content' in article:
-                # Politik grupları bul
-                groups = re.findall(r'([\w\s]+(Party|Group|Organization|Movement))',
-                                  article['content'])
-                for group in groups:
-                    group_name = group[0].strip()
-                    if group_name not in self.G:
-                        self.G.add_node(group_name, 
-                                      node_type='group',
-                                      size=15)
-                        self.G.add_edge(target, group_name)
+        # Politik grupları bul
+        articles = [article for article in articles if 'content' in article]
+        extracted = self.extractor.extract_many([article['content'] for article in articles],
+                                                kinds=('organization',))
+        for article, entities in zip(articles, extracted):
+            for group_name in entities['organization']:
+                if group_name not in self.G:
+                    self._add_node(group_name, 
+                                   node_type='group',
+                                   size=15)
+                    self._add_edge(target, group_name, article.get('url'))
+                elif self.G.has_edge(target, group_name):
+                    # Aynı grubu anan diğer sonuçlar kanıt olarak eklenir
+                    self._add_edge(target, group_name, article.get('url'))
+
+    def _node_dict(self, node: str) -> Dict[str, Any]:
+        attrs = self.G.nodes[node]
+        return {
+            'id': node,
+            'label': node,
+            'type': attrs['node_type'],
+            'color': self.node_types[attrs['node_type']]['color'],
+            'size': attrs.get('size', 15)
+        }
+
+    def _edge_dict(self, u: str, v: str) -> Dict[str, Any]:
+        edge = {
+            'source': u,
+            'target': v
+        }
+        urls = self.G.edges[u, v].get('evidence')
+        if urls:
+            # 'evidence' ilk kanıttır; 'evidence_urls' tümü (load_snapshot için)
+            edge['evidence'] = urls[0]
+            edge['evidence_urls'] = list(urls)
+        return edge
 
     def _get_nodes(self) -> list:
         """Graf düğümlerini liste olarak döndür"""
-        return [
-            {
-                'id': node,
-                'label': node,
-                'type': self.G.nodes[node]['node_type'],
-                'color': self.node_types[self.G.nodes[node]['node_type']]['color'],
-                'size': self.G.nodes[node].get('size', 15)
-            }
-            for node in self.G.nodes()
-        ]
+        return [self._node_dict(node) for node in self.G.nodes()]
 
     def _get_edges(self) -> list:
         """Graf kenarlarını liste olarak döndür"""
-        return [
-            {
-                'source': u,
-                'target': v
-            }
-            for u, v in self.G.edges()
-        ]
+        return [self._edge_dict(u, v) for u, v in self.G.edges()]
 
     def _calculate_metrics(self) -> Dict[str, Any]:
-        """Graf metriklerini hesapla"""
-        metrics = {
-            'total_nodes': self.G.number_of_nodes(),
-            'total_edges': self.G.number_of_edges(),
-            'node_types': {}
+        """Artımlı tutulan graf metriklerinin kopyası"""
+        return {
+            'total_nodes': self._metrics['total_nodes'],
+            'total_edges': self._metrics['total_edges'],
+            'node_types': dict(self._metrics['node_types'])
         }
-        
-        # Düğüm tiplerini say
-        for node, attr in self.G.nodes(data=True):
-            node_type = attr.get('node_type', 'unknown')
-            metrics['node_types'][node_type] = metrics['node_types'].get(node_type, 0) + 1
-        
-        return metrics
\ No newline at end of file
@@ -0,0 +1,119 @@
+# analyzers/run_diff.py
+import hashlib
+import logging
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from collectors.url_utils import canonicalize_url
+from .context_builder import normalize_tokens
+
+logger = logging.getLogger(__name__)
+
+# Bölüm -> öğe metin alanı (dedup ve context builder ile aynı alanlar)
+TEXT_FIELDS = {'search': 'content', 'news': 'content', 'social': 'description'}
+
+
+def item_key(item: Dict, text_field: str) -> str:
+    """Öğe kimliği: kanonik URL; URL yoksa normalize metnin özeti"""
+    if item.get('url'):
+        return canonicalize_url(item['url'])
+    text = ' '.join(normalize_tokens(f"{item.get('title', '')} {item.get(text_field, '')}"))
+    return 'text:' + hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def content_hash(item: Dict, text_field: str) -> str:
+    """Başlık ve metnin normalize edilmiş özeti (biçim farkları değişiklik sayılmaz)"""
+    text = ' '.join(normalize_tokens(f"{item.get('title', '')}\0{item.get(text_field, '')}"))
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def _iter_items(results: Dict) -> Iterator[Tuple[str, Optional[str], Dict]]:
+    """(bölüm, platform, öğe) üçlüleri"""
+    for section in ('search', 'news'):
+        for article in (results.get(section) or {}).get('articles', []) or []:
+            yield section, None, article
+    for platform, posts in ((results.get('social') or {}).get('platform_data') or {}).items():
+        for post in posts or []:
+            yield 'social', platform, post
+
+
+def _index(results: Dict) -> Dict[Tuple[str, Optional[str], str], Tuple[str, Dict]]:
+    index = {}
+    for section, platform, item in _iter_items(results):
+        field = TEXT_FIELDS[section]
+        index.setdefault((section, platform, item_key(item, field)), (content_hash(item, field), item))
+    return index
+
+
+def _shape_like(results: Dict, items: List[Tuple[str, Optional[str], Dict]]) -> Dict:
+    """Öğeleri collector çıktısı biçiminde (articles / platform_data) topla"""
+    shaped: Dict[str, Any] = {}
+    for section in ('search', 'news'):
+        if section in results and isinstance(results[section], dict):
+            shaped[section] = dict(results[section])
+            shaped[section]['articles'] = []
+    if 'social' in results and isinstance(results['social'], dict):
+        shaped['social'] = dict(results['social'])
+        shaped['social']['platform_data'] = {
+            platform: [] for platform in (results['social'].get('platform_data') or {})
+        }
+
+    for section, platform, item in items:
+        bucket = shaped.setdefault(section, {})
+        if section == 'social':
+            bucket.setdefault('platform_data', {}).setdefault(platform, []).append(item)
+        else:
+            bucket.setdefault('articles', []).append(item)
+    return shaped
+
+
+def diff_results(previous: Dict, current: Dict) -> Dict[str, Any]:
+    """İki toplama sonucunu kanonik URL ve içerik özetiyle karşılaştır.
+
+    'added' ve 'removed' collector çıktısı biçimindedir; 'added' yeni ve
+    içeriği değişen öğeleri içerir, doğrudan NetworkAnalyzer.add_results'a ve
+    LLM'e verilebilir. 'removed_urls' silinen öğelerin (ham) URL'leridir ve
+    önceki grafın kenar kanıtlarıyla eşleşir. 'counts' bölüm başına
+    eklenen/değişen/silinen sayılarıdır.
+    """
+    before = _index(previous or {})
+    after = _index(current or {})
+
+    added, removed = [], []
+    counts = {section: {'added': 0, 'changed': 0, 'removed': 0} for section in TEXT_FIELDS}
+    for key, (digest, item) in after.items():
+        section, platform, _ = key
+        if key not in before:
+            counts[section]['added'] += 1
+            added.append((section, platform, item))
+        elif before[key][0] != digest:
+            counts[section]['changed'] += 1
+            added.append((section, platform, item))
+    for key, (_, item) in before.items():
+        if key not in after:
+            section, platform, _ = key
+            counts[section]['removed'] += 1
+            removed.append((section, platform, item))
+
+    return {
+        'added': _shape_like(current or {}, added),
+        'removed': _shape_like(previous or {}, removed),
+        'removed_urls': sorted({item['url'] for _, _, item in removed if item.get('url')}),
+        'counts': counts,
+        'unchanged': not added and not removed
+    }
+
+
+def diff_entities(previous: Optional[Dict], current: Dict) -> Dict[str, List]:
+    """İki network_data arasında eklenen/çıkarılan düğüm ve kenarlar"""
+    previous = previous or {}
+    before_nodes = {node['id']: node for node in previous.get('nodes', [])}
+    after_nodes = {node['id']: node for node in current.get('nodes', [])}
+    before_edges = {frozenset((edge['source'], edge['target'])) for edge in previous.get('edges', [])}
+    after_edges = {frozenset((edge['source'], edge['target'])) for edge in current.get('edges', [])}
+
+    return {
+        'added_nodes': [after_nodes[node] for node in after_nodes if node not in before_nodes],
+        'removed_nodes': [before_nodes[node] for node in before_nodes if node not in after_nodes],
+        'added_edges': [tuple(sorted(edge)) for edge in after_edges - before_edges],
+        'removed_edges': [tuple(sorted(edge)) for edge in before_edges - after_edges]
+    }
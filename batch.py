@@ -0,0 +1,417 @@
+"""Komut satırından toplu (başsız) OSINT analizi.
+
+Kullanım:
+    python batch.py hedefler.txt -o sonuclar.jsonl -c 8 [--llm] [--cache-only] [--only-new]
+                    [--render-dir grafikler/] [--incremental]
+
+Hedef dosyası düz metin (satır başına bir hedef, '#' ile başlayan satırlar
+yorum) ya da her satırında {"target": "..."} bulunan JSONL olabilir. Her hedefin
+sonucu çıktı dosyasına bir JSONL satırı olarak yazılır; başarıyla tamamlanan
+hedefler kontrol noktası dosyasına eklenir ve yarıda kesilen bir çalıştırma
+yeniden başlatıldığında bu hedefler atlanır. Hata veren ve hiçbir collector'ı
+veri döndürmeyen hedefler çıktıya hata kaydı olarak yazılır, kontrol noktasına eklenmez ve sonraki çalıştırmada
+yeniden denenir. --llm ile LLM yanıtı geldikçe
+<output>.llm_stream.jsonl dosyasına {"target", "chunk"} satırları olarak yazılır.
+--only-new ile her hedef için önceki çalıştırmalarda görülen URL'ler atlanır.
+--render-dir ile her hedefin ilişki ağı, işçi süreçlerde ekransız çizilip bu
+klasöre PNG/SVG olarak yazılır.
+--incremental ile hedefin çalıştırma deposundaki son raporuyla fark alınır:
+sadece yeni/değişen kayıtlar ilişki ağına eklenir, LLM'e yalnızca "ne değişti"
+sorulur (yanıt analizin 'updates' listesine eklenir) ve yeni rapor depoya
+kaydedilir. Süresi dolan veya hata veren collector'ların bölümleri önceki
+rapordan aynen taşınır (kayıtta 'carried_over'); silinmiş sayılmaz.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import argparse
+import asyncio
+import json
+import logging
+import re
+import ssl
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+import certifi
+from dotenv import load_dotenv
+
+from collectors.search_collector import SearchCollector
+from collectors.social_collector import SocialMediaCollector
+from collectors.news_collector import NewsCollector
+from collectors.orchestrator import CollectionOrchestrator
+from collectors.session_manager import session_manager
+from collectors.parse_pool import parse_pool
+from collectors.http_cache import http_cache
+from collectors.seen_index import seen_index
+from analyzers.network_analyzer import NetworkAnalyzer
+from storage.entity_store import entity_store
+from analyzers.dedup import deduplicate_results
+from analyzers.run_diff import diff_results, diff_entities
+from storage.run_store import run_store
+from visualizer.render_worker import render_pool
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+load_dotenv()
+
+# Görülen-URL filtresi bu kadar hedefte bir diske yazılır
+SEEN_SAVE_EVERY = 25
+
+
+def read_targets(path: str) -> List[str]:
+    """Metin veya JSONL dosyasından hedefleri oku"""
+    targets = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+            if line.startswith('{'):
+                record = json.loads(line)
+                target = record.get('target') or record.get('name')
+                if target:
+                    targets.append(target.strip())
+            else:
+                targets.append(line)
+    return targets
+
+
+def result_urls(results: Dict) -> List[str]:
+    """Sonuçlardaki tüm kayıt URL'leri (birleştirilen kopyaların kaynakları dahil)"""
+    items = [article for section in ('search', 'news')
+             for article in (results.get(section) or {}).get('articles', []) or []]
+    items += [post for posts in ((results.get('social') or {}).get('platform_data') or {}).values()
+              for post in posts or []]
+    urls = []
+    for item in items:
+        urls.extend(item.get('sources') or [item.get('url')])
+    return [url for url in urls if url]
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    done = set()
+    if os.path.exists(path):
+        with open(path, encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if line:
+                    done.add(json.loads(line))
+    return done
+
+
+class BatchRunner:
+    """Paylaşılan collector'lar üzerinden sınırlı eşzamanlılıkla çoklu hedef analizi"""
+
+    def __init__(self, output_path: str, checkpoint_path: str, concurrency: int = 4,
+                 timeout: float = 30, use_llm: bool = False, use_llm_cache: bool = True,
+                 only_new: bool = False, render_dir: Optional[str] = None, render_format: str = 'png',
+                 incremental: bool = False):
+        self.output_path = output_path
+        self.checkpoint_path = checkpoint_path
+        self.concurrency = concurrency
+        self.use_llm = use_llm
+        self.only_new = only_new
+        self.render_dir = render_dir
+        self.render_format = render_format
+        self.incremental = incremental
+
+        ssl_context = ssl.create_default_context(cafile=certifi.where())
+        self.orchestrator = CollectionOrchestrator(default_timeout=timeout)
+        self.orchestrator.register('search', SearchCollector(ssl_context=ssl_context, skip_seen=only_new))
+        self.orchestrator.register('social', SocialMediaCollector(ssl_context=ssl_context, skip_seen=only_new))
+        self.orchestrator.register('news', NewsCollector(ssl_context=ssl_context, skip_seen=only_new))
+
+        self.llm_analyzer = None
+        self.stream_file = None
+        if use_llm:
+            from analyzers.llm_analyzer import LLMAnalyzer
+            self.llm_analyzer = LLMAnalyzer(use_cache=use_llm_cache)
+
+        self.completed = 0
+        self.failed = 0
+
+    async def run(self, targets: List[str]):
+        done = load_checkpoint(self.checkpoint_path)
+        pending = [target for target in dict.fromkeys(targets) if target not in done]
+        logger.info(f"{len(pending)} hedef işlenecek ({len(done)} hedef kontrol noktasından atlandı)")
+
+        queue = asyncio.Queue()
+        for target in pending:
+            queue.put_nowait(target)
+
+        if self.llm_analyzer:
+            self.stream_file = open(f"{self.output_path}.llm_stream.jsonl", 'a', encoding='utf-8')
+
+        with open(self.output_path, 'a', encoding='utf-8') as output, \
+                open(self.checkpoint_path, 'a', encoding='utf-8') as checkpoint:
+            workers = [
+                asyncio.create_task(self._worker(queue, output, checkpoint))
+                for _ in range(min(self.concurrency, len(pending)))
+            ]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await self.orchestrator.close()
+                if self.stream_file:
+                    self.stream_file.close()
+                if self.only_new:
+                    seen_index.save()
+
+        logger.info(f"Tamamlandı: {self.completed} başarılı, {self.failed} hatalı")
+
+    async def _worker(self, queue: asyncio.Queue, output, checkpoint):
+        while True:
+            try:
+                target = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+
+            try:
+                record = await self.investigate(target)
+                succeeded = True
+            except Exception as e:
+                logger.error(f"Hata ({target}): {str(e)}")
+                record = {
+                    'target': target,
+                    'timestamp': datetime.now().isoformat(),
+                    'error': str(e)
+                }
+                succeeded = False
+
+            # Sonuç satırı diske yazıldıktan sonra kontrol noktası işaretlenir;
+            # hatalı hedefler işaretlenmez, yeniden başlatmada tekrar denenir
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+            output.flush()
+            os.fsync(output.fileno())
+            if not succeeded:
+                self.failed += 1
+                logger.info(f"✗ {target} ({self.completed + self.failed} işlendi)")
+                continue
+
+            checkpoint.write(json.dumps(target, ensure_ascii=False) + '\n')
+            checkpoint.flush()
+            os.fsync(checkpoint.fileno())
+            self.completed += 1
+            logger.info(f"✓ {target} ({self.completed + self.failed} tamamlandı)")
+
+            # URL'ler ancak hedefin sonucu kalıcı olarak yazıldıktan sonra görüldü sayılır
+            if self.only_new:
+                seen_index.mark(target, result_urls(record.get('results', {})))
+                if self.completed % SEEN_SAVE_EVERY == 0:
+                    seen_index.save()
+
+    async def investigate(self, target: str) -> Dict:
+        """Tek hedef için veri topla, ağ analizi (ve istenirse LLM analizi) yap"""
+        collection = await self.orchestrator.collect(target)
+        if not any(state.get('status') == 'ok' for state in collection['status'].values()):
+            # Boş kayıt başarılı sayılırsa hedef --resume ile bir daha denenmez
+            failures = ', '.join(f"{name}: {state.get('error', state.get('status'))}"
+                                 for name, state in collection['status'].items())
+            raise RuntimeError(f"Hiçbir collector veri döndürmedi ({failures})")
+        results = deduplicate_results(collection['results'])
+
+        previous = self._previous_report(target) if self.incremental else None
+        carried = []
+        if previous:
+            # Süresi dolan/hata veren collector'ın bölümü silinmiş sayılmamalı:
+            # önceki rapordan aynen taşınır, böylece farkta değişmemiş görünür
+            for name, data in (previous.get('results') or {}).items():
+                if name not in results and collection['status'].get(name, {}).get('status') != 'ok':
+                    results[name] = data
+                    carried.append(name)
+            if carried:
+                logger.info(f"{target}: önceki sonuçlar taşındı ({', '.join(carried)})")
+        diff = diff_results(previous.get('results', {}), results) if previous else None
+
+        network_analyzer = NetworkAnalyzer(store=entity_store)
+        network_data = self._update_network(network_analyzer, target, previous, diff) if diff else None
+        if network_data is None or 'error' in network_data:
+            network_data = network_analyzer.analyze(
+                target,
+                results.get('search', {}),
+                results.get('social', {}),
+                results.get('news', {})
+            )
+        analytics = network_analyzer.analytics(top=10)
+        if 'error' not in analytics:
+            network_data['analytics'] = {
+                key: analytics[key]
+                for key in ('component_count', 'community_count', 'top_pagerank', 'top_betweenness')
+            }
+
+        record = {
+            'target': target,
+            'timestamp': datetime.now().isoformat(),
+            'status': collection['status'],
+            'results': results,
+            'network_data': network_data
+        }
+        if carried:
+            record['carried_over'] = carried
+
+        entity_changes = None
+        if diff:
+            entity_changes = diff_entities(previous.get('network_data'), network_data)
+            record['changes'] = {
+                'counts': diff['counts'],
+                'unchanged': diff['unchanged'],
+                'added_entities': [node['id'] for node in entity_changes['added_nodes']],
+                'removed_entities': [node['id'] for node in entity_changes['removed_nodes']]
+            }
+
+        if self.render_dir and 'error' not in network_data:
+            record['graph_image'] = await self._render(target, network_data)
+
+        if self.llm_analyzer:
+            baseline = (previous or {}).get('analysis') or {}
+            if diff and baseline.get('analiz'):
+                # Önceki analiz korunur; her çalıştırmanın değişiklik analizi
+                # 'updates' listesine eklenir ve sonraki çalıştırmalara bağlam olur
+                record['analysis'] = self._carry_analysis(baseline)
+                if not diff['unchanged']:
+                    update = await self.llm_analyzer.analyze_changes(
+                        diff,
+                        previous_analysis=record['analysis'],
+                        entity_changes=entity_changes,
+                        target=target,
+                        on_chunk=lambda chunk: self._write_chunk(target, chunk)
+                    )
+                    record['analysis']['updates'] = record['analysis'].get('updates', []) + [update]
+            else:
+                record['analysis'] = await self.llm_analyzer.analyze(
+                    search_data=results.get('search', {}),
+                    social_data=results.get('social', {}),
+                    news_data=results.get('news', {}),
+                    target=target,
+                    on_chunk=lambda chunk: self._write_chunk(target, chunk)
+                )
+
+        if self.incremental:
+            report = {key: record[key] for key in ('target', 'results', 'analysis', 'network_data') if key in record}
+            run_store.save(target, report, kind='report')
+
+        return record
+
+    @staticmethod
+    def _carry_analysis(baseline: Dict) -> Dict:
+        """Önceki raporun analizini güncelleme geçmişiyle birlikte kopyala.
+
+        Eski raporlardaki tek 'changes' bloğu 'updates' listesine taşınır.
+        """
+        analysis = {key: value for key, value in baseline.items() if key not in ('changes', 'updates')}
+        updates = list(baseline.get('updates') or [])
+        if baseline.get('changes'):
+            updates.append(baseline['changes'])
+        if updates:
+            analysis['updates'] = updates
+        return analysis
+
+    def _previous_report(self, target: str) -> Optional[Dict]:
+        """Hedefin çalıştırma deposundaki son raporu (yoksa None)"""
+        try:
+            latest = run_store.latest(target, kind='report')
+            return run_store.load(latest['digest']) if latest else None
+        except Exception as e:
+            logger.error(f"Önceki rapor okunamadı ({target}): {str(e)}")
+            return None
+
+    def _update_network(self, network_analyzer: NetworkAnalyzer, target: str, previous: Dict,
+                        diff: Dict) -> Dict:
+        """Önceki grafı yükle, silinen kaynakların kanıtladığı ilişkileri çıkar, farkı ekle.
+
+        İçeriği değişen öğelerin eski ilişkileri de çıkarılır; güncel halleri
+        diff['added'] ile yeniden eklenir.
+        """
+        stale = list(diff['removed_urls']) + result_urls(diff['added'])
+        network_data = network_analyzer.load_snapshot(target, previous.get('network_data') or {},
+                                                      exclude_evidence=stale)
+        if 'error' in network_data:
+            return network_data
+        for source in ('social', 'news', 'search'):
+            if source in diff['added']:
+                network_analyzer.add_results(target, source, diff['added'][source])
+        return network_analyzer.snapshot()
+
+    async def _render(self, target: str, network_data: Dict) -> Optional[str]:
+        """İlişki ağını çizim havuzunda dosyaya yaz; hata hedefi başarısız saymaz"""
+        filename = re.sub(r'[^\w.-]+', '_', target).strip('._') or 'target'
+        path = os.path.join(self.render_dir, f"{filename}.{self.render_format}")
+        try:
+            return await render_pool.render_file(network_data, path, fmt=self.render_format)
+        except Exception as e:
+            logger.error(f"Çizim hatası ({target}): {str(e)}")
+            return None
+
+    def _write_chunk(self, target: str, chunk: str):
+        """LLM yanıt parçasını gelir gelmez akış dosyasına yaz"""
+        self.stream_file.write(json.dumps({'target': target, 'chunk': chunk}, ensure_ascii=False) + '\n')
+        self.stream_file.flush()
+
+
+async def run_batch(args):
+    runner = BatchRunner(
+        output_path=args.output,
+        checkpoint_path=args.checkpoint or f"{args.output}.checkpoint",
+        concurrency=args.concurrency,
+        timeout=args.timeout,
+        use_llm=args.llm,
+        use_llm_cache=not args.no_llm_cache,
+        only_new=args.only_new,
+        render_dir=args.render_dir,
+        render_format=args.render_format,
+        incremental=args.incremental
+    )
+    try:
+        await runner.run(read_targets(args.targets))
+    finally:
+        await session_manager.close()
+        if runner.llm_analyzer:
+            await runner.llm_analyzer.scheduler.close()
+        parse_pool.shutdown()
+        render_pool.shutdown()
+
+
+def main(argv: Optional[List[str]] = None):
+    parser = argparse.ArgumentParser(description="Toplu OSINT analizi")
+    parser.add_argument('targets', help='Hedef dosyası (.txt veya .jsonl)')
+    parser.add_argument('-o', '--output', default='outputs/batch_results.jsonl',
+                        help='Sonuçların yazılacağı JSONL dosyası')
+    parser.add_argument('-c', '--concurrency', type=int, default=4,
+                        help='Aynı anda incelenecek hedef sayısı')
+    parser.add_argument('--checkpoint', help='Kontrol noktası dosyası (varsayılan: <output>.checkpoint)')
+    parser.add_argument('--timeout', type=float, default=30, help='Collector başına süre sınırı (sn)')
+    parser.add_argument('--llm', action='store_true', help='Her hedef için LLM analizi de yap')
+    parser.add_argument('--no-llm-cache', action='store_true',
+                        help='LLM tamamlama önbelleğini atla')
+    parser.add_argument('--cache-only', action='store_true',
+                        help='Ağa çıkma, sadece HTTP önbelleğini kullan')
+    parser.add_argument('--only-new', action='store_true',
+                        help='Hedef için önceki çalıştırmalarda görülen URL\'leri atla')
+    parser.add_argument('--render-dir', help='İlişki ağı görsellerinin yazılacağı klasör')
+    parser.add_argument('--render-format', choices=('png', 'svg'), default='png',
+                        help='İlişki ağı görsel formatı')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Hedefin son kayıtlı çalıştırmasıyla fark al, sadece değişenleri analiz et')
+    args = parser.parse_args(argv)
+
+    if args.concurrency < 1:
+        parser.error('--concurrency en az 1 olmalı')
+    if args.incremental and args.only_new:
+        parser.error('--incremental ve --only-new birlikte kullanılamaz')
+    if args.cache_only:
+        http_cache.cache_only = True
+
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+
+    asyncio.run(run_batch(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Varlık çıkarımının büyük derlemlerde makale başına maliyeti.
+
+Kullanım:
+    python benchmarks/bench_entity_extraction.py [--articles 20000] [--long-words 2000]
+
+Kayıtlı ham veri (outputs/raw_data_*.json) içindeki metinler çoğaltılarak
+derlem oluşturulur; NetworkAnalyzer'ın eski makale başına re.findall yaklaşımı
+ile EntityExtractor'ın tek geçişli taraması karşılaştırılır. Ayrıca anahtar
+kelime içermeyen uzun bir metinde eski grup deseninin geri izleme maliyeti
+ölçülür.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import glob
+import json
+import re
+import time
+from typing import List
+
+from analyzers.entity_extractor import EntityExtractor
+
+OUTPUTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'outputs')
+
+# NetworkAnalyzer'ın önceki sürümündeki desenler
+LEGACY_PATTERNS = {
+    'handle': r'@(\w+)',
+    'social_group': r'([\w\s]+Group|[\w\s]+Page|[\w\s]+Community)',
+    'organization': r'([\w\s]+(Party|Group|Organization|Movement))',
+    'person': r'[A-Z][a-zıİğĞüÜşŞöÖçÇ]+(?:\s+[A-Z][a-zıİğĞüÜşŞöÖçÇ]+){1,2}'
+}
+
+
+def load_corpus(size: int) -> List[str]:
+    texts = []
+    for path in sorted(glob.glob(os.path.join(OUTPUTS_DIR, 'raw_data_*.json'))):
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        for section in ('search', 'news'):
+            texts.extend(a['content'] for a in data.get(section, {}).get('articles', []) if a.get('content'))
+        for posts in data.get('social', {}).get('platform_data', {}).values():
+            texts.extend(p['description'] for p in posts or [] if p.get('description'))
+    if not texts:
+        raise SystemExit("outputs/ altında ham veri bulunamadı")
+    return [texts[i % len(texts)] for i in range(size)]
+
+
+def legacy_extract(texts: List[str]):
+    # Her makale ve her tür için ayrı, derlenmemiş findall
+    for text in texts:
+        for pattern in LEGACY_PATTERNS.values():
+            re.findall(pattern, text)
+
+
+def report(label: str, elapsed: float, count: int):
+    print(f"{label:<34}{elapsed * 1000:>10.1f} ms{elapsed / count * 1e6:>12.1f} µs/makale")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Varlık çıkarımı benchmark'ı")
+    parser.add_argument('--articles', type=int, default=20000, help='Derlemdeki makale sayısı')
+    parser.add_argument('--long-words', type=int, default=2000,
+                        help='Geri izleme testi için uzun metnin kelime sayısı')
+    args = parser.parse_args()
+
+    texts = load_corpus(args.articles)
+    extractor = EntityExtractor()
+    print(f"{len(texts)} makale, ortalama {sum(map(len, texts)) // len(texts)} karakter\n")
+
+    start = time.perf_counter()
+    legacy_extract(texts)
+    report('eski (findall, makale başına)', time.perf_counter() - start, len(texts))
+
+    start = time.perf_counter()
+    for text in texts:
+        extractor.extract(text)
+    report('EntityExtractor.extract', time.perf_counter() - start, len(texts))
+
+    start = time.perf_counter()
+    results = extractor.extract_many(texts)
+    report('EntityExtractor.extract_many', time.perf_counter() - start, len(texts))
+    print(f"{'':<34}{sum(len(v) for r in results for v in r.values()):>10} varlık\n")
+
+    # Anahtar kelimesiz uzun metin: eski desen her başlangıç noktasında tüm metni geri izler
+    long_text = ' '.join(['kelime'] * args.long_words)
+    start = time.perf_counter()
+    re.findall(LEGACY_PATTERNS['organization'], long_text)
+    legacy = time.perf_counter() - start
+    start = time.perf_counter()
+    extractor.extract(long_text)
+    current = time.perf_counter() - start
+    print(f"uzun metin ({len(long_text) // 1024} KB): eski {legacy * 1000:.1f} ms, yeni {current * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""HTML çıkarım arka uçlarının site bazlı ayrıştırma süreleri.
+
+Kullanım:
+    python benchmarks/bench_html_extract.py [--repeat 20]
+
+benchmarks/fixtures altındaki kayıtlı DuckDuckGo/Hürriyet/Milliyet/Sözcü
+sayfaları, collector'ların gerçek ayrıştırma metotlarıyla her arka uçta işlenir.
+Tüm arka uçların aynı sonuçları ürettiği de kontrol edilir.
+"""
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import argparse
+import time
+
+from collectors.html_extract import BACKENDS, set_default_backend, get_default_backend
+from collectors.search_collector import SearchCollector
+from collectors.social_collector import SocialMediaCollector
+from collectors.news_sources import NEWS_SOURCES, parse_news_page
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixture(name: str) -> str:
+    with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML çıkarım benchmark'ı")
+    parser.add_argument('--repeat', type=int, default=20, help='Sayfa başına tekrar sayısı')
+    args = parser.parse_args()
+
+    search = SearchCollector()
+    social = SocialMediaCollector()
+
+    cases = [
+        ('duckduckgo (search)', 'duckduckgo.html', search._parse_results),
+        ('duckduckgo (social)', 'duckduckgo.html', social._parse_results),
+    ]
+    for name in ('hurriyet', 'milliyet', 'sozcu'):
+        profile = NEWS_SOURCES[name]
+        cases.append((name, f'{name}.html', lambda html, profile=profile: parse_news_page(html, profile)))
+
+    original_backend = get_default_backend()
+    backends = list(BACKENDS)
+
+    print(f"{'sayfa':<22}{'boyut':>9}  " + ''.join(f"{name:>14}" for name in backends) + f"{'sonuç':>8}")
+    try:
+        for label, fixture, parse in cases:
+            html = load_fixture(fixture)
+            timings = {}
+            outputs = {}
+            for backend in backends:
+                set_default_backend(backend)
+                outputs[backend] = parse(html)
+                start = time.perf_counter()
+                for _ in range(args.repeat):
+                    parse(html)
+                timings[backend] = (time.perf_counter() - start) / args.repeat * 1000
+
+            reference = outputs[backends[0]]
+            for backend in backends[1:]:
+                if outputs[backend] != reference:
+                    print(f"UYARI: {label} için '{backend}' farklı sonuç üretti")
+
+            print(f"{label:<22}{len(html) // 1024:>7}KB  "
+                  + ''.join(f"{timings[name]:>11.2f} ms" for name in backends)
+                  + f"{len(reference):>8}")
+    finally:
+        set_default_backend(original_backend)
+
+
+if __name__ == "__main__":
+    main()
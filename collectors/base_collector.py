@@ -1,15 +1,27 @@
 # collectors/base_collector.py
-from typing import Dict, List
+from contextvars import ContextVar
+from typing import Dict, List, Optional, Tuple
 import aiohttp
 import logging
 from abc import ABC, abstractmethod
 import ssl
 
+from .http_cache import http_cache
+from .rate_limiter import rate_limiter
+from .seen_index import seen_index
+from .session_manager import session_manager
+
+# Orchestrator'ın her collector çalıştırması için açtığı istek sayaçları
+# ({'attempts': ..., 'ok': ...}); görev bağlamında taşındığından eşzamanlı
+# hedefler birbirini etkilemez
+fetch_stats: ContextVar[Optional[Dict[str, int]]] = ContextVar('fetch_stats', default=None)
+
 
 class BaseCollector(ABC):
-    def __init__(self, ssl_context: ssl.SSLContext = None):
+    def __init__(self, ssl_context: ssl.SSLContext = None, skip_seen: bool = False):
         self.session = None
         self.ssl_context = ssl_context
+        self.skip_seen = skip_seen
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
@@ -17,14 +29,61 @@ class BaseCollector(ABC):
         }
 
     async def ensure_session(self):
+        # Oturum paylaşılan havuzdan ödünç alınır
         if not self.session or self.session.closed:
-            connector = aiohttp.TCPConnector(ssl=self.ssl_context) if self.ssl_context else None
-            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector)
+            self.session = await session_manager.get_session(self.ssl_context, self.headers)
+
+    async def _fetch(self, url: str, source: str, headers: Optional[Dict[str, str]] = None,
+                     **kwargs) -> Tuple[int, str]:
+        """URL'yi önbellek, hız sınırlayıcı ve paylaşılan oturum üzerinden getir.
+
+        Taze önbellek kaydı varsa ağa çıkılmaz; bayat kayıt ETag/Last-Modified ile
+        yeniden doğrulanır. Sadece-önbellek modunda kayıt yoksa 504 döner.
+        Deneme ve başarılı (200) yanıt sayıları fetch_stats'a işlenir.
+        """
+        stats = fetch_stats.get()
+        if stats is not None:
+            stats['attempts'] += 1
+        status, text = await self._fetch_cached(url, source, headers, **kwargs)
+        if stats is not None and status == 200:
+            stats['ok'] += 1
+        return status, text
+
+    async def _fetch_cached(self, url: str, source: str, headers: Optional[Dict[str, str]] = None,
+                            **kwargs) -> Tuple[int, str]:
+        entry = http_cache.get(url)
+        if entry and (http_cache.cache_only or http_cache.is_fresh(entry, source)):
+            return 200, entry['text']
+        if http_cache.cache_only:
+            return 504, ''
+
+        request_headers = dict(headers or {})
+        if entry:
+            request_headers.update(http_cache.validators(entry))
+
+        await rate_limiter.wait(url)
+        async with self.session.get(url, headers=request_headers, **kwargs) as response:
+            if response.status == 304 and entry:
+                http_cache.refresh(url)
+                return 200, entry['text']
+
+            text = await response.text()
+            if response.status == 200:
+                http_cache.put(url, source, text,
+                               etag=response.headers.get('ETag'),
+                               last_modified=response.headers.get('Last-Modified'))
+            return response.status, text
+
+    def _filter_seen(self, target: str, items: List[Dict]) -> List[Dict]:
+        """skip_seen açıksa önceki çalıştırmalarda bu hedef için görülen URL'leri çıkar"""
+        if not self.skip_seen:
+            return items
+        return seen_index.filter_new(target, items)
 
     @abstractmethod
     async def collect(self, target: str) -> Dict:
         pass
 
     async def close(self):
-        if self.session and not self.session.closed:
-            await self.session.close()
\ No newline at end of file
+        # Paylaşılan oturum kapatılmaz, sadece bırakılır (bkz. session_manager.close)
+        self.session = None
@@ -0,0 +1,226 @@
+# collectors/html_extract.py
+"""Collector'ların CSS seçicilerini çalıştıran, arka ucu değiştirilebilir HTML çıkarım katmanı.
+
+Desteklenen arka uçlar:
+    'lxml'         lxml.html ağacı + önceden derlenen XPath (varsayılan, en hızlı)
+    'bs4-lxml'     BeautifulSoup, lxml ayrıştırıcısıyla
+    'html.parser'  BeautifulSoup, standart kütüphane ayrıştırıcısıyla (eski davranış)
+
+Varsayılan arka uç OSINT_HTML_BACKEND ortam değişkeni ya da set_default_backend()
+ile değiştirilebilir. Benchmark: benchmarks/bench_html_extract.py
+"""
+import logging
+import os
+import re
+from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Iterator, List, Optional
+
+from bs4 import BeautifulSoup
+
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+logger = logging.getLogger(__name__)
+
+# Metin çıkarımında atlanan etiketler (BeautifulSoup get_text ile aynı davranış)
+SKIPPED_TEXT_TAGS = {'script', 'style', 'template'}
+
+
+class HtmlNode(ABC):
+    """Arka uçtan bağımsız HTML düğümü"""
+
+    @abstractmethod
+    def select(self, selector: str) -> List['HtmlNode']:
+        pass
+
+    def select_one(self, selector: str) -> Optional['HtmlNode']:
+        nodes = self.select(selector)
+        return nodes[0] if nodes else None
+
+    @abstractmethod
+    def text(self, strip: bool = False) -> str:
+        """Düğüm metni; strip=True ise her parça kırpılıp boşluksuz birleştirilir"""
+        pass
+
+    @abstractmethod
+    def get(self, attr: str, default: Optional[str] = None) -> Optional[str]:
+        pass
+
+
+class SoupNode(HtmlNode):
+    def __init__(self, tag):
+        self._tag = tag
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        return [SoupNode(tag) for tag in self._tag.select(selector)]
+
+    def select_one(self, selector: str) -> Optional[HtmlNode]:
+        tag = self._tag.select_one(selector)
+        return SoupNode(tag) if tag is not None else None
+
+    def text(self, strip: bool = False) -> str:
+        return self._tag.get_text(strip=strip)
+
+    def get(self, attr: str, default: Optional[str] = None) -> Optional[str]:
+        value = self._tag.get(attr, default)
+        if isinstance(value, list):
+            return ' '.join(value)
+        return value
+
+
+class LxmlNode(HtmlNode):
+    def __init__(self, element):
+        self._element = element
+
+    def select(self, selector: str) -> List[HtmlNode]:
+        return [LxmlNode(element) for element in css_to_xpath(selector)(self._element)]
+
+    def text(self, strip: bool = False) -> str:
+        strings = _lxml_strings(self._element)
+        if strip:
+            return ''.join(s.strip() for s in strings)
+        return ''.join(strings)
+
+    def get(self, attr: str, default: Optional[str] = None) -> Optional[str]:
+        return self._element.get(attr, default)
+
+
+def _lxml_strings(element) -> Iterator[str]:
+    if element.text:
+        yield element.text
+    for child in element:
+        # Yorumların tag'i str değildir; içerikleri atlanır, tail metni alınır
+        if isinstance(child.tag, str) and child.tag not in SKIPPED_TEXT_TAGS:
+            yield from _lxml_strings(child)
+        if child.tail:
+            yield child.tail
+
+
+# Basit CSS seçici gramerinin parçaları: tag, #id, .class, [attr], [attr=value]
+_COMPOUND_RE = re.compile(r"""
+    (?P<tag>[a-zA-Z][\w-]*|\*)?
+    (?P<rest>(?:\#[\w-]+|\.[\w-]+|\[[\w-]+(?:=(?:"[^"]*"|'[^']*'|[^\]]*))?\])*)
+""", re.VERBOSE)
+_PART_RE = re.compile(r"""\#([\w-]+)|\.([\w-]+)|\[([\w-]+)(?:=("[^"]*"|'[^']*'|[^\]]*))?\]""")
+
+
+@lru_cache(maxsize=256)
+def css_to_xpath(selector: str):
+    """Collector'ların kullandığı CSS alt kümesini derlenmiş XPath'e çevir.
+
+    Desteklenenler: etiket, #id, .sınıf, [özellik], [özellik=değer], alt öğe
+    (boşluk) ve doğrudan çocuk (>) birleştiricileri.
+    """
+    tokens = selector.replace('>', ' > ').split()
+    if not tokens:
+        raise ValueError(f"Boş CSS seçici: {selector!r}")
+
+    steps = []
+    axis = 'descendant::'
+    for token in tokens:
+        if token == '>':
+            axis = 'child::'
+            continue
+
+        match = _COMPOUND_RE.fullmatch(token)
+        if not match:
+            raise ValueError(f"Desteklenmeyen CSS seçici: {selector!r}")
+
+        conditions = []
+        for element_id, class_name, attr, value in _PART_RE.findall(match.group('rest')):
+            if element_id:
+                conditions.append(f"@id={_xpath_literal(element_id)}")
+            elif class_name:
+                conditions.append(
+                    "contains(concat(' ', normalize-space(@class), ' '), "
+                    f"{_xpath_literal(' ' + class_name + ' ')})"
+                )
+            elif value:
+                conditions.append(f"@{attr}={_xpath_literal(value.strip(chr(34) + chr(39)))}")
+            else:
+                conditions.append(f"@{attr}")
+
+        step = axis + (match.group('tag') or '*').lower()
+        step += ''.join(f'[{condition}]' for condition in conditions)
+        steps.append(step)
+        axis = 'descendant::'
+
+    return etree.XPath('/'.join(steps))
+
+
+def _xpath_literal(value: str) -> str:
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    parts = value.split("'")
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in parts) + ")"
+
+
+class HtmlBackend(ABC):
+    name = ''
+
+    @abstractmethod
+    def parse(self, html: str) -> HtmlNode:
+        pass
+
+
+class SoupBackend(HtmlBackend):
+    def __init__(self, parser: str):
+        self.parser = parser
+        self.name = 'html.parser' if parser == 'html.parser' else f'bs4-{parser}'
+
+    def parse(self, html: str) -> HtmlNode:
+        return SoupNode(BeautifulSoup(html, self.parser))
+
+
+class LxmlBackend(HtmlBackend):
+    name = 'lxml'
+
+    def parse(self, html: str) -> HtmlNode:
+        if not html or not html.strip():
+            html = '<html></html>'
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # Kodlama bildirimi içeren str girdiler için
+            root = lxml.html.document_fromstring(html.encode('utf-8'))
+        except etree.ParserError:
+            # Sadece yorum/boşluk içeren sayfalar: html.parser gibi boş belge döndür
+            root = lxml.html.document_fromstring('<html></html>')
+        return LxmlNode(root)
+
+
+BACKENDS = {
+    'html.parser': SoupBackend('html.parser')
+}
+if HAS_LXML:
+    BACKENDS['lxml'] = LxmlBackend()
+    BACKENDS['bs4-lxml'] = SoupBackend('lxml')
+
+_default_backend = os.getenv('OSINT_HTML_BACKEND') or ('lxml' if HAS_LXML else 'html.parser')
+if _default_backend not in BACKENDS:
+    logger.warning(f"Bilinmeyen HTML arka ucu '{_default_backend}', html.parser kullanılıyor")
+    _default_backend = 'html.parser'
+
+
+def set_default_backend(name: str):
+    """Varsayılan çıkarım arka ucunu değiştir"""
+    global _default_backend
+    if name not in BACKENDS:
+        raise ValueError(f"Bilinmeyen HTML arka ucu: {name} (seçenekler: {', '.join(BACKENDS)})")
+    _default_backend = name
+
+
+def get_default_backend() -> str:
+    return _default_backend
+
+
+def parse_html(html: str, backend: Optional[str] = None) -> HtmlNode:
+    """HTML'i seçilen (veya varsayılan) arka uçla ayrıştır"""
+    return BACKENDS[backend or _default_backend].parse(html)
@@ -0,0 +1,207 @@
+# collectors/http_cache.py
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Kaynak bazlı tazelik süreleri (saniye)
+DEFAULT_TTLS = {
+    'search': 6 * 3600,
+    'social': 6 * 3600,
+    'news': 30 * 60
+}
+
+
+class HttpCache:
+    """Collector yanıtları için kalıcı, içerik adresli disk önbelleği.
+
+    Gövdeler SHA-256 özetleriyle sıkıştırılmış blob dosyaları olarak saklanır
+    (aynı içerik tek kez yazılır); URL -> blob eşlemesi, ETag/Last-Modified
+    doğrulayıcıları ve erişim zamanları SQLite indeksinde tutulur. Toplam boyut
+    `max_bytes` değerini aştığında en uzun süredir kullanılmayan kayıtlar silinir.
+    """
+
+    def __init__(self, cache_dir: str = '.cache/http', max_bytes: int = 200 * 1024 * 1024,
+                 ttls: Optional[Dict[str, float]] = None, default_ttl: float = 3600,
+                 cache_only: bool = False):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.cache_only = cache_only
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.join(self.cache_dir, 'blobs'), exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(self.cache_dir, 'index.sqlite'),
+                                         check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS entries (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    source TEXT,
+                    blob TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    fetched_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )""")
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_accessed ON entries(accessed_at)')
+            self._conn.execute('CREATE INDEX IF NOT EXISTS idx_entries_blob ON entries(blob)')
+        return self._conn
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode('utf-8')).hexdigest()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.cache_dir, 'blobs', digest[:2], digest)
+
+    def get(self, url: str) -> Optional[Dict]:
+        """URL için önbellek kaydını (metin dahil) döndür"""
+        with self._lock:
+            db = self._db()
+            row = db.execute(
+                'SELECT source, blob, etag, last_modified, fetched_at FROM entries WHERE key = ?',
+                (self._key(url),)
+            ).fetchone()
+            if row is None:
+                return None
+
+            source, digest, etag, last_modified, fetched_at = row
+            try:
+                with open(self._blob_path(digest), 'rb') as f:
+                    text = zlib.decompress(f.read()).decode('utf-8')
+            except (OSError, zlib.error):
+                # Blob kayıp veya bozuk: kaydı düşür
+                db.execute('DELETE FROM entries WHERE key = ?', (self._key(url),))
+                db.commit()
+                return None
+
+            db.execute('UPDATE entries SET accessed_at = ? WHERE key = ?', (time.time(), self._key(url)))
+            db.commit()
+
+        return {
+            'url': url,
+            'source': source,
+            'text': text,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': fetched_at
+        }
+
+    def is_fresh(self, entry: Dict, source: str) -> bool:
+        ttl = self.ttls.get(source, self.default_ttl)
+        return time.time() - entry['fetched_at'] < ttl
+
+    def validators(self, entry: Dict) -> Dict[str, str]:
+        """Koşullu istek için If-None-Match / If-Modified-Since header'ları"""
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def put(self, url: str, source: str, text: str,
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Yanıt gövdesini kaydet"""
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+
+        with self._lock:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(zlib.compress(data))
+                os.replace(tmp_path, path)
+
+            db = self._db()
+            now = time.time()
+            previous = db.execute('SELECT blob FROM entries WHERE key = ?', (self._key(url),)).fetchone()
+            db.execute(
+                'INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                (self._key(url), url, source, digest, os.path.getsize(path),
+                 etag, last_modified, now, now)
+            )
+            if previous and previous[0] != digest:
+                self._drop_blob_if_unused(previous[0])
+            db.commit()
+            self._evict()
+
+    def refresh(self, url: str):
+        """304 yanıtından sonra kaydın tazelik zamanını yenile"""
+        with self._lock:
+            now = time.time()
+            db = self._db()
+            db.execute('UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE key = ?',
+                       (now, now, self._key(url)))
+            db.commit()
+
+    def total_size(self) -> int:
+        with self._lock:
+            return self._total_size()
+
+    def _total_size(self) -> int:
+        row = self._db().execute(
+            'SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT blob, size FROM entries)'
+        ).fetchone()
+        return row[0]
+
+    def _evict(self):
+        # LRU: boyut sınırının altına inene kadar en eski erişilen kayıtları sil
+        db = self._db()
+        total = self._total_size()
+        if total <= self.max_bytes:
+            return
+
+        for key, digest in db.execute('SELECT key, blob FROM entries ORDER BY accessed_at').fetchall():
+            db.execute('DELETE FROM entries WHERE key = ?', (key,))
+            total -= self._drop_blob_if_unused(digest)
+            if total <= self.max_bytes:
+                break
+        db.commit()
+        logger.debug(f"HTTP önbelleği küçültüldü: {total} bayt")
+
+    def _drop_blob_if_unused(self, digest: str) -> int:
+        """Hiçbir kayıt kullanmıyorsa blob'u sil, boşalan boyutu döndür"""
+        in_use = self._db().execute('SELECT 1 FROM entries WHERE blob = ? LIMIT 1', (digest,)).fetchone()
+        if in_use:
+            return 0
+        path = self._blob_path(digest)
+        try:
+            size = os.path.getsize(path)
+            os.remove(path)
+            return size
+        except OSError:
+            return 0
+
+    def clear(self):
+        """Tüm önbelleği sil"""
+        with self._lock:
+            db = self._db()
+            digests = [row[0] for row in db.execute('SELECT DISTINCT blob FROM entries')]
+            db.execute('DELETE FROM entries')
+            db.commit()
+            for digest in digests:
+                try:
+                    os.remove(self._blob_path(digest))
+                except OSError:
+                    pass
+
+
+http_cache = HttpCache(
+    cache_dir=os.getenv('OSINT_CACHE_DIR', '.cache/http'),
+    cache_only=os.getenv('OSINT_CACHE_ONLY', '') == '1'
+)
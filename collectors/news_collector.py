@@ -1,10 +1,11 @@
+import asyncio
 import logging
-from typing import Dict, List
-from bs4 import BeautifulSoup
+from typing import Dict, List, Optional
 from datetime import datetime
 import urllib3
-from urllib.parse import quote_plus
 from collectors.base_collector import BaseCollector
+from collectors.news_sources import NEWS_SOURCES, build_source_url, parse_news_page
+from collectors.parse_pool import parse_pool
 import aiohttp
 import ssl
 import certifi
@@ -13,93 +14,49 @@ urllib3.disable_warnings()
 logger = logging.getLogger(__name__)
 
 class NewsCollector(BaseCollector):
-    def __init__(self, ssl_context=None):
-        super().__init__(ssl_context)
-        
+    def __init__(self, ssl_context=None, sources: Optional[Dict[str, Dict]] = None,
+                 max_concurrency: int = 10, per_source_concurrency: int = 2,
+                 skip_seen: bool = False):
+        super().__init__(ssl_context, skip_seen=skip_seen)
+        self.sources = sources if sources is not None else NEWS_SOURCES
+        self.max_concurrency = max_concurrency
+        self.per_source_concurrency = per_source_concurrency
+        self._limit = None
+        self._source_limits = {}
+
     async def _fetch_page(self, url: str) -> str:
         headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
             'Accept-Language': 'tr,en-US;q=0.7,en;q=0.3'
         }
-        async with self.session.get(url, headers=headers, ssl=False, allow_redirects=True) as response:
-            return await response.text()
+        _, html = await self._fetch(url, 'news', headers=headers, ssl=False, allow_redirects=True)
+        return html
 
     async def collect(self, target: str) -> Dict:
         await self.ensure_session()
-        news_list = []
-        query = target.translate(str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosucgiosu")).lower().replace(" ", "-")
 
-        # Hürriyet
-        try:
-            hurriyet_url = f'https://www.hurriyet.com.tr/haberleri/{query}'
-            html = await self._fetch_page(hurriyet_url)
-            soup = BeautifulSoup(html, 'html.parser')
-            news_items = soup.find_all('div', {'class': 'tag__list__item'})
-            
-            for item in news_items[:15]:
-                try:
-                    title_link = item.find('a', {'data-tag': 'h3'})
-                    summary_link = item.find('a', {'data-tag': 'p'})
-                    
-                    if title_link and summary_link:
-                        url = f"https://www.hurriyet.com.tr{title_link['href']}" if not title_link['href'].startswith('http') else title_link['href']
-                        news_list.append({
-                            'content': summary_link.p.text.strip(),
-                            'url': url
-                        })
-                except:
-                    continue
+        # Etkin kaynaklar paralel taranır
+        enabled = [name for name, profile in self.sources.items() if profile.get('enabled', True)]
+        source_results = await asyncio.gather(
+            *(self._collect_source(name, target) for name in enabled)
+        )
 
-        except Exception as e:
-            logger.error(f"Hürriyet hatası: {str(e)}")
+        news_list = [article for articles in source_results for article in articles]
+        return {'articles': self._filter_seen(target, news_list)}
 
-        # Milliyet
-        try:
-            milliyet_url = f'https://www.milliyet.com.tr/haberleri/{query}'
-            html = await self._fetch_page(milliyet_url)
-            soup = BeautifulSoup(html, 'html.parser')
-            news_items = soup.select('.news__item')
-            
-            for item in news_items[:15]:
-                try:
-                    link = item.select_one('a.news__link')
-                    summary = item.select_one('.news__spot')
-                    
-                    if link and summary:
-                        news_list.append({
-                            'content': summary.text.strip(),
-                            'url': f"https://www.milliyet.com.tr{link['href']}"
-                        })
-                except:
-                    continue
-                        
-        except Exception as e:
-            logger.error(f"Milliyet hatası: {str(e)}")
+    async def _collect_source(self, name: str, target: str) -> List[Dict]:
+        """Tek bir kaynaktan haberleri getir ve ayrıştır"""
+        profile = self.sources[name]
+        if self._limit is None:
+            self._limit = asyncio.Semaphore(self.max_concurrency)
+        if name not in self._source_limits:
+            self._source_limits[name] = asyncio.Semaphore(self.per_source_concurrency)
 
-        # Sözcü
         try:
-            sozcu_query = quote_plus(target)
-            sozcu_url = f'https://www.sozcu.com.tr/arama?search={sozcu_query}'
-            html = await self._fetch_page(sozcu_url)
-            soup = BeautifulSoup(html, 'html.parser')
-            news_items = soup.select('.col-md-6.col-lg-4.mb-4')
-            
-            for item in news_items[:15]:
-                try:
-                    link = item.select_one('a')
-                    summary = item.select_one('.small.text-secondary.text-truncate-2')
-                    
-                    if link and summary:
-                        url = f"https://www.sozcu.com.tr{link['href']}" if not link['href'].startswith('http') else link['href']
-                        news_list.append({
-                            'content': summary.text.strip(),
-                            'url': url
-                        })
-                except:
-                    continue
-
+            async with self._limit, self._source_limits[name]:
+                html = await self._fetch_page(build_source_url(profile, target))
+            return await parse_pool.run(parse_news_page, html, profile)
         except Exception as e:
-            logger.error(f"Sözcü hatası: {str(e)}")
-
-        return {'articles': news_list}
\ No newline at end of file
+            logger.error(f"{profile.get('name', name)} hatası: {str(e)}")
+            return []
@@ -0,0 +1,85 @@
+# collectors/news_sources.py
+"""NewsCollector için haber sitesi profilleri.
+
+Her profil:
+    name       Log mesajlarında kullanılan görünen ad
+    url        Arama/etiket sayfası şablonu; {slug} (ASCII, tireli) veya
+               {query} (URL kodlu hedef) yer tutucularını içerebilir
+    base_url   Göreli bağlantılar için önek
+    item       Haber kartı seçicisi
+    link       Kart içindeki bağlantı seçicisi (URL buradan alınır)
+    summary    Kart içindeki özet seçicisi (içerik buradan alınır)
+    limit      Sayfa başına en fazla haber
+    enabled    False ise kaynak atlanır
+
+Yeni bir kaynak eklemek için NEWS_SOURCES'a profil eklemek yeterlidir.
+"""
+from typing import Dict, List
+from urllib.parse import quote_plus
+
+from .html_extract import parse_html
+
+NEWS_SOURCES = {
+    'hurriyet': {
+        'name': 'Hürriyet',
+        'url': 'https://www.hurriyet.com.tr/haberleri/{slug}',
+        'base_url': 'https://www.hurriyet.com.tr',
+        'item': 'div.tag__list__item',
+        'link': 'a[data-tag="h3"]',
+        'summary': 'a[data-tag="p"] p',
+        'limit': 15,
+        'enabled': True
+    },
+    'milliyet': {
+        'name': 'Milliyet',
+        'url': 'https://www.milliyet.com.tr/haberleri/{slug}',
+        'base_url': 'https://www.milliyet.com.tr',
+        'item': '.news__item',
+        'link': 'a.news__link',
+        'summary': '.news__spot',
+        'limit': 15,
+        'enabled': True
+    },
+    'sozcu': {
+        'name': 'Sözcü',
+        'url': 'https://www.sozcu.com.tr/arama?search={query}',
+        'base_url': 'https://www.sozcu.com.tr',
+        'item': '.col-md-6.col-lg-4.mb-4',
+        'link': 'a',
+        'summary': '.small.text-secondary.text-truncate-2',
+        'limit': 15,
+        'enabled': True
+    }
+}
+
+
+def make_slug(target: str) -> str:
+    """Türkçe karakterleri sadeleştirip tireli, küçük harfli slug üret"""
+    return target.translate(str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosucgiosu")).lower().replace(" ", "-")
+
+
+def build_source_url(profile: Dict, target: str) -> str:
+    return profile['url'].format(slug=make_slug(target), query=quote_plus(target))
+
+
+def parse_news_page(html: str, profile: Dict) -> List[Dict]:
+    """Profil seçicileriyle sayfadaki haberleri çıkar"""
+    document = parse_html(html)
+    news_list = []
+
+    for item in document.select(profile['item'])[:profile.get('limit', 15)]:
+        try:
+            link = item.select_one(profile['link'])
+            summary = item.select_one(profile['summary'])
+
+            if link and summary and link.get('href'):
+                href = link.get('href')
+                url = href if href.startswith('http') else f"{profile['base_url']}{href}"
+                news_list.append({
+                    'content': summary.text().strip(),
+                    'url': url
+                })
+        except Exception:
+            continue
+
+    return news_list
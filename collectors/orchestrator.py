@@ -0,0 +1,96 @@
+# collectors/orchestrator.py
+import asyncio
+import logging
+import time
+from typing import Dict, Any, Callable, Optional, Tuple
+
+from .base_collector import BaseCollector, fetch_stats
+
+logger = logging.getLogger(__name__)
+
+
+class CollectionOrchestrator:
+    """Kayıtlı tüm collector'ları aynı anda, her biri kendi süre sınırıyla çalıştırır"""
+
+    def __init__(self, default_timeout: float = 30.0):
+        self.default_timeout = default_timeout
+        self.collectors: Dict[str, BaseCollector] = {}
+        self.timeouts: Dict[str, float] = {}
+
+    def register(self, name: str, collector: BaseCollector, timeout: Optional[float] = None):
+        """Collector'ı isim ve süre sınırıyla kaydet"""
+        self.collectors[name] = collector
+        self.timeouts[name] = timeout if timeout is not None else self.default_timeout
+
+    async def collect(self, target: str,
+                      on_result: Optional[Callable[[str, Dict, Dict], None]] = None) -> Dict[str, Any]:
+        """Tüm collector'ları paralel çalıştır.
+
+        Süresi dolan veya hata veren collector'lar sonuçlara eklenmez; durumları
+        'status' altında raporlanır, diğerlerinin sonuçları yine döndürülür.
+        on_result verilirse her collector bittiği anda (isim, veri, durum) ile çağrılır.
+        """
+        names = list(self.collectors)
+        outcomes = await asyncio.gather(*(
+            self._run_collector(name, self.collectors[name], target, on_result) for name in names
+        ))
+
+        results = {}
+        status = {}
+        for name, (data, state) in zip(names, outcomes):
+            status[name] = state
+            if state['status'] == 'ok':
+                results[name] = data
+
+        return {
+            'results': results,
+            'status': status
+        }
+
+    async def _run_collector(self, name: str, collector: BaseCollector, target: str,
+                             on_result: Optional[Callable] = None) -> Tuple[Dict, Dict]:
+        data, state = await self._collect_with_deadline(name, collector, target)
+        if on_result:
+            try:
+                on_result(name, data, state)
+            except Exception as e:
+                logger.error(f"Sonuç bildirimi hatası ({name}): {str(e)}")
+        return data, state
+
+    async def _collect_with_deadline(self, name: str, collector: BaseCollector, target: str) -> Tuple[Dict, Dict]:
+        timeout = self.timeouts[name]
+        start = time.perf_counter()
+        stats = {'attempts': 0, 'ok': 0}
+        token = fetch_stats.set(stats)
+        try:
+            data = await asyncio.wait_for(collector.collect(target), timeout=timeout)
+            elapsed = time.perf_counter() - start
+            if stats['attempts'] and not stats['ok']:
+                # Collector hataları yutup boş sonuç döndürür (ör. sadece-önbellek
+                # modunda boş önbellek); hiçbir istek başarılı olmadıysa veri yoktur
+                logger.warning(f"{name.capitalize()}: {stats['attempts']} isteğin hiçbiri başarılı olmadı")
+                return {}, {
+                    'status': 'error',
+                    'error': 'Hiçbir istek başarılı olmadı',
+                    'elapsed': round(elapsed, 3)
+                }
+            logger.info(f"{name.capitalize()} verisi toplandı ({elapsed:.2f} sn)")
+            return data, {'status': 'ok', 'elapsed': round(elapsed, 3)}
+        except asyncio.TimeoutError:
+            logger.warning(f"{name.capitalize()} {timeout} sn içinde tamamlanamadı")
+            return {}, {'status': 'timeout', 'elapsed': round(time.perf_counter() - start, 3)}
+        except Exception as e:
+            logger.error(f"Hata ({name}): {str(e)}")
+            return {}, {
+                'status': 'error',
+                'error': str(e),
+                'elapsed': round(time.perf_counter() - start, 3)
+            }
+        finally:
+            fetch_stats.reset(token)
+
+    async def close(self):
+        """Collector oturumlarını kapat"""
+        for collector in self.collectors.values():
+            if getattr(collector, 'session', None):
+                await collector.close()
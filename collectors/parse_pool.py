@@ -0,0 +1,63 @@
+# collectors/parse_pool.py
+import asyncio
+import logging
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+POOL_KINDS = ('thread', 'process', 'inline')
+
+
+class ParsePool:
+    """HTML ayrıştırmayı event loop dışındaki bir iş havuzuna gönderir.
+
+    kind:
+        'thread'   ThreadPoolExecutor (varsayılan; lxml ayrıştırırken GIL'i bırakır)
+        'process'  ProcessPoolExecutor (çok hedefli yüklerde çekirdek sayısıyla ölçeklenir;
+                   gönderilen fonksiyon ve argümanlar pickle edilebilir olmalıdır)
+        'inline'   Havuz kullanmadan doğrudan çalıştır
+    """
+
+    def __init__(self, kind: str = 'thread', max_workers: Optional[int] = None):
+        self._executor: Optional[Executor] = None
+        self.kind = 'thread'
+        self.max_workers = None
+        self.configure(kind, max_workers)
+
+    def configure(self, kind: str = 'thread', max_workers: Optional[int] = None):
+        """Havuz tipini ve işçi sayısını değiştir; mevcut havuz kapatılır"""
+        if kind not in POOL_KINDS:
+            raise ValueError(f"Bilinmeyen havuz tipi: {kind} (seçenekler: {', '.join(POOL_KINDS)})")
+        self.shutdown()
+        self.kind = kind
+        self.max_workers = max_workers
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == 'process':
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix='parse')
+            logger.debug(f"Ayrıştırma havuzu başlatıldı: {self.kind}")
+        return self._executor
+
+    async def run(self, func: Callable, *args) -> Any:
+        """func(*args) çağrısını havuzda çalıştır ve sonucunu bekle"""
+        if self.kind == 'inline':
+            return func(*args)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_executor(), func, *args)
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+
+parse_pool = ParsePool(
+    kind=os.getenv('OSINT_PARSE_POOL', 'thread'),
+    max_workers=int(os.getenv('OSINT_PARSE_WORKERS', '0')) or None
+)
@@ -0,0 +1,92 @@
+# collectors/rate_limiter.py
+import asyncio
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+class TokenBucket:
+    """Token bucket: saniyede `rate` jeton dolar, en fazla `burst` jeton birikir"""
+
+    def __init__(self, rate: float, burst: float):
+        if rate <= 0 or burst <= 0:
+            raise ValueError("rate ve burst pozitif olmalı")
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, amount: float = 1) -> float:
+        """Jetonları ayır ve beklenmesi gereken süreyi döndür.
+
+        Bakiye eksiye düşebilir; sonraki çağıranlar borç kapanana kadar sırayla
+        bekler, böylece bekleyenler arasında FIFO adaleti korunur.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= amount
+            if self.tokens >= 0:
+                return 0.0
+            return -self.tokens / self.rate
+
+    async def acquire(self, amount: float = 1):
+        wait = self.reserve(amount)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class RateLimiter:
+    """Host bazlı merkezi hız sınırlayıcı.
+
+    Yapılandırılmış bir host, kendisi ve tüm alt alan adları için tek bir bucket
+    paylaşır (ör. 'duckduckgo.com' hem duckduckgo.com hem html.duckduckgo.com).
+    """
+
+    def __init__(self, default_rate: float = 5.0, default_burst: float = 10,
+                 limits: Optional[Dict[str, Tuple[float, float]]] = None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.limits = dict(limits or {})
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def configure(self, host: str, rate: float, burst: float):
+        """Host için saniyelik istek hızı ve patlama kapasitesini ayarla"""
+        host = host.lower()
+        self.limits[host] = (rate, burst)
+        self._buckets.pop(host, None)
+
+    def bucket_for(self, url_or_host: str) -> TokenBucket:
+        host = self._host(url_or_host)
+        key = self._limit_key(host)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            rate, burst = self.limits.get(key, (self.default_rate, self.default_burst))
+            bucket = self._buckets[key] = TokenBucket(rate, burst)
+        return bucket
+
+    async def wait(self, url_or_host: str, amount: float = 1):
+        """Host için istek izni alınana kadar bekle"""
+        await self.bucket_for(url_or_host).acquire(amount)
+
+    def _host(self, url_or_host: str) -> str:
+        if '://' in url_or_host:
+            return (urlsplit(url_or_host).hostname or '').lower()
+        return url_or_host.lower()
+
+    def _limit_key(self, host: str) -> str:
+        labels = host.split('.')
+        for i in range(len(labels)):
+            candidate = '.'.join(labels[i:])
+            if candidate in self.limits:
+                return candidate
+        return host
+
+
+# DuckDuckGo HTML uç noktası tüm arama collector'ları tarafından paylaşılır
+rate_limiter = RateLimiter(limits={
+    'duckduckgo.com': (1.0, 3)
+})
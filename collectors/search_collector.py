@@ -1,17 +1,51 @@
 import logging
 from typing import Dict, List
-from bs4 import BeautifulSoup
 from urllib.parse import quote, unquote
 from fake_useragent import UserAgent
 import asyncio
 from .base_collector import BaseCollector
+from .html_extract import parse_html
+from .parse_pool import parse_pool
+from .url_utils import canonicalize_url
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def parse_search_results(html: str) -> List[Dict]:
+    """Search sonuçlarını parse et"""
+    document = parse_html(html)
+    results = []
+
+    for result in document.select('.result')[:10]:  # İlk 10 sonuç
+        try:
+            link = result.select_one('.result__a')
+            snippet = result.select_one('.result__snippet')
+
+            if link and snippet and link.get('href'):
+                # URL'yi temizle
+                url = link.get('href')
+                if '//duckduckgo.com/l/?uddg=' in url:
+                    url = unquote(url.split('uddg=')[1].split('&')[0])
+
+                # İçeriği al
+                content = snippet.text(strip=True)
+
+                # İçerik yeterince uzunsa ekle
+                if len(content) > 50:
+                    results.append({
+                        'content': content,
+                        'url': url
+                    })
+        except:
+            continue
+
+    return results
+
+
 class SearchCollector(BaseCollector):
-    def __init__(self, ssl_context=None):
-        super().__init__(ssl_context)
+    def __init__(self, ssl_context=None, skip_seen: bool = False):
+        super().__init__(ssl_context, skip_seen=skip_seen)
         self.ua = UserAgent()
         
     async def collect(self, target: str) -> Dict:
@@ -19,28 +53,28 @@ class SearchCollector(BaseCollector):
         try:
             search_results = []
             
-            # Ana arama için
-            general_results = await self._search(target)
-            search_results.extend(general_results)
-            
-            # PDF'ler için
+            # Ana arama ve PDF'ler için (hız sınırı rate_limiter'da)
             pdf_query = f"{target} filetype:pdf"
-            pdf_results = await self._search(pdf_query)
+            general_results, pdf_results = await asyncio.gather(
+                self._search(target),
+                self._search(pdf_query)
+            )
+            search_results.extend(general_results)
             search_results.extend(pdf_results)
             
-            # Tekrarları kaldır
+            # Tekrarları kanonik URL'ye göre kaldır
             seen_urls = set()
             unique_results = []
             
             for result in search_results:
-                url = result['url']
+                url = canonicalize_url(result['url'])
                 if url not in seen_urls:
                     seen_urls.add(url)
                     unique_results.append(result)
             
             # NewsCollector formatında döndür
             return {
-                'articles': unique_results
+                'articles': self._filter_seen(target, unique_results)
             }
             
         except Exception as e:
@@ -53,43 +87,16 @@ class SearchCollector(BaseCollector):
             url = f"https://html.duckduckgo.com/html/?q={quote(query)}&kl=tr-tr"
             headers = {'User-Agent': self.ua.random}
             
-            async with self.session.get(url, headers=headers) as response:
-                if response.status != 200:
-                    return []
-                    
-                html = await response.text()
-                return self._parse_results(html)
+            status, html = await self._fetch(url, 'search', headers=headers)
+            if status != 200:
+                return []
+                
+            # Ayrıştırma event loop dışında yapılır
+            return await parse_pool.run(parse_search_results, html)
                 
         except Exception as e:
             logger.error(f"Search error: {str(e)}")
             return []
 
     def _parse_results(self, html: str) -> List[Dict]:
-        """Search sonuçlarını parse et"""
-        soup = BeautifulSoup(html, 'html.parser')
-        results = []
-
-        for result in soup.select('.result')[:10]:  # İlk 10 sonuç
-            try:
-                link = result.select_one('.result__a')
-                snippet = result.select_one('.result__snippet')
-
-                if link and snippet:
-                    # URL'yi temizle
-                    url = link['href']
-                    if '//duckduckgo.com/l/?uddg=' in url:
-                        url = unquote(url.split('uddg=')[1].split('&')[0])
-                    
-                    # İçeriği al
-                    content = snippet.get_text(strip=True)
-                    
-                    # İçerik yeterince uzunsa ekle
-                    if len(content) > 50:
-                        results.append({
-                            'content': content,
-                            'url': url
-                        })
-            except:
-                continue
-        
-        return results
\ No newline at end of file
+        return parse_search_results(html)
@@ -0,0 +1,132 @@
+# collectors/seen_index.py
+import hashlib
+import logging
+import math
+import os
+import struct
+import threading
+from typing import Dict, Iterable, List
+
+from .url_utils import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b'OSBF1'
+_HEADER = struct.Struct('>5sQIQ')  # magic, bit sayısı, hash sayısı, eklenen kayıt
+
+
+class SeenIndex:
+    """Daha önce işlenmiş (hedef, URL) çiftleri için kalıcı Bloom filtresi.
+
+    URL'ler canonicalize_url ile normalize edildikten sonra hedefle birlikte
+    anahtarlanır; böylece aynı belge başka bir hedefin taramasında yine yeni
+    sayılır. `capacity` kayıt için yanlış pozitif oranı `error_rate` kadardır
+    (varsayılanlarla ~3.6 MB); kapasite aşıldığında oran yükselir ve uyarı
+    verilir. Filtre diske sadece save() ile yazılır.
+    """
+
+    def __init__(self, path: str = '.cache/seen.bloom', capacity: int = 2_000_000,
+                 error_rate: float = 0.001):
+        self.path = path
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self._bits = None
+        self._size = 0
+        self._hashes = 0
+        self._count = 0
+        self._dirty = False
+        self._lock = threading.Lock()
+
+    def _load(self):
+        if self._bits is not None:
+            return
+        if os.path.exists(self.path):
+            with open(self.path, 'rb') as f:
+                header = f.read(_HEADER.size)
+                magic, size, hashes, count = _HEADER.unpack(header)
+                if magic != _MAGIC:
+                    raise ValueError(f"Geçersiz görülen-URL dosyası: {self.path}")
+                self._bits = bytearray(f.read())
+                self._size, self._hashes, self._count = size, hashes, count
+            return
+
+        self._size = max(8, int(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2))
+        self._hashes = max(1, round(self._size / self.capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+        self._count = 0
+
+    def _positions(self, key: str):
+        # Çift hash ile k konum: h1 + i * h2
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        return [(h1 + i * h2) % self._size for i in range(self._hashes)]
+
+    @staticmethod
+    def make_key(target: str, url: str) -> str:
+        return f"{target.strip().lower()}\0{canonicalize_url(url)}"
+
+    def contains(self, target: str, url: str) -> bool:
+        with self._lock:
+            self._load()
+            return all(self._bits[p >> 3] & (1 << (p & 7)) for p in self._positions(self.make_key(target, url)))
+
+    def add(self, target: str, url: str) -> bool:
+        """Çifti işaretle; daha önce görülmüşse True döndür"""
+        with self._lock:
+            self._load()
+            seen = True
+            for p in self._positions(self.make_key(target, url)):
+                byte, mask = p >> 3, 1 << (p & 7)
+                if not self._bits[byte] & mask:
+                    self._bits[byte] |= mask
+                    seen = False
+            if not seen:
+                self._count += 1
+                self._dirty = True
+                if self._count == self.capacity:
+                    logger.warning("Görülen-URL filtresi kapasitesine ulaştı, yanlış pozitif oranı artacak")
+            return seen
+
+    def filter_new(self, target: str, items: List[Dict], url_field: str = 'url') -> List[Dict]:
+        """Daha önce görülmemiş kayıtları döndür.
+
+        Kayıtlar burada işaretlenmez; hedefin sonucu kalıcı olarak yazıldıktan
+        sonra mark() çağrılmalıdır, aksi halde yarıda kalan bir hedefin URL'leri
+        bir daha hiç işlenmez.
+        """
+        return [item for item in items if not item.get(url_field) or not self.contains(target, item[url_field])]
+
+    def mark(self, target: str, urls: Iterable[str]) -> int:
+        """URL'leri hedef için görüldü olarak işaretle; yeni işaretlenen sayısını döndür"""
+        return sum(not self.add(target, url) for url in urls if url)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load()
+            return self._count
+
+    def save(self):
+        """Değişiklik varsa filtreyi atomik olarak diske yaz"""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_HEADER.pack(_MAGIC, self._size, self._hashes, self._count))
+                f.write(self._bits)
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+
+    def clear(self):
+        with self._lock:
+            self._bits = None
+            self._dirty = False
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+
+seen_index = SeenIndex(path=os.getenv('OSINT_SEEN_INDEX', '.cache/seen.bloom'))
@@ -0,0 +1,78 @@
+# collectors/session_manager.py
+import asyncio
+import logging
+import ssl
+from typing import Dict, Optional
+
+import aiohttp
+
+logger = logging.getLogger(__name__)
+
+
+class SessionManager:
+    """Tüm collector'ların ödünç aldığı, süreç genelinde paylaşılan aiohttp oturumları.
+
+    Oturumlar event loop, SSL context ve varsayılan header'lara göre anahtarlanır;
+    aynı loop üzerinde çalışan collector'lar aynı TCPConnector'ı (DNS önbelleği ve
+    keep-alive bağlantıları dahil) kullanır.
+    """
+
+    def __init__(self, limit: int = 100, limit_per_host: int = 8,
+                 dns_cache_ttl: int = 300, keepalive_timeout: float = 60):
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.dns_cache_ttl = dns_cache_ttl
+        self.keepalive_timeout = keepalive_timeout
+        self._sessions = {}
+
+    def configure(self, **settings):
+        """Havuz ayarlarını güncelle (yeni açılan oturumlara uygulanır)"""
+        for name, value in settings.items():
+            if not hasattr(self, name) or name.startswith('_'):
+                raise ValueError(f"Bilinmeyen havuz ayarı: {name}")
+            setattr(self, name, value)
+
+    async def get_session(self, ssl_context: Optional[ssl.SSLContext] = None,
+                          headers: Optional[Dict[str, str]] = None) -> aiohttp.ClientSession:
+        """Çalışan loop için paylaşılan oturumu döndür, yoksa oluştur"""
+        loop = asyncio.get_running_loop()
+        self._prune_closed_loops()
+
+        key = (id(loop), id(ssl_context), frozenset((headers or {}).items()))
+        entry = self._sessions.get(key)
+        if entry and not entry[1].closed:
+            return entry[1]
+
+        connector_args = {
+            'limit': self.limit,
+            'limit_per_host': self.limit_per_host,
+            'ttl_dns_cache': self.dns_cache_ttl,
+            'use_dns_cache': True,
+            'keepalive_timeout': self.keepalive_timeout
+        }
+        if ssl_context:
+            connector_args['ssl'] = ssl_context
+
+        session = aiohttp.ClientSession(headers=headers,
+                                        connector=aiohttp.TCPConnector(**connector_args))
+        self._sessions[key] = (loop, session)
+        logger.debug("Yeni paylaşılan HTTP oturumu açıldı")
+        return session
+
+    def _prune_closed_loops(self):
+        # Kapanmış loop'lara bağlı oturumlar artık kullanılamaz
+        for key, (loop, _) in list(self._sessions.items()):
+            if loop.is_closed():
+                del self._sessions[key]
+
+    async def close(self):
+        """Çalışan loop'a ait tüm paylaşılan oturumları kapat"""
+        loop = asyncio.get_running_loop()
+        for key, (session_loop, session) in list(self._sessions.items()):
+            if session_loop is loop:
+                if not session.closed:
+                    await session.close()
+                del self._sessions[key]
+
+
+session_manager = SessionManager()
@@ -3,14 +3,45 @@ import aiohttp
 import asyncio
 from datetime import datetime
 from .base_collector import BaseCollector
+from .html_extract import parse_html
+from .parse_pool import parse_pool
 import logging
-from bs4 import BeautifulSoup
 import ssl
 from urllib.parse import quote
 
+logger = logging.getLogger(__name__)
+
+
+def parse_social_results(html: str) -> List[Dict[str, Any]]:
+    document = parse_html(html)
+    results = []
+    result_nodes = document.select('.result')
+
+    logger.debug(f"Bulunan sonuçlar: {len(result_nodes)}")
+
+    for result in result_nodes:
+        try:
+            title = result.select_one('.result__title')
+            link = result.select_one('.result__url')
+            snippet = result.select_one('.result__snippet')
+
+            if title and link:
+                results.append({
+                    #'title': title.text.strip(),
+                    'url': link.text().strip(),
+                    'description': snippet.text().strip() if snippet else '',
+                    #'mentions': self._find_mentions(snippet.text if snippet else ''),
+                    #'hashtags': self._find_hashtags(snippet.text if snippet else '')
+                })
+        except Exception as e:
+            continue
+
+    return results[:5]
+
+
 class SocialMediaCollector(BaseCollector):
-    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None):
-        super().__init__(ssl_context=ssl_context)
+    def __init__(self, ssl_context: Optional[ssl.SSLContext] = None, skip_seen: bool = False):
+        super().__init__(ssl_context=ssl_context, skip_seen=skip_seen)
         self.base_url = "https://duckduckgo.com/html/?q={}"
         
     async def collect(self, target: str) -> Dict[str, Any]:
@@ -36,16 +67,22 @@ class SocialMediaCollector(BaseCollector):
             }
         }
         
-        for query in queries:
-            try:
-                platform = query.split(':')[1].split()[0].split('.')[0]
-                search_results = await self._search_duckduckgo(query)
-                if search_results:
-                    results['platform_data'][platform] = search_results
-                    results['metadata']['successful_platforms'].append(platform)
-                    results['metadata']['total_results'] += len(search_results)
-            except Exception as e:
-                logging.error(f"Error searching {platform}: {str(e)}")
+        # Sorgular paralel gönderilir; DuckDuckGo hızı rate_limiter ile sınırlı
+        platforms = [query.split(':')[1].split()[0].split('.')[0] for query in queries]
+        responses = await asyncio.gather(
+            *(self._search_duckduckgo(query) for query in queries),
+            return_exceptions=True
+        )
+        
+        for platform, search_results in zip(platforms, responses):
+            if isinstance(search_results, Exception):
+                logging.error(f"Error searching {platform}: {str(search_results)}")
+                continue
+            search_results = self._filter_seen(target, search_results)
+            if search_results:
+                results['platform_data'][platform] = search_results
+                results['metadata']['successful_platforms'].append(platform)
+                results['metadata']['total_results'] += len(search_results)
         
         return results
     
@@ -60,42 +97,18 @@ class SocialMediaCollector(BaseCollector):
         }
         
         try:
-            async with self.session.get(url, headers=headers) as response:
-                if response.status == 200:
-                    html = await response.text()
-                    print(f"HTML alındı, uzunluk: {len(html)}")  # Debug
-                    return self._parse_results(html)
-                print(f"Status code: {response.status}")  # Debug
-                return []
+            status, html = await self._fetch(url, 'social', headers=headers)
+            if status == 200:
+                logger.debug(f"HTML alındı, uzunluk: {len(html)}")
+                return await parse_pool.run(parse_social_results, html)
+            logger.debug(f"Status code: {status}")
+            return []
         except Exception as e:
             logging.error(f"DuckDuckGo search error: {str(e)}")
             return []
 
     def _parse_results(self, html: str) -> List[Dict[str, Any]]:
-        soup = BeautifulSoup(html, 'html.parser')
-        results = []
-
-        # Debug için
-        print(f"Bulunan sonuçlar: {len(soup.select('.result'))}")
-
-        for result in soup.select('.result'):
-            try:
-                title = result.select_one('.result__title')
-                link = result.select_one('.result__url')
-                snippet = result.select_one('.result__snippet')
-                
-                if title and link:
-                    results.append({
-                        #'title': title.text.strip(),
-                        'url': link.text.strip(),
-                        'description': snippet.text.strip() if snippet else '',
-                        #'mentions': self._find_mentions(snippet.text if snippet else ''),
-                        #'hashtags': self._find_hashtags(snippet.text if snippet else '')
-                    })
-            except Exception as e:
-                continue
-
-        return results[:5]
+        return parse_social_results(html)
 
     def _find_mentions(self, text: str) -> List[str]:
         import re
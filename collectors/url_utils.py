@@ -0,0 +1,107 @@
+# collectors/url_utils.py
+import re
+from functools import lru_cache
+from urllib.parse import quote, unquote, urlsplit, urlunsplit
+
+# Aynı belgeyi farklı URL'lere dönüştüren izleme parametreleri
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'yclid', 'igshid', 'igsh', 'mc_cid', 'mc_eid',
+    'ref', 'ref_src', 'ref_url', 'referrer', 'si', 'spm', '_ga', '_gl', 'cmpid'
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'mtm_', 'hsa_')
+
+# Sadece belirli sitelerde paylaşım izi olan kısa parametreler
+HOST_TRACKING_PARAMS = {
+    'twitter.com': {'s', 't'},
+    'x.com': {'s', 't'}
+}
+
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# RFC 3986 unreserved karakterleri; bunların yüzde kodlaması her zaman çözülür
+_UNRESERVED = frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789-._~')
+# Bileşen içinde kodlanmadan kalabilecek ayrılmış karakterler
+_PATH_SAFE = "/:@!$&'()*+,;="
+_QUERY_SAFE = "/:@!$'()*+,;?"
+# Şema; ardından rakam geliyorsa şemasız 'host:port' sayılır
+_SCHEME_RE = re.compile(r'^([a-zA-Z][a-zA-Z0-9+.-]*):(?!\d)')
+
+
+@lru_cache(maxsize=65536)
+def canonicalize_url(url: str) -> str:
+    """Aynı belgeye işaret eden URL varyantlarını tek biçime indir.
+
+    Şema küçük harfe ve https'e, host küçük harfe çevrilir; 'www.' öneki,
+    varsayılan port, fragment, izleme parametreleri ve sondaki '/' atılır;
+    kalan sorgu parametreleri sıralanır. Yüzde kodlamasında sadece unreserved
+    karakterler çözülür, ayrılmış karakterlerin kodlaması korunur (a%2Fb ile
+    a/b farklı kalır). Şemasız URL'ler (ör. 'twitter.com/kullanici') https
+    kabul edilir; IPv6 host'lar köşeli parantezle yazılır. http(s) dışı
+    şemalar (mailto:, javascript: ...) ve ayrıştırılamayan URL'ler boşlukları
+    kırpılmış haliyle döndürülür.
+    """
+    original = url.strip()
+    match = _SCHEME_RE.match(original)
+    scheme = match.group(1).lower() if match else 'https'
+    if scheme not in DEFAULT_PORTS:
+        return original
+    url = f"{scheme}://{original[match.end() if match else 0:].lstrip('/')}"
+
+    try:
+        parts = urlsplit(url)
+    except ValueError:
+        return original
+    scheme = parts.scheme.lower()
+    if scheme == 'http':
+        scheme = 'https'
+
+    host = (parts.hostname or '').rstrip('.')
+    if host.startswith('www.'):
+        host = host[4:]
+    netloc = f"[{host}]" if ':' in host else host
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and port != DEFAULT_PORTS.get(parts.scheme.lower()):
+        netloc = f"{netloc}:{port}"
+
+    path = _normalize_escapes(parts.path, _PATH_SAFE)
+    path = re.sub(r'/{2,}', '/', path)
+    if path.endswith('/'):
+        path = path.rstrip('/')
+
+    host_params = HOST_TRACKING_PARAMS.get(host, ())
+    query = []
+    for pair in parts.query.split('&'):
+        if not pair:
+            continue
+        key, sep, value = pair.partition('=')
+        name = unquote(key.replace('+', ' '))
+        if _is_tracking_param(name) or name in host_params:
+            continue
+        query.append(_normalize_escapes(key, _QUERY_SAFE) + sep + _normalize_escapes(value, _QUERY_SAFE))
+
+    return urlunsplit((scheme, netloc, path, '&'.join(sorted(query)), ''))
+
+
+def _normalize_escapes(component: str, safe: str) -> str:
+    """Unreserved kaçışları çöz, diğer kaçışları büyük harfe çevir, izinsiz karakterleri kodla"""
+    def replace(match):
+        token = match.group(0)
+        if len(token) == 3:
+            char = chr(int(token[1:], 16))
+            return char if char in _UNRESERVED else token.upper()
+        return quote(token, safe='')
+
+    return _escape_re(safe).sub(replace, component)
+
+
+@lru_cache(maxsize=8)
+def _escape_re(safe: str):
+    return re.compile(r"%[0-9A-Fa-f]{2}|[^A-Za-z0-9\-._~" + re.escape(safe) + "]")
+
+
+def _is_tracking_param(name: str) -> bool:
+    name = name.lower()
+    return name in TRACKING_PARAMS or name.startswith(TRACKING_PREFIXES)
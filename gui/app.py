@@ -1,18 +1,12 @@
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox
-import asyncio
+import queue
 import sys
 import os
 from dotenv import load_dotenv
-import json
-import matplotlib
-matplotlib.use('TkAgg')
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-from matplotlib.figure import Figure
+import base64
 import ssl
 import certifi
-from datetime import datetime
 import logging
 
 # Logging ayarları
@@ -23,6 +17,16 @@ logger = logging.getLogger(__name__)
 load_dotenv()
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 
+# Collector başına süre sınırları (saniye)
+COLLECTOR_TIMEOUTS = {
+    'search': 30,
+    'social': 30,
+    'news': 30
+}
+
+# Olay kuyruğunun kontrol aralığı (ms)
+EVENT_POLL_MS = 50
+
 # Path ayarlaması
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
@@ -30,9 +34,17 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from collectors.search_collector import SearchCollector
 from collectors.social_collector import SocialMediaCollector
 from collectors.news_collector import NewsCollector
+from collectors.orchestrator import CollectionOrchestrator
+from collectors.session_manager import session_manager
+from collectors.parse_pool import parse_pool
 from analyzers.llm_analyzer import LLMAnalyzer
+from analyzers.dedup import Deduplicator, deduplicate_results
+from analyzers.llm_scheduler import llm_scheduler
 from analyzers.network_analyzer import NetworkAnalyzer
-from visualizer.network_visualizer import NetworkVisualizer
+from storage.entity_store import entity_store
+from storage.run_store import run_store
+from visualizer.render_worker import RenderPool
+from gui.background import BackgroundLoop
 
 class OsintApp:
     def __init__(self, root):
@@ -43,14 +55,28 @@ class OsintApp:
         # SSL context oluştur
         self.ssl_context = ssl.create_default_context(cafile=certifi.where())
 
+        # Async pipeline ayrı thread'deki kalıcı loop'ta çalışır; paylaşılan HTTP
+        # bağlantıları (DNS önbelleği, keep-alive) sonraki analizlerde yeniden kullanılır.
+        # Sonuçlar olay kuyruğu üzerinden Tk after() döngüsüne aktarılır.
+        self.worker = BackgroundLoop()
+        self.events = queue.Queue()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+
         if not OPENAI_API_KEY:
             messagebox.showerror("Hata", "OpenAI API anahtarı bulunamadı!\nLütfen .env dosyasını kontrol edin.")
             root.destroy()
             return
         
         # Analyzer ve Visualizer'ı başlat
-        self.network_analyzer = NetworkAnalyzer()
-        self.visualizer = NetworkVisualizer()
+        self.network_analyzer = NetworkAnalyzer(store=entity_store)
+        self.deduplicator = Deduplicator()
+        self.unique_results = {}
+        # Graf çizimi ayrı bir süreçte yapılır; tek işçi, yerleşimin çizimler
+        # arasında sıcak kalmasını sağlar
+        self.renderer = RenderPool(max_workers=1)
+        self.render_seq = 0
+        self.shown_seq = 0
+        self.graph_image = None
         
         # Ana container
         main_container = ttk.PanedWindow(root, orient='horizontal')
@@ -97,19 +123,17 @@ class OsintApp:
         self.vis_frame = ttk.LabelFrame(right_frame, text="İlişki Ağı")
         self.vis_frame.pack(padx=5, pady=5, fill='both', expand=True)
         
-        # Graf için Figure ve Canvas
-        self.figure = Figure(figsize=(10, 8), dpi=100)
-        self.canvas = FigureCanvasTkAgg(self.figure, master=self.vis_frame)
-        self.canvas.get_tk_widget().pack(fill='both', expand=True)
-
-        # Matplotlib toolbar
-        self.toolbar = NavigationToolbar2Tk(self.canvas, self.vis_frame)
-        self.toolbar.update()
+        # Graf, işçi süreçte çizilen bitmap olarak gösterilir
+        self.graph_label = ttk.Label(self.vis_frame, anchor='center')
+        self.graph_label.pack(fill='both', expand=True)
 
         # Tema ayarları
         style = ttk.Style()
         style.configure('TLabelframe', padding=5)
 
+        # Olay kuyruğunu dinlemeye başla
+        self.root.after(EVENT_POLL_MS, self.process_events)
+
     def show_loading(self, show=True):
         if show:
             self.loading_frame.pack(pady=5)
@@ -128,64 +152,144 @@ class OsintApp:
             
         self.result_text.delete(1.0, tk.END)
         self.stats_text.delete(1.0, tk.END)
-        self.figure.clear()
+        self.graph_label.configure(image='')
+        self.graph_image = None
+        # Önceki analizden gelecek çizimler gösterilmez
+        self.shown_seq = self.render_seq + 1
         self.show_loading(True)
         
-        asyncio.run(self.analyze(target))
+        self.worker.submit(self.analyze(target))
+
+    def on_close(self):
+        try:
+            self.worker.submit(session_manager.close()).result(timeout=5)
+            self.worker.submit(llm_scheduler.close()).result(timeout=5)
+        except Exception as e:
+            logger.error(f"Oturum kapatma hatası: {str(e)}")
+        finally:
+            self.worker.stop()
+            parse_pool.shutdown(wait=False)
+            self.renderer.shutdown(wait=False)
+            self.root.destroy()
+
+    def emit(self, kind: str, payload=None):
+        """Arka plan thread'inden arayüze olay gönder"""
+        self.events.put((kind, payload))
+
+    def process_events(self):
+        """Kuyruktaki olayları Tk thread'inde işle"""
+        try:
+            while True:
+                kind, payload = self.events.get_nowait()
+                handler = getattr(self, f'on_{kind}', None)
+                if handler:
+                    handler(payload)
+        except queue.Empty:
+            pass
+        self.root.after(EVENT_POLL_MS, self.process_events)
+
+    def on_collector_done(self, payload):
+        state = payload['state']
+        if state['status'] == 'ok':
+            line = f"✓ {payload['name'].capitalize()}: {payload['count']} kayıt ({state['elapsed']} sn)\n"
+        else:
+            line = f"✗ {payload['name'].capitalize()}: {state['status']} ({state['elapsed']} sn)\n"
+        self.stats_text.insert(tk.END, line)
+
+    def on_graph(self, network_data):
+        """Çizimi işçi sürece gönder; sonuç graph_image olayıyla gelir"""
+        self.render_seq += 1
+        seq = self.render_seq
+        size = (max(self.graph_label.winfo_width(), 400), max(self.graph_label.winfo_height(), 300))
+        logger.info("Görselleştirme başlatılıyor...")
+        future = self.renderer.submit(network_data, size=size)
+        future.add_done_callback(lambda f: self.emit('graph_image', (seq, f)))
+
+    def on_graph_image(self, payload):
+        seq, future = payload
+        # Daha yeni bir çizim gösterildiyse eski sonucu at
+        if seq < self.shown_seq:
+            return
+        try:
+            png = future.result()
+            self.graph_image = tk.PhotoImage(data=base64.b64encode(png))
+            self.graph_label.configure(image=self.graph_image)
+            self.shown_seq = seq
+            logger.info("Görselleştirme tamamlandı")
+        except Exception as e:
+            logger.error(f"Görselleştirme hatası: {str(e)}")
+            if seq == self.render_seq:
+                messagebox.showwarning("Uyarı", "İlişki ağı oluşturulurken hata oluştu.")
+
+    def on_stats(self, stats):
+        self.stats_text.delete(1.0, tk.END)
+        self.stats_text.insert(tk.END, stats)
+
+    def on_llm_chunk(self, text):
+        self.result_text.insert(tk.END, text)
+        self.result_text.see(tk.END)
+
+    def on_error(self, message):
+        messagebox.showerror("Hata", f"Analiz sırasında hata oluştu:\n{message}")
+
+    def on_done(self, _):
+        self.show_loading(False)
+
+    def on_collector_result(self, target: str, name: str, data: dict, state: dict):
+        """Arka plan loop'unda her collector bittiğinde çağrılır"""
+        self.emit('collector_done', {
+            'name': name,
+            'state': state,
+            'count': self._result_count(name, data)
+        })
+        if state['status'] != 'ok':
+            return
+
+        # Sadece yeni kanıt grafa eklenir; değişiklik varsa görünüm yenilenir.
+        # Tekilleştirici inceleme boyunca yaşar, kopyalar kaynaklar arasında da elenir
+        unique = deduplicate_results({name: data}, deduplicator=self.deduplicator).get(name, data)
+        self.unique_results[name] = unique
+        delta = self.network_analyzer.add_results(target, name, unique)
+        if delta.get('nodes') or delta.get('edges'):
+            self.emit('graph', self.network_analyzer.snapshot())
+        elif 'error' in delta:
+            logger.warning(f"İlişki ağı güncellenemedi ({name}): {delta['error']}")
+
+    def _result_count(self, name: str, data: dict) -> int:
+        if name == 'social':
+            return data.get('metadata', {}).get('total_results', 0)
+        return len(data.get('articles', []))
 
     async def analyze(self, target: str):
+        """Arka plan loop'unda çalışır; arayüzü yalnızca emit() ile günceller"""
         try:
-            collectors = {
-                'search': SearchCollector(ssl_context=self.ssl_context),
-                'social': SocialMediaCollector(ssl_context=self.ssl_context),
-                'news': NewsCollector(ssl_context=self.ssl_context)
-            }
+            orchestrator = CollectionOrchestrator()
+            orchestrator.register('search', SearchCollector(ssl_context=self.ssl_context), COLLECTOR_TIMEOUTS['search'])
+            orchestrator.register('social', SocialMediaCollector(ssl_context=self.ssl_context), COLLECTOR_TIMEOUTS['social'])
+            orchestrator.register('news', NewsCollector(ssl_context=self.ssl_context), COLLECTOR_TIMEOUTS['news'])
             
-            # Veri toplama
-            results = {}
-            for collector_name, collector in collectors.items():
-                try:
-                    results[collector_name] = await collector.collect(target)
-                    logger.info(f"{collector_name.capitalize()} verisi toplandı")
-                except Exception as e:
-                    logger.error(f"Hata ({collector_name}): {str(e)}")
-                    continue
+            # Veri toplama (tüm collector'lar paralel, her biri bittiğinde bildirilir
+            # ve sonuçları ilişki ağına eklenir)
+            self.network_analyzer.reset(target)
+            self.deduplicator = Deduplicator()
+            self.unique_results = {}
+            collection = await orchestrator.collect(
+                target,
+                on_result=lambda name, data, state: self.on_collector_result(target, name, data, state)
+            )
+            # Kaynaklar arası yakın kopya metinler tek kayıtta birleştirildi;
+            # rapor, grafla aynı tekilleştirilmiş sonuçları kullanır
+            results = {
+                name: self.unique_results.get(name, data)
+                for name, data in collection['results'].items()
+            }
+            collector_status = collection['status']
 
             logger.info("Veri toplama tamamlandı")
 
-            # Network analizi
-            network_data = self.network_analyzer.analyze(
-                target,
-                results.get('search', {}),
-                results.get('social', {}),
-                results.get('news', {})
-            )
-            
-            # Görselleştirme
-            try:
-                if network_data and 'nodes' in network_data:
-                    logger.info("Görselleştirme başlatılıyor...")
-                    self.visualizer.visualize(network_data, figure=self.figure)
-                    self.canvas.draw()
-                    logger.info("Görselleştirme tamamlandı")
-                else:
-                    logger.warning("İlişki ağı verisi oluşturulamadı")
-            except Exception as e:
-                logger.error(f"Görselleştirme hatası: {str(e)}")
-                messagebox.showwarning("Uyarı", "İlişki ağı oluşturulurken hata oluştu.")
+            # İlişki ağı collector'lar bittikçe güncellendi
+            network_data = self.network_analyzer.snapshot()
 
-            # LLM Analizi
-            analyzer = LLMAnalyzer(api_key=OPENAI_API_KEY)
-            analysis = await analyzer.analyze(
-                search_data=results.get('search', {}),
-                social_data=results.get('social', {}),
-                news_data=results.get('news', {})
-            )
-            
-            # Analiz sonucunu göster
-            if 'analiz' in analysis:
-                self.result_text.insert(tk.END, analysis['analiz'])
-            
             # İstatistikleri göster
             if network_data and 'metrics' in network_data:
                 metrics = network_data['metrics']
@@ -201,42 +305,54 @@ Bağlantı Tipleri:
 """
                 for node_type, count in metrics['node_types'].items():
                     stats += f"- {node_type.capitalize()}: {count}\n"
+
+                analytics = self.network_analyzer.analytics(top=5)
+                if 'error' not in analytics:
+                    stats += f"\nBileşen: {analytics['component_count']}, Topluluk: {analytics['community_count']}\n"
+                    stats += "Merkezi Düğümler:\n"
+                    for node, score in analytics['top_pagerank']:
+                        stats += f"- {node}: {score:.3f}\n"
+
+                stats += "\nKaynak Durumu:\n"
+                for collector_name, state in collector_status.items():
+                    stats += f"- {collector_name.capitalize()}: {state['status']} ({state['elapsed']} sn)\n"
                 
-                self.stats_text.insert(tk.END, stats)
+                self.emit('stats', stats)
+
+            # LLM Analizi (metin geldikçe rapor paneline yazılır)
+            analyzer = LLMAnalyzer(api_key=OPENAI_API_KEY)
+            analysis = await analyzer.analyze(
+                search_data=results.get('search', {}),
+                social_data=results.get('social', {}),
+                news_data=results.get('news', {}),
+                target=target,
+                on_chunk=lambda chunk: self.emit('llm_chunk', chunk)
+            )
 
             # Raporu kaydet
             self.save_report(target, results, analysis, network_data)
 
         except Exception as e:
             logger.error(f"Analiz hatası: {str(e)}")
-            messagebox.showerror("Hata", f"Analiz sırasında hata oluştu:\n{str(e)}")
+            self.emit('error', str(e))
         
         finally:
-            if 'collectors' in locals():
-                for collector in collectors.values():
-                    if hasattr(collector, 'session') and collector.session:
-                        await collector.close()
-            self.show_loading(False)
+            if 'orchestrator' in locals():
+                await orchestrator.close()
+            self.emit('done')
 
     def save_report(self, target: str, results: dict, analysis: dict, network_data: dict):
         try:
+            # Zaman bilgisi indekste tutulur; aynı içerikli rapor tekrar yazılmaz
             report = {
                 'target': target,
-                'timestamp': datetime.now().isoformat(),
                 'results': results,
                 'analysis': analysis,
                 'network_data': network_data
             }
-            
-            # reports klasörünü oluştur
-            os.makedirs('reports', exist_ok=True)
-            
-            # Raporu kaydet
-            filename = f"reports/report_{target}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
-            with open(filename, 'w', encoding='utf-8') as f:
-                json.dump(report, f, ensure_ascii=False, indent=2)
-                
-            logger.info(f"Rapor kaydedildi: {filename}")
+            run = run_store.save(target, report, kind='report')
+            status = 'yeni' if run['new'] else 'önceki raporla aynı'
+            logger.info(f"Rapor kaydedildi: {run['digest'][:12]} ({status})")
                 
         except Exception as e:
             logger.error(f"Rapor kaydetme hatası: {str(e)}")
@@ -0,0 +1,41 @@
+# gui/background.py
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Coroutine
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundLoop:
+    """Ayrı bir thread'de sürekli çalışan asyncio event loop'u.
+
+    Tk ana thread'i bloklanmadan coroutine'ler bu loop'a gönderilir; loop
+    uygulama boyunca yaşadığı için paylaşılan HTTP oturumları da analizler
+    arasında sıcak kalır.
+    """
+
+    def __init__(self, name: str = 'osint-async'):
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self.thread.start()
+
+    def _run(self):
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Coroutine'i arka plan loop'unda zamanla"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: float = 5):
+        """Loop'u durdur ve thread'in bitmesini bekle"""
+        if self.loop.is_closed():
+            return
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self.thread.join(timeout)
+        if self.thread.is_alive():
+            logger.warning("Arka plan loop'u zamanında durmadı")
+            return
+        self.loop.close()
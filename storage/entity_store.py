@@ -0,0 +1,310 @@
+# storage/entity_store.py
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# SQLite'ın tek sorguda izin verdiği parametre sayısının altında kalınır
+_CHUNK = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS investigations (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    started_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_investigations_target ON investigations(target, started_at);
+
+CREATE TABLE IF NOT EXISTS entities (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL UNIQUE,
+    type TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_entities_type ON entities(type);
+
+CREATE TABLE IF NOT EXISTS sources (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    first_seen REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS mentions (
+    entity_id INTEGER NOT NULL REFERENCES entities(id),
+    investigation_id INTEGER NOT NULL REFERENCES investigations(id),
+    PRIMARY KEY (entity_id, investigation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_mentions_investigation ON mentions(investigation_id);
+
+CREATE TABLE IF NOT EXISTS edges (
+    src INTEGER NOT NULL REFERENCES entities(id),
+    dst INTEGER NOT NULL REFERENCES entities(id),
+    investigation_id INTEGER NOT NULL REFERENCES investigations(id),
+    seen_at REAL NOT NULL,
+    PRIMARY KEY (src, dst, investigation_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_edges_dst ON edges(dst, src);
+CREATE INDEX IF NOT EXISTS idx_edges_investigation ON edges(investigation_id);
+
+CREATE TABLE IF NOT EXISTS edge_sources (
+    src INTEGER NOT NULL,
+    dst INTEGER NOT NULL,
+    investigation_id INTEGER NOT NULL,
+    source_id INTEGER NOT NULL REFERENCES sources(id),
+    PRIMARY KEY (src, dst, investigation_id, source_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_edge_sources_source ON edge_sources(source_id);
+"""
+
+
+class EntityStore:
+    """Tüm incelemelerin varlık ve ilişkilerini tutan kalıcı SQLite deposu.
+
+    Varlıklar isimle tekilleştirilir; yönsüz kenarlar (küçük id, büyük id)
+    sırasıyla ve inceleme başına bir kez saklanır. Bir kenarın inceleme
+    içindeki tüm kanıt URL'leri edge_sources üzerinden sources tablosuna
+    bağlanır. Komşu, yol ve birlikte geçme sorguları indeksler
+    üzerinden tüm incelemeler genelinde çalışır.
+    """
+
+    def __init__(self, path: str = 'data/entities.sqlite'):
+        self.path = path
+        self._conn = None
+        self._lock = threading.RLock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+            self._migrate(self._conn)
+        return self._conn
+
+    @staticmethod
+    def _migrate(db: sqlite3.Connection):
+        """Eski şemada edges.source_id'de tutulan tek kanıtı edge_sources'a taşı"""
+        columns = {row[1] for row in db.execute('PRAGMA table_info(edges)')}
+        if 'source_id' not in columns or db.execute('SELECT 1 FROM edge_sources LIMIT 1').fetchone():
+            return
+        with db:
+            db.execute("""
+                INSERT OR IGNORE INTO edge_sources
+                SELECT src, dst, investigation_id, source_id FROM edges WHERE source_id IS NOT NULL
+            """)
+
+    # Yazma
+
+    def start_investigation(self, target: str) -> int:
+        """Yeni inceleme kaydı aç ve id'sini döndür"""
+        with self._lock:
+            db = self._db()
+            cursor = db.execute('INSERT INTO investigations (target, started_at) VALUES (?, ?)',
+                                (target, time.time()))
+            db.commit()
+            return cursor.lastrowid
+
+    def add_delta(self, investigation_id: int, nodes: Iterable[Dict], edges: Iterable[Dict]):
+        """NetworkAnalyzer farkını (düğüm ve kenar sözlükleri) tek işlemde yaz.
+
+        Kenarın kanıtları 'evidence_urls' (yoksa 'evidence') alanından alınır;
+        mevcut bir kenar için gelen kayıt sadece yeni kanıtlarını ekler.
+        """
+        now = time.time()
+        with self._lock:
+            db = self._db()
+            with db:
+                for node in nodes:
+                    entity_id = self._upsert_entity(db, node['id'], node['type'], now)
+                    db.execute('INSERT OR IGNORE INTO mentions VALUES (?, ?)', (entity_id, investigation_id))
+
+                for edge in edges:
+                    src = self._entity_id(db, edge['source'], now)
+                    dst = self._entity_id(db, edge['target'], now)
+                    for entity_id in (src, dst):
+                        db.execute('INSERT OR IGNORE INTO mentions VALUES (?, ?)', (entity_id, investigation_id))
+                    key = (min(src, dst), max(src, dst), investigation_id)
+                    db.execute('INSERT OR IGNORE INTO edges (src, dst, investigation_id, seen_at) '
+                               'VALUES (?, ?, ?, ?)', key + (now,))
+                    urls = edge.get('evidence_urls') or ([edge['evidence']] if edge.get('evidence') else [])
+                    for url in urls:
+                        db.execute('INSERT OR IGNORE INTO edge_sources VALUES (?, ?, ?, ?)',
+                                   key + (self._source_id(db, url, now),))
+
+    def _upsert_entity(self, db: sqlite3.Connection, name: str, entity_type: str, now: float) -> int:
+        db.execute("""
+            INSERT INTO entities (name, type, first_seen, last_seen) VALUES (?, ?, ?, ?)
+            ON CONFLICT(name) DO UPDATE SET type = excluded.type, last_seen = excluded.last_seen
+        """, (name, entity_type, now, now))
+        return db.execute('SELECT id FROM entities WHERE name = ?', (name,)).fetchone()[0]
+
+    def _entity_id(self, db: sqlite3.Connection, name: str, now: float) -> int:
+        row = db.execute('SELECT id FROM entities WHERE name = ?', (name,)).fetchone()
+        if row:
+            return row[0]
+        return self._upsert_entity(db, name, 'unknown', now)
+
+    def _source_id(self, db: sqlite3.Connection, url: str, now: float) -> int:
+        db.execute('INSERT OR IGNORE INTO sources (url, first_seen) VALUES (?, ?)', (url, now))
+        return db.execute('SELECT id FROM sources WHERE url = ?', (url,)).fetchone()[0]
+
+    # Sorgular
+
+    def entity(self, name: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._db().execute(
+                'SELECT id, name, type, first_seen, last_seen FROM entities WHERE name = ?', (name,)
+            ).fetchone()
+        if row is None:
+            return None
+        return dict(zip(('id', 'name', 'type', 'first_seen', 'last_seen'), row))
+
+    def neighbors(self, name: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Varlığın tüm incelemelerdeki komşuları (kaç incelemede bağlandıklarıyla)"""
+        query = """
+            SELECT e.name, e.type, COUNT(DISTINCT n.investigation_id) AS investigations
+            FROM (
+                SELECT dst AS other, investigation_id FROM edges WHERE src = :id
+                UNION ALL
+                SELECT src AS other, investigation_id FROM edges WHERE dst = :id
+            ) AS n
+            JOIN entities e ON e.id = n.other
+            {filter}
+            GROUP BY e.id
+            ORDER BY investigations DESC, e.name
+        """.format(filter='WHERE e.type = :type' if entity_type else '')
+        with self._lock:
+            db = self._db()
+            entity_id = self._lookup(db, name)
+            if entity_id is None:
+                return []
+            rows = db.execute(query, {'id': entity_id, 'type': entity_type}).fetchall()
+        return [{'name': n, 'type': t, 'investigations': c} for n, t, c in rows]
+
+    def edge_sources(self, a: str, b: str, investigation_id: Optional[int] = None) -> List[str]:
+        """İki varlık arasındaki ilişkinin kanıt URL'leri (ilk görülme sırasıyla)"""
+        query = """
+            SELECT s.url FROM edge_sources es
+            JOIN sources s ON s.id = es.source_id
+            WHERE es.src = :src AND es.dst = :dst {filter}
+            GROUP BY s.id
+            ORDER BY s.first_seen, s.id
+        """.format(filter='AND es.investigation_id = :investigation' if investigation_id is not None else '')
+        with self._lock:
+            db = self._db()
+            ids = self._lookup(db, a), self._lookup(db, b)
+            if None in ids:
+                return []
+            rows = db.execute(query, {'src': min(ids), 'dst': max(ids),
+                                      'investigation': investigation_id}).fetchall()
+        return [url for url, in rows]
+
+    def common_neighbors(self, a: str, b: str, entity_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """İki varlığı (ör. iki hedefi) birbirine bağlayan ortak komşular"""
+        others = {item['name']: item for item in self.neighbors(b, entity_type)}
+        return [item for item in self.neighbors(a, entity_type) if item['name'] in others]
+
+    def find_path(self, a: str, b: str, max_depth: int = 4) -> Optional[List[str]]:
+        """İki varlık arasındaki en kısa yol (iki yönlü, seviye seviye BFS)"""
+        with self._lock:
+            db = self._db()
+            start, goal = self._lookup(db, a), self._lookup(db, b)
+            if start is None or goal is None:
+                return None
+            if start == goal:
+                return [a]
+
+            parents = [{start: None}, {goal: None}]
+            frontiers = [[start], [goal]]
+            for _ in range(max_depth):
+                # Her adımda küçük olan sınır genişletilir
+                side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+                next_frontier = []
+                for node, neighbor in self._expand(db, frontiers[side]):
+                    if neighbor in parents[side]:
+                        continue
+                    parents[side][neighbor] = node
+                    if neighbor in parents[1 - side]:
+                        return self._names(db, self._join_path(parents, neighbor))
+                    next_frontier.append(neighbor)
+                if not next_frontier:
+                    return None
+                frontiers[side] = next_frontier
+        return None
+
+    def cooccurrence(self, name: str, entity_type: Optional[str] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """Varlıkla aynı incelemelerde geçen diğer varlıklar, ortak inceleme sayısına göre"""
+        query = """
+            SELECT e.name, e.type, COUNT(*) AS shared
+            FROM mentions m1
+            JOIN mentions m2 ON m2.investigation_id = m1.investigation_id AND m2.entity_id != m1.entity_id
+            JOIN entities e ON e.id = m2.entity_id
+            WHERE m1.entity_id = :id {filter}
+            GROUP BY e.id
+            ORDER BY shared DESC, e.name
+            LIMIT :limit
+        """.format(filter='AND e.type = :type' if entity_type else '')
+        with self._lock:
+            db = self._db()
+            entity_id = self._lookup(db, name)
+            if entity_id is None:
+                return []
+            rows = db.execute(query, {'id': entity_id, 'type': entity_type, 'limit': limit}).fetchall()
+        return [{'name': n, 'type': t, 'shared_investigations': c} for n, t, c in rows]
+
+    def investigations(self, target: str) -> List[Dict[str, Any]]:
+        with self._lock:
+            rows = self._db().execute(
+                'SELECT id, started_at FROM investigations WHERE target = ? ORDER BY started_at', (target,)
+            ).fetchall()
+        return [{'id': i, 'target': target, 'started_at': t} for i, t in rows]
+
+    def _lookup(self, db: sqlite3.Connection, name: str) -> Optional[int]:
+        row = db.execute('SELECT id FROM entities WHERE name = ?', (name,)).fetchone()
+        return row[0] if row else None
+
+    def _expand(self, db: sqlite3.Connection, frontier: List[int]):
+        for i in range(0, len(frontier), _CHUNK):
+            chunk = frontier[i:i + _CHUNK]
+            marks = ','.join('?' * len(chunk))
+            yield from db.execute(f"""
+                SELECT DISTINCT src, dst FROM edges WHERE src IN ({marks})
+                UNION
+                SELECT DISTINCT dst, src FROM edges WHERE dst IN ({marks})
+            """, chunk + chunk)
+
+    @staticmethod
+    def _join_path(parents: List[Dict[int, Optional[int]]], meeting: int) -> List[int]:
+        forward = []
+        node = meeting
+        while node is not None:
+            forward.append(node)
+            node = parents[0][node]
+        forward.reverse()
+        node = parents[1][meeting]
+        while node is not None:
+            forward.append(node)
+            node = parents[1][node]
+        return forward
+
+    def _names(self, db: sqlite3.Connection, ids: List[int]) -> List[str]:
+        marks = ','.join('?' * len(ids))
+        names = dict(db.execute(f'SELECT id, name FROM entities WHERE id IN ({marks})', ids).fetchall())
+        return [names[i] for i in ids]
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+entity_store = EntityStore(path=os.getenv('OSINT_ENTITY_DB', 'data/entities.sqlite'))
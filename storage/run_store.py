@@ -0,0 +1,194 @@
+# storage/run_store.py
+import gzip
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Dict, IO, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Çalıştırmadan çalıştırmaya değişen ve içerik özetine katılmayan anahtarlar;
+# zaman bilgisi indekste tutulur
+VOLATILE_KEYS = ('timestamp', 'cached')
+
+# iterencode parçaları bu boyutta toplanıp sıkıştırıcıya verilir
+_WRITE_BUFFER = 64 * 1024
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    target TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    digest TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_runs_target ON runs(target, kind, created_at);
+
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    stored_size INTEGER NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def strip_volatile(value: Any, keys=VOLATILE_KEYS) -> Any:
+    """Sözlük yolları üzerindeki (listelere girmeden) değişken anahtarları çıkar.
+
+    Sadece kopyalanan sözlükler yeniden oluşturulur; listeler ve içerikleri paylaşılır.
+    """
+    if not isinstance(value, dict):
+        return value
+    return {key: strip_volatile(item, keys) for key, item in value.items() if key not in keys}
+
+
+class RunStore:
+    """Çalıştırma çıktıları için sıkıştırılmış, içerik adresli, ekleme tabanlı depo.
+
+    Her yük anahtarları sıralı, boşluksuz JSON olarak iterencode ile parça parça
+    gzip'e yazılır ve yazılırken SHA-256 özeti alınır; aynı içerik bir kez
+    saklanır. SQLite indeksi hedef, tür ve zamana göre çalıştırmaları bloblara
+    bağlar.
+    """
+
+    def __init__(self, root: str = 'data/runs'):
+        self.root = root
+        self.blob_dir = os.path.join(root, 'blobs')
+        self._conn = None
+        self._lock = threading.RLock()
+
+    def _db(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(self.blob_dir, exist_ok=True)
+            self._conn = sqlite3.connect(os.path.join(self.root, 'index.sqlite'), check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.executescript(SCHEMA)
+        return self._conn
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.blob_dir, digest[:2], f"{digest}.json.gz")
+
+    # Yazma
+
+    def save(self, target: str, payload: Any, kind: str = 'report') -> Dict[str, Any]:
+        """Yükü blob olarak yaz (içerik zaten varsa yeniden yazılmaz) ve indekse ekle"""
+        with self._lock:
+            db = self._db()
+            digest, size, stored_size, tmp_path = self._write_blob(strip_volatile(payload))
+
+            path = self._blob_path(digest)
+            new = not os.path.exists(path)
+            if new:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                os.replace(tmp_path, path)
+            else:
+                os.remove(tmp_path)
+
+            created_at = time.time()
+            with db:
+                db.execute('INSERT OR IGNORE INTO blobs VALUES (?, ?, ?)', (digest, size, stored_size))
+                cursor = db.execute('INSERT INTO runs (target, kind, created_at, digest) VALUES (?, ?, ?, ?)',
+                                    (target, kind, created_at, digest))
+
+        return {
+            'id': cursor.lastrowid,
+            'target': target,
+            'kind': kind,
+            'created_at': created_at,
+            'digest': digest,
+            'size': size,
+            'new': new
+        }
+
+    def _write_blob(self, payload: Any):
+        """Yükü geçici dosyaya sıkıştırarak akıt; (özet, ham boyut, disk boyutu, geçici yol)"""
+        encoder = json.JSONEncoder(ensure_ascii=False, sort_keys=True, separators=(',', ':'))
+        hasher = hashlib.sha256()
+        size = 0
+
+        fd, tmp_path = tempfile.mkstemp(dir=self.blob_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as raw, \
+                    gzip.GzipFile(fileobj=raw, mode='wb', compresslevel=6, mtime=0) as out:
+                buffer, buffered = [], 0
+                for chunk in encoder.iterencode(payload):
+                    buffer.append(chunk)
+                    buffered += len(chunk)
+                    if buffered >= _WRITE_BUFFER:
+                        size += self._flush(buffer, hasher, out)
+                        buffer, buffered = [], 0
+                size += self._flush(buffer, hasher, out)
+            return hasher.hexdigest(), size, os.path.getsize(tmp_path), tmp_path
+        except Exception:
+            os.remove(tmp_path)
+            raise
+
+    @staticmethod
+    def _flush(buffer: List[str], hasher, out) -> int:
+        data = ''.join(buffer).encode('utf-8')
+        hasher.update(data)
+        out.write(data)
+        return len(data)
+
+    # Okuma
+
+    def open_blob(self, digest: str) -> IO[bytes]:
+        """Blob'u açık (sıkıştırması çözülen) dosya olarak döndür; büyük yükler akışla okunabilir"""
+        return gzip.open(self._blob_path(digest), 'rb')
+
+    def load(self, digest: str) -> Any:
+        with self.open_blob(digest) as f:
+            return json.load(f)
+
+    def runs(self, target: Optional[str] = None, kind: Optional[str] = None,
+             limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Çalıştırmaları yeniden eskiye listele"""
+        query = 'SELECT r.id, r.target, r.kind, r.created_at, r.digest, b.size FROM runs r ' \
+                'JOIN blobs b ON b.digest = r.digest'
+        conditions, params = [], []
+        if target is not None:
+            conditions.append('r.target = ?')
+            params.append(target)
+        if kind is not None:
+            conditions.append('r.kind = ?')
+            params.append(kind)
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        query += ' ORDER BY r.created_at DESC, r.id DESC'
+        if limit is not None:
+            query += ' LIMIT ?'
+            params.append(limit)
+
+        with self._lock:
+            rows = self._db().execute(query, params).fetchall()
+        return [dict(zip(('id', 'target', 'kind', 'created_at', 'digest', 'size'), row)) for row in rows]
+
+    def latest(self, target: str, kind: str = 'report') -> Optional[Dict[str, Any]]:
+        """Hedefin en son çalıştırma kaydı (yoksa None)"""
+        rows = self.runs(target, kind, limit=1)
+        return rows[0] if rows else None
+
+    def stats(self) -> Dict[str, int]:
+        """Çalıştırma/blob sayıları, ham ve diskteki toplam boyut"""
+        with self._lock:
+            db = self._db()
+            runs = db.execute('SELECT COUNT(*) FROM runs').fetchone()[0]
+            blobs, size, stored = db.execute(
+                'SELECT COUNT(*), COALESCE(SUM(size), 0), COALESCE(SUM(stored_size), 0) FROM blobs'
+            ).fetchone()
+        return {'runs': runs, 'blobs': blobs, 'size': size, 'stored_size': stored}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+run_store = RunStore(root=os.getenv('OSINT_RUN_STORE', 'data/runs'))
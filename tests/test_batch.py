@@ -0,0 +1,206 @@
+import asyncio
+import copy
+import json
+
+import pytest
+
+import batch
+from storage.entity_store import EntityStore
+
+
+class FakeOrchestrator:
+    """Ağa çıkmadan hazır sonuç döndüren orchestrator; failing'deki hedefler hata verir.
+
+    seen verilirse haberler, skip_seen açık collector'lar gibi seen.filter_new'den geçirilir.
+    timed_out'taki collector'lar gerçek orchestrator gibi sonuçlardan çıkarılır.
+    """
+
+    def __init__(self, results, failing=(), seen=None, timed_out=()):
+        self.results = results
+        self.failing = set(failing)
+        self.seen = seen
+        self.timed_out = set(timed_out)
+        self.collected = []
+
+    async def collect(self, target):
+        self.collected.append(target)
+        if target in self.failing:
+            raise RuntimeError('bağlantı hatası')
+        results = copy.deepcopy(self.results)
+        if self.seen is not None and 'news' in results:
+            results['news']['articles'] = self.seen.filter_new(target, results['news']['articles'])
+        status = {name: {'status': 'timeout' if name in self.timed_out else 'ok'} for name in results}
+        results = {name: data for name, data in results.items() if name not in self.timed_out}
+        return {'results': results, 'status': status}
+
+    async def close(self):
+        pass
+
+
+RESULTS = {
+    'news': {'articles': [{
+        'url': 'https://www.milliyet.com.tr/haber/1',
+        'content': 'Ahmet Yılmaz ile Mehmet Demir görüştü ve açıklama yaptı.'
+    }]}
+}
+
+
+@pytest.fixture
+def runner_factory(tmp_path, monkeypatch):
+    monkeypatch.setattr(batch, 'entity_store', EntityStore(str(tmp_path / 'entities.sqlite')))
+
+    def make(orchestrator, **kwargs):
+        runner = batch.BatchRunner(str(tmp_path / 'out.jsonl'), str(tmp_path / 'out.checkpoint'),
+                                   concurrency=1, **kwargs)
+        runner.orchestrator = orchestrator
+        return runner
+
+    return make
+
+
+def read_lines(path):
+    with open(path, encoding='utf-8') as f:
+        return [json.loads(line) for line in f]
+
+
+def test_failed_targets_are_not_checkpointed(runner_factory, tmp_path):
+    runner = runner_factory(FakeOrchestrator(RESULTS, failing={'B'}))
+    asyncio.run(runner.run(['A', 'B']))
+
+    assert (runner.completed, runner.failed) == (1, 1)
+    assert read_lines(tmp_path / 'out.checkpoint') == ['A']
+    assert [record.get('error') is None for record in read_lines(tmp_path / 'out.jsonl')] == [True, False]
+
+    # Yeniden başlatmada sadece hatalı hedef tekrar denenir
+    orchestrator = FakeOrchestrator(RESULTS)
+    resumed = runner_factory(orchestrator)
+    asyncio.run(resumed.run(['A', 'B']))
+
+    assert orchestrator.collected == ['B']
+    assert read_lines(tmp_path / 'out.checkpoint') == ['A', 'B']
+
+
+def test_targets_without_collector_data_are_failed(runner_factory, tmp_path, monkeypatch):
+    from collectors.seen_index import SeenIndex
+
+    seen = SeenIndex(path=str(tmp_path / 'seen.bloom'), capacity=1000)
+    monkeypatch.setattr(batch, 'seen_index', seen)
+    runner = runner_factory(FakeOrchestrator(RESULTS, timed_out={'news'}), only_new=True)
+    asyncio.run(runner.run(['A', 'B']))
+
+    assert (runner.completed, runner.failed) == (0, 2)
+    assert read_lines(tmp_path / 'out.checkpoint') == []
+    assert all('news: timeout' in record['error'] for record in read_lines(tmp_path / 'out.jsonl'))
+    assert not seen.contains('A', RESULTS['news']['articles'][0]['url'])
+
+
+def test_only_new_marks_urls_after_record_is_written(runner_factory, tmp_path, monkeypatch):
+    from collectors.seen_index import SeenIndex
+
+    path = str(tmp_path / 'seen.bloom')
+    seen = SeenIndex(path=path, capacity=1000)
+    monkeypatch.setattr(batch, 'seen_index', seen)
+    url = RESULTS['news']['articles'][0]['url']
+
+    # Toplama sonrası hata: URL görüldü sayılmamalı
+    orchestrator = FakeOrchestrator(RESULTS, seen=seen)
+    runner = runner_factory(orchestrator, only_new=True)
+
+    async def failing_investigate(target):
+        await orchestrator.collect(target)
+        raise RuntimeError('analiz hatası')
+
+    runner.investigate = failing_investigate
+    asyncio.run(runner.run(['A']))
+    assert not seen.contains('A', url)
+
+    # Yeniden başlatmada hedef tekrar işlenir, URL'si yeni sayılır ve ancak
+    # kayıt yazıldıktan sonra işaretlenip diske kaydedilir
+    resumed = runner_factory(FakeOrchestrator(RESULTS, seen=seen), only_new=True)
+    asyncio.run(resumed.run(['A']))
+    assert resumed.completed == 1
+    assert read_lines(tmp_path / 'out.jsonl')[-1]['results']['news']['articles'][0]['url'] == url
+    assert SeenIndex(path=path, capacity=1000).contains('A', url)
+
+
+class FakeLLM:
+    def __init__(self):
+        self.contexts = []
+
+    async def analyze(self, **kwargs):
+        return {'analiz': 'ilk analiz'}
+
+    async def analyze_changes(self, diff, previous_analysis=None, **kwargs):
+        self.contexts.append(copy.deepcopy(previous_analysis))
+        return {'analiz': f"değişiklik {len(self.contexts)}"}
+
+
+def run_incremental(runner_factory, results_per_run, llm, orchestrator_kwargs=None):
+    records = []
+    for results in results_per_run:
+        runner = runner_factory(FakeOrchestrator(results, **(orchestrator_kwargs or {})), incremental=True)
+        runner.llm_analyzer = llm
+        records.append(asyncio.run(runner.investigate('A')))
+    return records
+
+
+@pytest.fixture
+def run_store(tmp_path, monkeypatch):
+    from storage.run_store import RunStore
+
+    store = RunStore(root=str(tmp_path / 'runs'))
+    monkeypatch.setattr(batch, 'run_store', store)
+    return store
+
+
+def with_extra_sentence(results, sentence):
+    changed = copy.deepcopy(results)
+    changed['news']['articles'][0]['content'] += sentence
+    return changed
+
+
+def test_incremental_analysis_keeps_every_update(runner_factory, run_store):
+    second = with_extra_sentence(RESULTS, ' Ayşe Kaya da katıldı.')
+    third = with_extra_sentence(second, ' Toplantı uzadı.')
+    llm = FakeLLM()
+    analyses = [record['analysis'] for record in
+                run_incremental(runner_factory, (RESULTS, second, second, third), llm)]
+
+    first_update = {'analiz': 'değişiklik 1'}
+    assert analyses[0] == {'analiz': 'ilk analiz'}
+    assert analyses[1] == {'analiz': 'ilk analiz', 'updates': [first_update]}
+    # Değişmeyen çalıştırma geçmişi korur, yeni güncelleme eklemez
+    assert analyses[2] == analyses[1]
+    assert analyses[3] == {'analiz': 'ilk analiz', 'updates': [first_update, {'analiz': 'değişiklik 2'}]}
+    # Üçüncü değişiklik analizi önceki güncellemeyi bağlam olarak alır
+    assert llm.contexts[1]['updates'] == [first_update]
+
+
+def test_legacy_changes_block_becomes_first_update():
+    analysis = batch.BatchRunner._carry_analysis({'analiz': 'A', 'changes': {'analiz': 'C'}})
+    assert analysis == {'analiz': 'A', 'updates': [{'analiz': 'C'}]}
+
+
+def test_timed_out_collector_keeps_previous_section(runner_factory, run_store):
+    results = copy.deepcopy(RESULTS)
+    results['social'] = {'platform_data': {'twitter': [
+        {'url': 'https://twitter.com/ornek/status/1', 'description': '@ornek_hesap paylaşımı'}
+    ]}}
+    llm = FakeLLM()
+    first, second, third = run_incremental(runner_factory, (results,), llm) + \
+        run_incremental(runner_factory, (results,), llm, {'timed_out': {'news'}}) + \
+        run_incremental(runner_factory, (results,), llm)
+
+    # Haberler zaman aşımına uğradı: silinmiş sayılmaz, ilişkiler ve rapor korunur
+    assert second['carried_over'] == ['news']
+    assert second['results']['news'] == first['results']['news']
+    assert second['changes']['unchanged']
+    assert second['changes']['removed_entities'] == []
+    assert {node['id'] for node in second['network_data']['nodes']} == \
+        {node['id'] for node in first['network_data']['nodes']}
+    assert llm.contexts == []
+
+    # Sonraki çalıştırmada haberler "eklenmiş" görünmez
+    assert 'carried_over' not in third
+    assert third['changes']['unchanged']
+    assert third['changes']['added_entities'] == []
@@ -3,14 +3,16 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 import asyncio
-import json
 import ssl
 import certifi
-from datetime import datetime
 from collectors.search_collector import SearchCollector
 from collectors.social_collector import SocialMediaCollector
 from collectors.news_collector import NewsCollector
+from collectors.orchestrator import CollectionOrchestrator
+from collectors.session_manager import session_manager
 from analyzers.llm_analyzer import LLMAnalyzer
+from analyzers.dedup import deduplicate_results
+from storage.run_store import run_store
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -23,50 +25,47 @@ async def analyze_target(name: str = "Abdullah ocalan"):
     openai_key = os.getenv('OPENAI_API_KEY')
     
     # Collectors ve Analyzer başlat
-    collectors = {
-        'search': SearchCollector(ssl_context=ssl_context),
-        'social': SocialMediaCollector(ssl_context=ssl_context),
-        'news': NewsCollector(ssl_context=ssl_context)
-    }
+    orchestrator = CollectionOrchestrator(default_timeout=30)
+    orchestrator.register('search', SearchCollector(ssl_context=ssl_context))
+    orchestrator.register('social', SocialMediaCollector(ssl_context=ssl_context))
+    orchestrator.register('news', NewsCollector(ssl_context=ssl_context))
     
     analyzer = LLMAnalyzer(api_key=openai_key)
     
     try:
-        # Veri toplama
-        results = {}
-        for collector_name, collector in collectors.items():
-            print(f"{collector_name.capitalize()} verisi toplanıyor...")
-            try:
-                results[collector_name] = await collector.collect(name)
-                print(f"✓ {collector_name.capitalize()} verisi toplandı")
-            except Exception as e:
-                print(f"✗ Hata: {collector_name}: {str(e)}")
-                results[collector_name] = {"error": str(e)}
+        # Veri toplama (tüm collector'lar paralel)
+        print("Veriler toplanıyor...")
+        collection = await orchestrator.collect(name)
+        results = collection['results']
+        for collector_name, state in collection['status'].items():
+            if state['status'] == 'ok':
+                print(f"✓ {collector_name.capitalize()} verisi toplandı ({state['elapsed']} sn)")
+            else:
+                error = state.get('error', 'zaman aşımı')
+                print(f"✗ Hata: {collector_name}: {error}")
+                results[collector_name] = {"error": error}
         
-        # Verileri kaydet
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        os.makedirs('outputs', exist_ok=True)
-        
-        raw_data_file = f'outputs/raw_data_{name.replace(" ", "_")}_{timestamp}.json'
-        with open(raw_data_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, ensure_ascii=False, indent=2)
-            
-        print(f"\nHam veriler kaydedildi: {raw_data_file}")
+        # Verileri kaydet (aynı içerik depoda bir kez tutulur)
+        raw_run = run_store.save(name, results, kind='raw_data')
+        print(f"\nHam veriler kaydedildi: {raw_run['digest'][:12]}")
         
+        # Yakın kopya metinleri birleştir
+        unique_results = deduplicate_results(results)
+
         # LLM Analizi
         print("\nLLM Analizi başlatılıyor...")
         analysis = await analyzer.analyze(
-            search_data=results.get('search', {}),
-            social_data=results.get('social', {}),
-            news_data=results.get('news', {})
+            search_data=unique_results.get('search', {}),
+            social_data=unique_results.get('social', {}),
+            news_data=unique_results.get('news', {}),
+            target=name,
+            on_chunk=lambda chunk: print(chunk, end='', flush=True)
         )
+        print()
         
         # Analiz sonuçlarını kaydet
-        analysis_file = f'outputs/analysis_{name.replace(" ", "_")}_{timestamp}.json'
-        with open(analysis_file, 'w', encoding='utf-8') as f:
-            json.dump(analysis, f, ensure_ascii=False, indent=2)
-            
-        print(f"Analiz sonuçları kaydedildi: {analysis_file}")
+        analysis_run = run_store.save(name, analysis, kind='analysis')
+        print(f"Analiz sonuçları kaydedildi: {analysis_run['digest'][:12]}")
         
         return {
             'raw_data': results,
@@ -79,9 +78,9 @@ async def analyze_target(name: str = "Abdullah ocalan"):
     
     finally:
         # Session'ları temizle
-        for collector in collectors.values():
-            if hasattr(collector, 'session') and collector.session:
-                await collector.close()
+        await orchestrator.close()
+        await session_manager.close()
+        await analyzer.scheduler.close()
 
 if __name__ == "__main__":
     asyncio.run(analyze_target())
\ No newline at end of file
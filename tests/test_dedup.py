@@ -0,0 +1,64 @@
+import json
+import os
+
+from analyzers.dedup import Deduplicator, deduplicate_results, jaccard, shingles
+
+SAMPLE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                      'outputs', 'raw_data_Abdullah_ocalan_20241226_041200.json')
+
+
+def load_sample():
+    with open(SAMPLE, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def test_sample_near_duplicates_are_merged():
+    results = deduplicate_results(load_sample())
+
+    sources = {url for section in ('search', 'news') for article in results[section]['articles']
+               if len(article['sources']) > 1 for url in article['sources']}
+    # Tırnak/kesme işareti ve kelime farkları olan aynı açıklama
+    assert {'https://www.hurriyet.com.tr/gundem/dem-partinin-ocalan-basvurusu-bakan-tunctan-aciklama-42606993',
+            'https://www.milliyet.com.tr/gundem/ocalan-basvurusuna-makul-surede-yanit-verilir-7244952'} <= sources
+    # Satır sonu tirelemesi farklı aynı PDF metni
+    assert {'http://www.freedom-for-ocalan.com/english/download/ocalan_torture_eng.pdf',
+            'https://www.freeocalan.org/assets/downloads/english/flyer/EN-the-ocalan-case_2009.pdf'} <= sources
+    assert len(results['news']['articles']) < len(load_sample()['news']['articles'])
+
+
+def test_distinct_snippets_are_kept():
+    a = 'Adalet Bakanı Yılmaz Tunç, AK Parti Grup Toplantısı öncesi konuştu ve açıklama yaptı.'
+    b = 'Diyarbakır\'da yürüyüş yapmak isteyen gruba polis müdahale etti, 55 kişi gözaltına alındı.'
+    assert jaccard(shingles(a), shingles(b)) < 0.2
+
+    deduplicator = Deduplicator()
+    assert deduplicator.keep({'content': a}, 'content')
+    assert deduplicator.keep({'content': b}, 'content')
+
+
+def test_small_edits_are_caught():
+    text = ('Adalet Bakanı Yılmaz Tunç, DEM Parti’nin görüşme talebine ilişkin, '
+            '“Makul bir sürede yanıtı verilir” ifadelerini kullandı.')
+    edits = [
+        text.replace('’', "'").replace('“', '"').replace('”', '"'),
+        text.replace('Makul', 'Uygun'),
+        text.rsplit(' ', 3)[0]
+    ]
+    for edited in edits:
+        deduplicator = Deduplicator()
+        original = {'content': text, 'url': 'https://a.com/1'}
+        assert deduplicator.keep(original, 'content')
+        assert not deduplicator.keep({'content': edited, 'url': 'https://b.com/2'}, 'content')
+        assert original['sources'] == ['https://a.com/1', 'https://b.com/2']
+
+
+def test_deduplicator_is_shared_across_calls():
+    article = {'url': 'https://a.com/1', 'content': 'Ahmet Yılmaz ile Mehmet Demir bugün Ankara\'da görüştü ve açıklama yaptı.'}
+    post = {'url': 'https://twitter.com/x/1', 'description': article['content']}
+    deduplicator = Deduplicator()
+
+    news = deduplicate_results({'news': {'articles': [article]}}, deduplicator=deduplicator)
+    social = deduplicate_results({'social': {'platform_data': {'twitter': [post]}}}, deduplicator=deduplicator)
+
+    assert social['social']['platform_data']['twitter'] == []
+    assert news['news']['articles'][0]['sources'] == ['https://a.com/1', 'https://twitter.com/x/1']
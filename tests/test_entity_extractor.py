@@ -0,0 +1,21 @@
+from analyzers.entity_extractor import EntityExtractor
+
+
+def test_group_does_not_start_mid_word():
+    extractor = EntityExtractor()
+    text = 'Yeni iPhone Group tanıtıldı, ardından Türkiye Fan Group kuruldu.'
+
+    assert extractor.extract(text, kinds=('social_group',))['social_group'] == ['Türkiye Fan Group']
+    assert extractor.extract('eGreen Party', kinds=('organization',))['organization'] == []
+    assert extractor.extract('Bugün Green Party açıklama yaptı', kinds=('organization',))['organization'] == [
+        'Bugün Green Party']
+
+
+def test_extract_many_matches_single_texts():
+    extractor = EntityExtractor()
+    texts = ['@hakan ve Ahmet Yılmaz görüştü', '', 'Mehmet Demir ile @ayse', 'Ahmet Yılmaz tekrar']
+
+    assert extractor.extract_many(texts) == [extractor.extract(text) for text in texts]
+    assert extractor.extract(texts[0]) == {
+        'handle': ['@hakan'], 'social_group': [], 'organization': [], 'person': ['Ahmet Yılmaz']
+    }
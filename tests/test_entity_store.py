@@ -0,0 +1,130 @@
+import sqlite3
+
+import pytest
+
+from analyzers.network_analyzer import NetworkAnalyzer
+from storage.entity_store import EntityStore
+
+
+def node(name, node_type='person'):
+    return {'id': name, 'type': node_type}
+
+
+def edge(a, b, *urls):
+    return {'source': a, 'target': b, 'evidence': urls[0], 'evidence_urls': list(urls)} if urls else \
+        {'source': a, 'target': b}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = EntityStore(str(tmp_path / 'entities.sqlite'))
+    yield store
+    store.close()
+
+
+def investigate(store, target, nodes, edges):
+    investigation = store.start_investigation(target)
+    store.add_delta(investigation, [node(target, 'target')] + nodes, edges)
+    return investigation
+
+
+@pytest.fixture
+def populated(store):
+    # Hedef A -- X -- Y -- Hedef B; Z iki incelemede de A'ya bağlı
+    investigate(store, 'Hedef A', [node('X'), node('Z'), node('milliyet.com.tr', 'news')], [
+        edge('Hedef A', 'X', 'https://a/1'),
+        edge('Hedef A', 'Z', 'https://a/2'),
+        edge('Hedef A', 'milliyet.com.tr', 'https://a/1', 'https://a/2'),
+    ])
+    investigate(store, 'Hedef A', [node('Z')], [edge('Z', 'Hedef A', 'https://a/3')])
+    investigate(store, 'Hedef B', [node('Y'), node('Z')], [
+        edge('Hedef B', 'Y', 'https://b/1'),
+        edge('X', 'Y', 'https://b/1'),
+        edge('Hedef B', 'Z'),
+    ])
+    return store
+
+
+def test_neighbors(populated):
+    neighbors = populated.neighbors('Hedef A')
+
+    assert neighbors[0] == {'name': 'Z', 'type': 'person', 'investigations': 2}
+    assert {item['name'] for item in neighbors} == {'X', 'Z', 'milliyet.com.tr'}
+    assert populated.neighbors('Hedef A', entity_type='news') == [
+        {'name': 'milliyet.com.tr', 'type': 'news', 'investigations': 1}
+    ]
+    assert [item['name'] for item in populated.common_neighbors('Hedef A', 'Hedef B')] == ['Z']
+    assert populated.neighbors('bilinmeyen') == []
+
+
+def test_find_path(populated):
+    assert populated.find_path('Hedef A', 'Y') == ['Hedef A', 'X', 'Y']
+    assert populated.find_path('Hedef A', 'Hedef B') == ['Hedef A', 'Z', 'Hedef B']
+    assert populated.find_path('X', 'X') == ['X']
+    assert populated.find_path('milliyet.com.tr', 'Y', max_depth=1) is None
+    assert populated.find_path('Hedef A', 'bilinmeyen') is None
+
+
+def test_cooccurrence(populated):
+    shared = {item['name']: item['shared_investigations'] for item in populated.cooccurrence('Z')}
+
+    assert shared['Hedef A'] == 2
+    assert shared['Hedef B'] == 1
+    assert 'Z' not in shared
+    assert [item['name'] for item in populated.cooccurrence('Z', entity_type='target', limit=1)] == ['Hedef A']
+
+
+def test_edge_keeps_every_evidence_url(populated):
+    assert populated.edge_sources('milliyet.com.tr', 'Hedef A') == ['https://a/1', 'https://a/2']
+    assert populated.edge_sources('Hedef A', 'Z') == ['https://a/2', 'https://a/3']
+    investigation = populated.investigations('Hedef A')[1]['id']
+    assert populated.edge_sources('Hedef A', 'Z', investigation_id=investigation) == ['https://a/3']
+    assert populated.edge_sources('Hedef B', 'Z') == []
+
+
+def test_add_results_persists_evidence_added_to_existing_edges(store):
+    analyzer = NetworkAnalyzer(store=store)
+    analyzer.reset('Hedef Kisi')
+    first = {'articles': [{'url': 'https://www.milliyet.com.tr/haber/1',
+                           'content': 'Hedef Kisi dün Ahmet Yılmaz ile görüştü.'}]}
+    second = {'articles': [{'url': 'https://www.hurriyet.com.tr/haber/2',
+                            'content': 'Ahmet Yılmaz açıklama yaptı.'},
+                           {'url': 'https://www.milliyet.com.tr/haber/3',
+                            'content': 'Ahmet Yılmaz yine konuştu.'}]}
+    analyzer.add_results('Hedef Kisi', 'news', first)
+    delta = analyzer.add_results('Hedef Kisi', 'news', second)
+
+    assert [e['evidence'] for e in delta['evidence'] if e['target'] == 'Ahmet Yılmaz'] == [
+        'https://www.hurriyet.com.tr/haber/2', 'https://www.milliyet.com.tr/haber/3'
+    ]
+    assert store.edge_sources('Hedef Kisi', 'Ahmet Yılmaz') == [
+        'https://www.milliyet.com.tr/haber/1',
+        'https://www.hurriyet.com.tr/haber/2',
+        'https://www.milliyet.com.tr/haber/3'
+    ]
+    assert store.edge_sources('Hedef Kisi', 'milliyet.com.tr') == [
+        'https://www.milliyet.com.tr/haber/1', 'https://www.milliyet.com.tr/haber/3'
+    ]
+
+
+def test_legacy_single_source_edges_are_migrated(tmp_path):
+    path = str(tmp_path / 'legacy.sqlite')
+    db = sqlite3.connect(path)
+    db.executescript("""
+        CREATE TABLE entities (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE, type TEXT NOT NULL,
+                               first_seen REAL NOT NULL, last_seen REAL NOT NULL);
+        CREATE TABLE sources (id INTEGER PRIMARY KEY, url TEXT NOT NULL UNIQUE, first_seen REAL NOT NULL);
+        CREATE TABLE edges (src INTEGER NOT NULL, dst INTEGER NOT NULL, investigation_id INTEGER NOT NULL,
+                            source_id INTEGER, seen_at REAL NOT NULL,
+                            PRIMARY KEY (src, dst, investigation_id)) WITHOUT ROWID;
+        INSERT INTO entities VALUES (1, 'A', 'target', 0, 0), (2, 'B', 'person', 0, 0);
+        INSERT INTO sources VALUES (1, 'https://eski/1', 0);
+        INSERT INTO edges VALUES (1, 2, 1, 1, 0);
+    """)
+    db.commit()
+    db.close()
+
+    store = EntityStore(path)
+    store.add_delta(1, [], [edge('A', 'B', 'https://yeni/2')])
+    assert store.edge_sources('A', 'B') == ['https://eski/1', 'https://yeni/2']
+    store.close()
@@ -0,0 +1,59 @@
+import networkx as nx
+import numpy as np
+
+from analyzers.graph_analytics import (analyze_graph, approximate_betweenness, connected_components,
+                                       label_propagation, pagerank, to_sparse)
+
+
+def small_graph():
+    graph = nx.karate_club_graph()
+    # İzole düğüm ve ayrı bir bileşen (çıkışı olmayan düğüm ve bileşen sayısı için)
+    graph.add_edge(100, 101)
+    graph.add_node(200)
+    return graph
+
+
+def test_pagerank_matches_networkx():
+    graph = small_graph()
+    adjacency, nodes = to_sparse(graph)
+    # to_sparse ağırlıkları yok sayar; karate_club'daki 'weight' karşılaştırmaya katılmamalı
+    expected = nx.pagerank(graph, weight=None, tol=1e-10)
+
+    scores = pagerank(adjacency, tol=1e-10, max_iter=500)
+    assert np.allclose(scores, [expected[node] for node in nodes], atol=1e-6)
+
+
+def test_betweenness_matches_networkx_when_all_sources_sampled():
+    graph = small_graph()
+    adjacency, nodes = to_sparse(graph)
+    expected = nx.betweenness_centrality(graph)
+
+    scores = approximate_betweenness(adjacency, samples=len(nodes), batch_size=8, seed=0)
+    assert np.allclose(scores, [expected[node] for node in nodes], atol=1e-9)
+
+
+def test_components_and_communities():
+    graph = small_graph()
+    adjacency, nodes = to_sparse(graph)
+
+    components = connected_components(adjacency)
+    assert len(set(components)) == nx.number_connected_components(graph) == 3
+
+    communities = label_propagation(adjacency, seed=0)
+    index = {node: i for i, node in enumerate(nodes)}
+    # Topluluklar bileşen sınırlarını aşmaz
+    assert communities[index[100]] == communities[index[101]]
+    assert communities[index[100]] != communities[index[0]]
+
+
+def test_analyze_graph_accepts_network_data():
+    network_data = {
+        'nodes': [{'id': 'Hedef'}, {'id': 'A'}, {'id': 'B'}],
+        'edges': [{'source': 'Hedef', 'target': 'A'}, {'source': 'Hedef', 'target': 'B'}]
+    }
+    result = analyze_graph(network_data, top=1)
+
+    assert result['top_pagerank'][0][0] == 'Hedef'
+    assert result['top_betweenness'][0][0] == 'Hedef'
+    assert result['component_count'] == 1
+    assert analyze_graph({'nodes': [], 'edges': []})['component_count'] == 0
@@ -0,0 +1,12 @@
+import pytest
+
+from collectors.html_extract import BACKENDS, parse_html
+
+
+@pytest.mark.parametrize('backend', list(BACKENDS))
+@pytest.mark.parametrize('html', ['', '   \n ', '<!-- x -->', '<!-- a --> <!-- b -->'])
+def test_empty_documents_parse_on_every_backend(backend, html):
+    document = parse_html(html, backend=backend)
+
+    assert document.text(strip=True) == ''
+    assert document.select('a') == []
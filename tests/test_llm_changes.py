@@ -0,0 +1,46 @@
+import asyncio
+
+from analyzers.llm_analyzer import MAX_REMOVED_CHARS, MAX_UPDATES_CHARS, LLMAnalyzer
+from analyzers.run_diff import diff_results
+
+
+def capture_prompts(monkeypatch):
+    analyzer = LLMAnalyzer(api_key='test')
+    prompts = []
+
+    async def fake_stream(user_content, use_cache=None, result=None):
+        prompts.append(user_content)
+        yield ''
+
+    monkeypatch.setattr(analyzer, '_stream', fake_stream)
+    return analyzer, prompts
+
+
+def test_removed_sources_list_item_text_and_url(monkeypatch):
+    analyzer, prompts = capture_prompts(monkeypatch)
+    long_text = 'Ahmet Yılmaz açıklama yaptı. ' * 20
+    previous = {
+        'news': {'articles': [{'url': 'https://www.milliyet.com.tr/haber/1', 'content': long_text}]},
+        'social': {'platform_data': {'twitter': [
+            {'url': 'https://twitter.com/ornek/status/1', 'description': '@ornek_hesap paylaşımı'}
+        ]}}
+    }
+    diff = diff_results(previous, {'news': {'articles': []}, 'social': {'platform_data': {'twitter': []}}})
+    asyncio.run(analyzer.analyze_changes(diff))
+
+    removed = prompts[0].split('KALDIRILAN KAYNAKLAR:\n')[1].split('\n\n')[0].splitlines()
+    assert removed[0].startswith('- Ahmet Yılmaz açıklama yaptı.')
+    assert removed[0].endswith('… (https://www.milliyet.com.tr/haber/1)')
+    assert len(removed[0]) < MAX_REMOVED_CHARS + 50
+    assert removed[1] == '- @ornek_hesap paylaşımı (https://twitter.com/ornek/status/1)'
+
+
+def test_previous_updates_are_included_newest_first_within_budget(monkeypatch):
+    analyzer, prompts = capture_prompts(monkeypatch)
+    updates = [{'analiz': 'eski ' + 'x' * MAX_UPDATES_CHARS}, {'analiz': 'ikinci'}, {'analiz': 'üçüncü'}]
+    previous = {'analiz': 'ilk analiz', 'updates': updates}
+    asyncio.run(analyzer.analyze_changes(diff_results({}, {}), previous_analysis=previous))
+
+    section = prompts[0].split('SONRAKİ GÜNCELLEMELER:\n\n')[1].split('\n\n')[:2]
+    assert section == ['- ikinci', '- üçüncü']
+    assert 'eski' not in prompts[0]
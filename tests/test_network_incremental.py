@@ -0,0 +1,77 @@
+from analyzers.network_analyzer import NetworkAnalyzer
+from analyzers.run_diff import diff_results
+from batch import BatchRunner
+
+TARGET = 'Hedef Kisi'
+
+PREVIOUS = {
+    'news': {'articles': [
+        {'url': 'https://www.milliyet.com.tr/haber/1',
+         'content': 'Hedef Kisi dün Ahmet Yılmaz ile görüştü.'},
+        {'url': 'https://www.hurriyet.com.tr/haber/2?utm_source=x',
+         'content': 'Ahmet Yılmaz ve Mehmet Demir açıklama yaptı.'}
+    ]},
+    'social': {'platform_data': {'twitter': [
+        {'url': 'https://twitter.com/ornek/status/1',
+         'description': '@ornek_hesap paylaşımı Türkiye Fan Group sayfasında'}
+    ]}},
+    'search': {'articles': []}
+}
+
+# Hürriyet haberi ve tek Twitter gönderisi silindi, Milliyet haberi değişti
+CURRENT = {
+    'news': {'articles': [
+        {'url': 'https://www.milliyet.com.tr/haber/1',
+         'content': 'Hedef Kisi dün Ahmet Yılmaz ve Ayşe Kaya ile görüştü.'}
+    ]},
+    'social': {'platform_data': {'twitter': []}},
+    'search': {'articles': []}
+}
+
+
+def full(results):
+    return NetworkAnalyzer().analyze(TARGET, results['search'], results['social'], results['news'])
+
+
+def incremental(previous, current):
+    diff = diff_results(previous, current)
+    runner = BatchRunner.__new__(BatchRunner)
+    return runner._update_network(NetworkAnalyzer(), TARGET, {'network_data': full(previous)}, diff)
+
+
+def graph_sets(network_data):
+    nodes = {(node['id'], node['type']) for node in network_data['nodes']}
+    edges = {(frozenset((edge['source'], edge['target'])), frozenset(edge.get('evidence_urls', [])))
+             for edge in network_data['edges']}
+    return nodes, edges
+
+
+def test_incremental_matches_full_analysis():
+    expected = full(CURRENT)
+    result = incremental(PREVIOUS, CURRENT)
+
+    assert sorted(node['id'] for node in result['nodes']) == ['Ahmet Yılmaz', 'Ayşe Kaya', TARGET,
+                                                              'milliyet.com.tr']
+    assert graph_sets(result) == graph_sets(expected)
+    assert result['metrics'] == expected['metrics']
+
+
+def test_edges_keep_every_evidence_url():
+    network_data = full(PREVIOUS)
+    edge = next(edge for edge in network_data['edges'] if 'Ahmet Yılmaz' in (edge['source'], edge['target']))
+
+    assert edge['evidence'] == 'https://www.milliyet.com.tr/haber/1'
+    assert len(edge['evidence_urls']) == 2
+
+    # Sadece bir haber silinirse ilişki diğer kanıtla korunur (kanonik URL eşleşmesi)
+    analyzer = NetworkAnalyzer()
+    loaded = analyzer.load_snapshot(TARGET, network_data,
+                                    exclude_evidence=['https://www.hurriyet.com.tr/haber/2'])
+    edges = {frozenset((e['source'], e['target'])): e for e in loaded['edges']}
+    assert edges[frozenset((TARGET, 'Ahmet Yılmaz'))]['evidence_urls'] == ['https://www.milliyet.com.tr/haber/1']
+    assert 'hurriyet.com.tr' not in {node['id'] for node in loaded['nodes']}
+    assert 'Twitter' in {node['id'] for node in loaded['nodes']}
+
+
+def test_unchanged_results_reproduce_previous_graph():
+    assert graph_sets(incremental(PREVIOUS, PREVIOUS)) == graph_sets(full(PREVIOUS))
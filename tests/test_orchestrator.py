@@ -0,0 +1,38 @@
+import asyncio
+
+from collectors import base_collector
+from collectors.base_collector import BaseCollector
+from collectors.orchestrator import CollectionOrchestrator
+
+
+class PageCollector(BaseCollector):
+    """Verilen sayfaları _fetch ile isteyen, hataları yutan collector"""
+
+    def __init__(self, urls):
+        super().__init__()
+        self.urls = urls
+
+    async def collect(self, target):
+        pages = []
+        for url in self.urls:
+            status, html = await self._fetch(url, 'news')
+            if status == 200:
+                pages.append(html)
+        return {'articles': pages}
+
+
+def test_collector_without_successful_requests_is_reported_as_error(monkeypatch):
+    cached = {'https://example.com/var': {'text': '<html></html>'}}
+    monkeypatch.setattr(base_collector.http_cache, 'cache_only', True)
+    monkeypatch.setattr(base_collector.http_cache, 'get', cached.get)
+
+    orchestrator = CollectionOrchestrator(default_timeout=5)
+    orchestrator.register('empty', PageCollector(['https://example.com/yok']))
+    orchestrator.register('partial', PageCollector(['https://example.com/yok', 'https://example.com/var']))
+    orchestrator.register('offline', PageCollector([]))
+    collection = asyncio.run(orchestrator.collect('hedef'))
+
+    assert collection['status']['empty']['status'] == 'error'
+    assert collection['status']['partial']['status'] == 'ok'
+    assert collection['status']['offline']['status'] == 'ok'
+    assert set(collection['results']) == {'partial', 'offline'}
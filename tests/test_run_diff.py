@@ -0,0 +1,79 @@
+from analyzers.run_diff import diff_entities, diff_results
+
+PREVIOUS = {
+    'news': {'articles': [
+        {'url': 'https://www.milliyet.com.tr/haber/1', 'title': 'Görüşme', 'content': 'Ahmet Yılmaz görüştü.'},
+        {'url': 'https://www.hurriyet.com.tr/haber/2', 'title': 'Açıklama', 'content': 'Mehmet Demir konuştu.'},
+        {'url': 'https://www.sabah.com.tr/haber/3', 'title': 'Toplantı', 'content': 'Toplantı yapıldı.'}
+    ]},
+    'social': {'platform_data': {'twitter': [
+        {'url': 'https://twitter.com/ornek/status/1', 'description': '@ornek_hesap paylaşımı'}
+    ]}}
+}
+
+CURRENT = {
+    'news': {'articles': [
+        # Sadece izleme parametresi ve biçim farkı: değişmemiş sayılır
+        {'url': 'https://www.milliyet.com.tr/haber/1?utm_source=twitter', 'title': 'Görüşme',
+         'content': 'Ahmet  Yılmaz görüştü!'},
+        # İçerik değişti
+        {'url': 'https://www.hurriyet.com.tr/haber/2', 'title': 'Açıklama',
+         'content': 'Mehmet Demir ve Ayşe Kaya konuştu.'},
+        # Yeni
+        {'url': 'https://www.sozcu.com.tr/haber/4', 'title': 'Yeni', 'content': 'Yeni haber.'}
+    ]},
+    'social': {'platform_data': {'twitter': [
+        {'url': 'https://twitter.com/ornek/status/1', 'description': '@ornek_hesap paylaşımı'}
+    ]}}
+}
+
+
+def urls(section_data):
+    return [article['url'] for article in section_data['articles']]
+
+
+def test_added_changed_and_removed_items():
+    diff = diff_results(PREVIOUS, CURRENT)
+
+    assert diff['counts']['news'] == {'added': 1, 'changed': 1, 'removed': 1}
+    assert diff['counts']['social'] == {'added': 0, 'changed': 0, 'removed': 0}
+    assert urls(diff['added']['news']) == ['https://www.hurriyet.com.tr/haber/2',
+                                           'https://www.sozcu.com.tr/haber/4']
+    assert urls(diff['removed']['news']) == ['https://www.sabah.com.tr/haber/3']
+    assert diff['removed_urls'] == ['https://www.sabah.com.tr/haber/3']
+    assert diff['added']['social']['platform_data'] == {'twitter': []}
+    assert not diff['unchanged']
+
+
+def test_unchanged_results():
+    diff = diff_results(PREVIOUS, PREVIOUS)
+
+    assert diff['unchanged']
+    assert diff['removed_urls'] == []
+    assert all(not any(counts.values()) for counts in diff['counts'].values())
+
+
+def test_items_without_url_are_keyed_by_text():
+    previous = {'search': {'articles': [{'title': 'Başlık', 'content': 'Metin burada.'}]}}
+    current = {'search': {'articles': [{'title': 'Başlık', 'content': 'metin burada'}]}}
+
+    assert diff_results(previous, current)['unchanged']
+    assert diff_results({}, current)['counts']['search']['added'] == 1
+
+
+def test_diff_entities():
+    previous = {
+        'nodes': [{'id': 'Hedef'}, {'id': 'A'}, {'id': 'B'}],
+        'edges': [{'source': 'Hedef', 'target': 'A'}, {'source': 'Hedef', 'target': 'B'}]
+    }
+    current = {
+        'nodes': [{'id': 'Hedef'}, {'id': 'A'}, {'id': 'C'}],
+        'edges': [{'source': 'A', 'target': 'Hedef'}, {'source': 'Hedef', 'target': 'C'}]
+    }
+    changes = diff_entities(previous, current)
+
+    assert changes['added_nodes'] == [{'id': 'C'}]
+    assert changes['removed_nodes'] == [{'id': 'B'}]
+    assert changes['added_edges'] == [('C', 'Hedef')]
+    assert changes['removed_edges'] == [('B', 'Hedef')]
+    assert diff_entities(None, current)['added_nodes'] == current['nodes']
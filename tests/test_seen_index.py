@@ -0,0 +1,32 @@
+from collectors.seen_index import SeenIndex
+
+
+def test_survives_save_and_load(tmp_path):
+    path = str(tmp_path / 'seen.bloom')
+    index = SeenIndex(path=path, capacity=1000)
+    assert index.mark('Hedef', ['https://www.example.com/a/', 'https://example.com/b']) == 2
+    index.save()
+
+    reloaded = SeenIndex(path=path, capacity=1000)
+    assert len(reloaded) == 2
+    # Kanonik biçim ve hedef adı büyük/küçük harfinden bağımsız
+    assert reloaded.contains('hedef', 'http://example.com/a')
+    assert reloaded.contains('Hedef', 'https://example.com/b')
+    assert not reloaded.contains('Başka Hedef', 'https://example.com/a')
+    assert not reloaded.contains('Hedef', 'https://example.com/c')
+
+
+def test_filter_new_does_not_mark(tmp_path):
+    index = SeenIndex(path=str(tmp_path / 'seen.bloom'), capacity=1000)
+    index.mark('Hedef', ['https://example.com/a'])
+    items = [{'url': 'https://example.com/a'}, {'url': 'https://example.com/b'}, {'title': 'url yok'}]
+
+    assert index.filter_new('Hedef', items) == items[1:]
+    assert index.filter_new('Hedef', items) == items[1:]
+    assert len(index) == 1
+
+
+def test_unsaved_marks_are_not_persisted(tmp_path):
+    path = str(tmp_path / 'seen.bloom')
+    SeenIndex(path=path, capacity=1000).mark('Hedef', ['https://example.com/a'])
+    assert not SeenIndex(path=path, capacity=1000).contains('Hedef', 'https://example.com/a')
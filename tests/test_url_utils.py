@@ -0,0 +1,49 @@
+import pytest
+
+from collectors.url_utils import canonicalize_url
+
+CASES = [
+    ('http://www.Example.com:80/Haber/?utm_source=x&b=2&a=1#yorum', 'https://example.com/Haber?a=1&b=2'),
+    ('example.com//a//b/', 'https://example.com/a/b'),
+    ('https://example.com/%7euser/%e2%82%ac', 'https://example.com/~user/%E2%82%AC'),
+    ('https://example.com/şehir haber', 'https://example.com/%C5%9Fehir%20haber'),
+    ('https://twitter.com/kullanici/status/1?s=20&t=abc', 'https://twitter.com/kullanici/status/1'),
+    ('https://example.com/ara?s=20', 'https://example.com/ara?s=20'),
+    ('https://[::1]:8080/x', 'https://[::1]:8080/x'),
+    ('http://[2001:db8::1]/x/', 'https://[2001:db8::1]/x'),
+]
+
+
+@pytest.mark.parametrize('url, expected', CASES)
+def test_canonical_form(url, expected):
+    assert canonicalize_url(url) == expected
+
+
+@pytest.mark.parametrize('url', [url for url, _ in CASES] + [
+    'https://example.com/a%2Fb?q=a%26b&r=%2f',
+    'https://example.com/100%',
+])
+def test_canonicalization_is_idempotent(url):
+    canonical = canonicalize_url(url)
+    assert canonicalize_url(canonical) == canonical
+
+
+def test_reserved_escapes_are_kept_distinct():
+    assert canonicalize_url('https://example.com/a%2Fb') != canonicalize_url('https://example.com/a/b')
+    assert canonicalize_url('https://example.com/?q=a%26b') != canonicalize_url('https://example.com/?q=a&b')
+    assert canonicalize_url('https://example.com/a%2fb') == 'https://example.com/a%2Fb'
+
+
+@pytest.mark.parametrize('url', [
+    'http://[abc/x',
+    'mailto:a@b.com',
+    'javascript:void(0)',
+    'ftp://example.com/dosya',
+])
+def test_malformed_and_non_http_urls_are_returned_unchanged(url):
+    assert canonicalize_url(f'  {url} ') == url
+
+
+def test_host_with_port_is_not_taken_for_a_scheme():
+    assert canonicalize_url('example.com:8080/a/') == 'https://example.com:8080/a'
+    assert canonicalize_url('https:example.com/a') == 'https://example.com/a'
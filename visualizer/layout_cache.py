@@ -0,0 +1,149 @@
+# visualizer/layout_cache.py
+import hashlib
+from collections import OrderedDict
+from typing import Dict, Optional
+
+import networkx as nx
+import numpy as np
+
+
+def graph_fingerprint(G: nx.Graph) -> str:
+    """Düğüm ve kenar kümesinden sıralamadan bağımsız özet üret"""
+    digest = hashlib.sha1()
+    for node in sorted(map(repr, G.nodes())):
+        digest.update(node.encode('utf-8'))
+        digest.update(b'\0')
+    digest.update(b'\1')
+    for edge in sorted(repr(tuple(sorted((repr(u), repr(v))))) for u, v in G.edges()):
+        digest.update(edge.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def force_layout(G: nx.Graph, pos: Optional[Dict] = None, iterations: int = 50,
+                 temperature: float = 0.1, grid_size: int = 64, seed: int = 0) -> Dict:
+    """Büyük graflar için yaklaşık Fruchterman-Reingold yerleşimi (numpy).
+
+    İtme kuvveti düğüm yoğunluğunun ızgaraya dağıtılıp k²/r çekirdeğiyle FFT
+    üzerinden evriştirilmesiyle (parçacık-ağ yöntemi) hesaplanır; çekim
+    kuvveti kenarlar üzerinde vektörel toplanır. Bir tur O(n + m + G² log G)
+    sürer. pos verilirse oradan devam edilir, eksik düğümler rastgele yerleşir.
+    """
+    nodes = list(G.nodes())
+    n = len(nodes)
+    if n == 0:
+        return {}
+    rng = np.random.default_rng(seed)
+
+    coords = rng.random((n, 2))
+    if pos:
+        for i, node in enumerate(nodes):
+            if node in pos:
+                coords[i] = pos[node]
+    if n == 1:
+        return {nodes[0]: np.zeros(2)}
+
+    index = {node: i for i, node in enumerate(nodes)}
+    edges = np.array([(index[u], index[v]) for u, v in G.edges() if u != v], dtype=np.int64).reshape(-1, 2)
+
+    # Izgara hücre ofsetleri (doğrusal evrişim için 2G boyut)
+    size = 2 * grid_size
+    offsets = np.fft.fftfreq(size, 1.0 / size)
+    ox, oy = np.meshgrid(offsets, offsets, indexing='ij')
+    r2 = ox ** 2 + oy ** 2
+    r2[0, 0] = np.inf
+
+    for step in range(iterations):
+        low = coords.min(axis=0)
+        span = max(float((coords.max(axis=0) - low).max()), 1e-9)
+        cell = span / (grid_size - 1)
+        k = span / np.sqrt(n)
+
+        # İtme: yoğunluk * (k² r / |r|²)
+        cells = np.minimum(((coords - low) / cell).astype(np.int64), grid_size - 1)
+        density = np.zeros((size, size))
+        np.add.at(density, (cells[:, 0], cells[:, 1]), 1.0)
+        density_fft = np.fft.rfft2(density)
+        kx = np.fft.rfft2(k ** 2 * ox * cell / (r2 * cell ** 2))
+        ky = np.fft.rfft2(k ** 2 * oy * cell / (r2 * cell ** 2))
+        field_x = np.fft.irfft2(density_fft * kx, s=(size, size))
+        field_y = np.fft.irfft2(density_fft * ky, s=(size, size))
+        force = np.stack([field_x[cells[:, 0], cells[:, 1]], field_y[cells[:, 0], cells[:, 1]]], axis=1)
+
+        # Çekim: |d|² / k, kenar boyunca
+        if len(edges):
+            delta = coords[edges[:, 1]] - coords[edges[:, 0]]
+            pull = delta * (np.linalg.norm(delta, axis=1, keepdims=True) / k)
+            for axis in range(2):
+                force[:, axis] += np.bincount(edges[:, 0], pull[:, axis], minlength=n)
+                force[:, axis] -= np.bincount(edges[:, 1], pull[:, axis], minlength=n)
+
+        # Sıcaklıkla sınırlı adım
+        limit = temperature * span * (1 - step / iterations)
+        length = np.maximum(np.linalg.norm(force, axis=1, keepdims=True), 1e-12)
+        coords += force / length * np.minimum(length, limit)
+
+    coords = nx.rescale_layout(coords - coords.mean(axis=0))
+    return dict(zip(nodes, coords))
+
+
+class LayoutCache:
+    """Graf parmak izine göre önbelleklenen, önceki konumlardan ısınan yerleşim servisi.
+
+    Aynı graf tekrar çizildiğinde konumlar önbellekten döner. Graf değiştiyse
+    mevcut düğümler son konumlarından, yeni düğümler komşularının ortalamasından
+    başlar ve daha az turla yerleşim güncellenir; böylece resim zıplamaz.
+    large_threshold üzerindeki graflarda force_layout kullanılır.
+    """
+
+    def __init__(self, max_entries: int = 32, large_threshold: int = 500,
+                 iterations: int = 50, warm_iterations: int = 15):
+        self.max_entries = max_entries
+        self.large_threshold = large_threshold
+        self.iterations = iterations
+        self.warm_iterations = warm_iterations
+        self._cache: "OrderedDict[str, Dict]" = OrderedDict()
+        self._last: Dict = {}
+
+    def layout(self, G: nx.Graph) -> Dict:
+        fingerprint = graph_fingerprint(G)
+        cached = self._cache.get(fingerprint)
+        if cached is not None:
+            self._cache.move_to_end(fingerprint)
+            self._last = cached
+            return cached
+
+        initial = self._initial_positions(G)
+        warm = bool(initial)
+        iterations = self.warm_iterations if warm else self.iterations
+
+        if G.number_of_nodes() > self.large_threshold:
+            pos = force_layout(G, pos=initial, iterations=iterations,
+                               temperature=0.02 if warm else 0.1)
+        else:
+            pos = nx.spring_layout(G, k=1, pos=initial or None, iterations=iterations, seed=0)
+
+        self._cache[fingerprint] = pos
+        if len(self._cache) > self.max_entries:
+            self._cache.popitem(last=False)
+        self._last = pos
+        return pos
+
+    def _initial_positions(self, G: nx.Graph) -> Dict:
+        known = {node: self._last[node] for node in G.nodes() if node in self._last}
+        if not known:
+            return {}
+
+        # Yeni düğümler yerleşik komşularının yakınına konur
+        rng = np.random.default_rng(0)
+        initial = dict(known)
+        pending = [node for node in G.nodes() if node not in known]
+        for node in pending:
+            anchors = [initial[neighbor] for neighbor in G.neighbors(node) if neighbor in initial]
+            center = np.mean(anchors, axis=0) if anchors else np.zeros(2)
+            initial[node] = center + rng.normal(scale=0.05, size=2)
+        return initial
+
+    def clear(self):
+        self._cache.clear()
+        self._last = {}
@@ -1,19 +1,48 @@
 # visualizer/network_visualizer.py
 
 import networkx as nx
+import numpy as np
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 from typing import Dict
 import logging
 
+from .layout_cache import LayoutCache
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Lejantta görünen düğüm tipleri (sıra korunur)
+NODE_TYPE_LABELS = {
+    'target': ('Hedef', '#FF6B6B'),
+    'person': ('İlişkili Kişiler', '#FF6B6B'),
+    'platform': ('Sosyal Medya', '#4ECDC4'),
+    'news': ('Haber Kaynakları', '#2ecc71'),
+    'account': ('Hesaplar', '#95a5a6'),
+    'group': ('Gruplar', '#95a5a6')
+}
+
+# Bu düğüm sayısının üstünde ayrıntı seviyesi (LOD) moduna geçilir
+LOD_NODE_THRESHOLD = 500
+
+
 class NetworkVisualizer:
-    def __init__(self):
+    def __init__(self, lod_threshold: int = LOD_NODE_THRESHOLD, max_labels: int = 60,
+                 max_edges: int = 5000, layout_cache: LayoutCache = None):
         self.G = nx.Graph()
+        self.layout_cache = layout_cache or LayoutCache(large_threshold=lod_threshold)
+        self.lod_threshold = lod_threshold
+        self.max_labels = max_labels
+        self.max_edges = max_edges
         
     def visualize(self, data: Dict, figure=None):
-        """Ağı görselleştir"""
+        """Ağı görselleştir.
+
+        Her düğüm tipi tek bir scatter çağrısıyla, tüm kenarlar tek bir
+        LineCollection ile çizilir. Düğüm sayısı lod_threshold'u aşarsa
+        sadece en yüksek dereceli max_labels düğüm etiketlenir, kenarlar
+        max_edges'e kadar örneklenir ve düğümler küçültülür.
+        """
         try:
             if not data or 'nodes' not in data:
                 logger.error("Geçersiz veri formatı")
@@ -21,17 +50,11 @@ class NetworkVisualizer:
                 
             # Graf verilerini oluştur
             self.G.clear()
-            
-            # Düğümleri ekle
-            for node in data['nodes']:
-                self.G.add_node(node['id'],
-                              node_type=node['type'],
-                              color=node['color'],
-                              size=node['size'])
-            
-            # Kenarları ekle
-            for edge in data['edges']:
-                self.G.add_edge(edge['source'], edge['target'])
+            self.G.add_nodes_from(
+                (node['id'], {'node_type': node['type'], 'color': node['color'], 'size': node['size']})
+                for node in data['nodes']
+            )
+            self.G.add_edges_from((edge['source'], edge['target']) for edge in data['edges'])
 
             # Görselleştirme
             if figure is not None:
@@ -42,49 +65,47 @@ class NetworkVisualizer:
                 ax = plt.gca()
             
             # Layout hesapla
-            pos = nx.spring_layout(self.G, k=1, iterations=50)
-            
-            # Düğümleri çiz
-            for node, attr in self.G.nodes(data=True):
-                nx.draw_networkx_nodes(self.G, pos,
-                                     nodelist=[node],
-                                     node_color=[attr['color']],
-                                     node_size=attr['size'] * 50,
-                                     alpha=0.9,
-                                     edgecolors='white',
-                                     linewidths=2,
-                                     ax=ax)
+            nodes = list(self.G.nodes())
+            pos = self._layout()
+            coords = np.array([pos[node] for node in nodes], dtype=float).reshape(-1, 2)
+            index = {node: i for i, node in enumerate(nodes)}
+            lod = len(nodes) > self.lod_threshold
             
-            # Kenarları çiz
-            nx.draw_networkx_edges(self.G, pos,
-                                 edge_color='#cccccc',
-                                 width=1,
-                                 alpha=0.5,
-                                 arrows=False,
-                                 ax=ax)
+            # Kenarları çiz (tek koleksiyon; büyük graflarda örneklenir)
+            edges = np.array([(index[u], index[v]) for u, v in self.G.edges()], dtype=np.int64).reshape(-1, 2)
+            if lod and len(edges) > self.max_edges:
+                keep = np.random.default_rng(0).choice(len(edges), self.max_edges, replace=False)
+                edges = edges[keep]
+            ax.add_collection(LineCollection(coords[edges],
+                                             colors='#cccccc',
+                                             linewidths=0.5 if lod else 1,
+                                             alpha=0.3 if lod else 0.5,
+                                             zorder=1))
             
-            # Etiketleri çiz
-            labels = {node: node for node in self.G.nodes()}
-            nx.draw_networkx_labels(self.G, pos,
-                                  labels,
-                                  font_size=8,
-                                  font_weight='bold',
-                                  font_family='sans-serif',
-                                  ax=ax)
+            # Düğümleri tip başına tek çağrıda çiz; lejant aynı geçişte oluşur
+            attrs = [self.G.nodes[node] for node in nodes]
+            types = np.array([attr['node_type'] for attr in attrs])
+            colors = np.array([attr['color'] for attr in attrs])
+            sizes = np.array([attr['size'] for attr in attrs], dtype=float) * 50
+            if lod:
+                sizes *= max(0.05, (self.lod_threshold / len(nodes)) ** 0.5)
             
-            # Lejant
             legend_elements = []
-            node_types = {
-                'target': ('Hedef', '#FF6B6B'),
-                'person': ('İlişkili Kişiler', '#FF6B6B'),
-                'platform': ('Sosyal Medya', '#4ECDC4'),
-                'news': ('Haber Kaynakları', '#2ecc71'),
-                'account': ('Hesaplar', '#95a5a6'),
-                'group': ('Gruplar', '#95a5a6')
-            }
-            
-            for node_type, (label, color) in node_types.items():
-                if any(attr['node_type'] == node_type for node, attr in self.G.nodes(data=True)):
+            present = set(types.tolist())
+            ordered_types = list(NODE_TYPE_LABELS) + sorted(present - set(NODE_TYPE_LABELS))
+            for node_type in ordered_types:
+                if node_type not in present:
+                    continue
+                mask = types == node_type
+                ax.scatter(coords[mask, 0], coords[mask, 1],
+                           s=sizes[mask],
+                           c=colors[mask],
+                           alpha=0.9,
+                           edgecolors='white',
+                           linewidths=0.5 if lod else 2,
+                           zorder=2)
+                if node_type in NODE_TYPE_LABELS:
+                    label, color = NODE_TYPE_LABELS[node_type]
                     legend_elements.append(plt.Line2D([0], [0],
                                                     marker='o',
                                                     color='w',
@@ -94,6 +115,18 @@ class NetworkVisualizer:
                                                     markeredgecolor='white',
                                                     markeredgewidth=1))
             
+            # Etiketleri çiz (büyük graflarda sadece hedefler ve en yüksek dereceliler)
+            for i in self._label_indices(nodes, types, lod):
+                ax.text(coords[i, 0], coords[i, 1], str(nodes[i]),
+                        fontsize=8,
+                        fontweight='bold',
+                        fontfamily='sans-serif',
+                        ha='center',
+                        va='center',
+                        zorder=3,
+                        clip_on=True)
+            
+            ax.autoscale_view()
             ax.legend(handles=legend_elements,
                      loc='upper left',
                      bbox_to_anchor=(1, 1),
@@ -111,4 +144,16 @@ class NetworkVisualizer:
             
         except Exception as e:
             logger.error(f"Görselleştirme hatası: {str(e)}")
-            raise
\ No newline at end of file
+            raise
+
+    def _layout(self) -> Dict:
+        """Önbellekli, önceki çizimden ısınan yerleşim (bkz. LayoutCache)"""
+        return self.layout_cache.layout(self.G)
+
+    def _label_indices(self, nodes: list, types: np.ndarray, lod: bool) -> np.ndarray:
+        if not lod:
+            return np.arange(len(nodes))
+        degrees = np.array([self.G.degree(node) for node in nodes])
+        top = np.argsort(-degrees, kind='stable')[:self.max_labels]
+        targets = np.flatnonzero(types == 'target')
+        return np.union1d(top, targets)
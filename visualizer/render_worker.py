@@ -0,0 +1,122 @@
+# visualizer/render_worker.py
+import asyncio
+import io
+import json
+import logging
+import multiprocessing
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Dict, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+NetworkInput = Union[Dict, str, bytes]
+
+RENDER_FORMATS = ('png', 'svg')
+
+# İşçi süreç başına görselleştirici; yerleşim önbelleği çizimler arasında korunur
+_visualizer = None
+
+
+def _init_worker():
+    """İşçi süreçte ekransız (Agg) backend'i seç"""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+
+
+def _get_visualizer():
+    global _visualizer
+    if _visualizer is None:
+        from .network_visualizer import NetworkVisualizer
+        _visualizer = NetworkVisualizer()
+    return _visualizer
+
+
+def render_network(network_data: NetworkInput, fmt: str = 'png', size: Tuple[int, int] = (1000, 800),
+                   dpi: int = 100) -> bytes:
+    """network_data'yı (sözlük veya JSON) Agg ile çizip PNG/SVG baytlarını döndür.
+
+    pyplot'un pencere yönetimi kullanılmaz; Tk süreci içinde de güvenle çağrılabilir.
+    size piksel cinsindendir.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    if fmt not in RENDER_FORMATS:
+        raise ValueError(f"Desteklenmeyen format: {fmt} (seçenekler: {', '.join(RENDER_FORMATS)})")
+    if isinstance(network_data, (str, bytes)):
+        network_data = json.loads(network_data)
+
+    figure = Figure(figsize=(size[0] / dpi, size[1] / dpi), dpi=dpi)
+    FigureCanvasAgg(figure)
+    _get_visualizer().visualize(network_data, figure=figure)
+
+    buffer = io.BytesIO()
+    figure.savefig(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def render_to_file(network_data: NetworkInput, path: str, fmt: Optional[str] = None,
+                   size: Tuple[int, int] = (1000, 800), dpi: int = 100) -> str:
+    """Çizimi dosyaya yaz (format verilmezse uzantıdan); yazılan yolu döndür"""
+    fmt = fmt or os.path.splitext(path)[1].lstrip('.').lower() or 'png'
+    image = render_network(network_data, fmt=fmt, size=size, dpi=dpi)
+
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(image)
+    os.replace(tmp_path, path)
+    return path
+
+
+class RenderPool:
+    """Graf çizimlerini ekransız işçi süreçlerde yapan havuz.
+
+    İşçiler 'spawn' ile başlatılır (Tk ve asyncio thread'leri olan süreçten
+    fork edilmez) ve Agg backend'ini kullanır. Aynı grafın ardışık çizimlerinde
+    yerleşim önbelleğinden yararlanmak için arayüz tek işçiyle kullanılabilir.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        self.max_workers = max_workers
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def configure(self, max_workers: Optional[int] = None):
+        """İşçi sayısını değiştir; mevcut havuz kapatılır"""
+        self.shutdown()
+        self.max_workers = max_workers
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                                 mp_context=multiprocessing.get_context('spawn'),
+                                                 initializer=_init_worker)
+            logger.debug(f"Çizim havuzu başlatıldı ({self.max_workers or os.cpu_count()} işçi)")
+        return self._executor
+
+    def submit(self, network_data: NetworkInput, fmt: str = 'png', size: Tuple[int, int] = (1000, 800),
+               dpi: int = 100) -> Future:
+        """Çizimi havuza gönder; Future sonucu görüntü baytlarıdır"""
+        return self._get_executor().submit(render_network, network_data, fmt, size, dpi)
+
+    def submit_file(self, network_data: NetworkInput, path: str, fmt: Optional[str] = None,
+                    size: Tuple[int, int] = (1000, 800), dpi: int = 100) -> Future:
+        """Çizimi havuzda dosyaya yazdır; Future sonucu dosya yoludur"""
+        return self._get_executor().submit(render_to_file, network_data, path, fmt, size, dpi)
+
+    async def render(self, network_data: NetworkInput, **kwargs) -> bytes:
+        return await asyncio.wrap_future(self.submit(network_data, **kwargs))
+
+    async def render_file(self, network_data: NetworkInput, path: str, **kwargs) -> str:
+        return await asyncio.wrap_future(self.submit_file(network_data, path, **kwargs))
+
+    def shutdown(self, wait: bool = True):
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=not wait)
+            self._executor = None
+
+
+render_pool = RenderPool(max_workers=int(os.getenv('OSINT_RENDER_WORKERS', '0')) or None)